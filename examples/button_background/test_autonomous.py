@@ -22,7 +22,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from godot_bridge import GodotProject, GodotRunner, ScreenshotCapture, InputInjector
+from godot_bridge import Frame, GodotProject, GodotRunner, ScreenshotCapture, InputInjector, verify
 
 
 def main():
@@ -47,7 +47,9 @@ def main():
     # Step 1: Run the test scenario
     print("\n🎮 Running test scenario...")
     try:
-        screenshot_before, screenshot_after = run_test(project_path, screenshot_path)
+        frame_before, frame_after, screenshot_before, screenshot_after = run_test(
+            project_path, screenshot_path
+        )
     except Exception as e:
         print(f"\n❌ Test execution failed: {e}")
         import traceback
@@ -56,7 +58,7 @@ def main():
     
     # Step 2: Visual verification (pixel-based for Phase 0)
     print("\n👁️  Verifying screenshots...")
-    result = verify_color_change(screenshot_before, screenshot_after)
+    result = verify_color_change(frame_before, frame_after)
     
     # Results
     print("\n" + "=" * 60)
@@ -72,8 +74,12 @@ def main():
         return 1
 
 
-def run_test(project_path: Path, screenshot_path: Path) -> tuple[Path, Path]:
-    """Run Godot and capture before/after screenshots."""
+def run_test(project_path: Path, screenshot_path: Path) -> tuple[Frame, Frame, Path, Path]:
+    """Run Godot and capture before/after frames.
+
+    PNGs are written in the background for debugging; verification uses
+    the frames in memory.
+    """
     
     # Initialize tools
     runner = GodotRunner()
@@ -98,10 +104,9 @@ def run_test(project_path: Path, screenshot_path: Path) -> tuple[Path, Path]:
     
     # Capture "before" screenshot
     print("   Capturing initial state...")
-    img_before = capture.capture_screen()  # Use full screen for reliability
+    frame_before = capture.grab_screen()  # Use full screen for reliability
     path_before = screenshot_path / "before.png"
-    capture.save_screenshot(img_before, path_before)
-    print(f"   ✓ Saved: {path_before.name}")
+    capture.save_async(frame_before, path_before)
     
     # Click the button (center of Button node: 540+100, 320+25)
     button_x = 640
@@ -114,32 +119,26 @@ def run_test(project_path: Path, screenshot_path: Path) -> tuple[Path, Path]:
     
     # Capture "after" screenshot
     print("   Capturing after click...")
-    img_after = capture.capture_screen()
+    frame_after = capture.grab_screen()
     path_after = screenshot_path / "after.png"
-    capture.save_screenshot(img_after, path_after)
-    print(f"   ✓ Saved: {path_after.name}")
+    capture.save_async(frame_after, path_after)
     
     # Stop Godot
     print("   Stopping Godot...")
     result = runner.stop()
     print(f"   ✓ Exit code: {result['returncode']}")
     
-    # Cleanup
+    # Cleanup (waits for the PNG writes)
     capture.close()
     
-    return path_before, path_after
+    return frame_before, frame_after, path_before, path_after
 
 
-def verify_color_change(before: Path, after: Path) -> bool:
+def verify_color_change(before: Frame, after: Frame) -> bool:
     """Verify that background color changed between screenshots.
     
     Phase 0 uses simple pixel comparison. Future phases will use VLM.
     """
-    from PIL import Image
-    
-    img_before = Image.open(before)
-    img_after = Image.open(after)
-    
     # Sample pixels from center-left area (background, not UI)
     # Use multiple samples for robustness
     samples = [
@@ -148,17 +147,10 @@ def verify_color_change(before: Path, after: Path) -> bool:
         (320, 480),  # Lower left quadrant
     ]
     
-    total_difference = 0
     for x, y in samples:
-        color_before = img_before.getpixel((x, y))
-        color_after = img_after.getpixel((x, y))
-        
-        # Calculate RGB difference
-        diff = sum(abs(a - b) for a, b in zip(color_before[:3], color_after[:3]))
-        total_difference += diff
-        print(f"   Pixel ({x},{y}): {color_before} → {color_after} (diff: {diff})")
-    
-    avg_difference = total_difference / len(samples)
+        print(f"   Pixel ({x},{y}): {before.pixel(x, y)} → {after.pixel(x, y)}")
+    
+    avg_difference = verify.sample_diff(before, after, samples)
     print(f"   Average difference: {avg_difference:.1f}")
     
     # Threshold: significant color change should be > 50 per channel average
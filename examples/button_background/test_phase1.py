@@ -2,25 +2,25 @@
 """
 Phase 1 Test: Button That Changes Background (Interactive)
 
-Tests full autonomous loop with input injection via xdotool.
-Works without tkinter/PyAutoGUI.
+Tests full autonomous loop with input injection via X11 (python-xlib,
+falling back to xdotool). Works without tkinter/PyAutoGUI.
 
 This proves:
 1. Godot starts with display
-2. Button click via xdotool
+2. Button click via X11 input
 3. Screenshot before/after
 4. Color change verification
 """
 
 import sys
-import subprocess
 import time
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from godot_bridge import GodotProject, GodotRunner, ScreenshotCapture
+from godot_bridge import Frame, GodotProject, GodotRunner, ScreenshotCapture, verify
+from godot_bridge.window import get_window_backend
 
 
 def main():
@@ -68,13 +68,12 @@ def main():
     
     # Capture "before"
     print("   Capturing BEFORE screenshot...")
-    img_before = capture.capture_screen()
+    frame_before = capture.grab_screen()
     path_before = screenshot_path / "phase1_before.png"
-    capture.save_screenshot(img_before, path_before)
-    print(f"   ✓ Saved: {path_before.name}")
+    capture.save_async(frame_before, path_before)  # PNG encode off the critical path
     
-    # Click button via xdotool (relative to window or screen coordinates)
-    print("   Clicking button via xdotool...")
+    # Click button (relative to window or screen coordinates)
+    print(f"   Clicking button via {get_window_backend().name}...")
     # Try to find window and click relative to it
     click_result = click_in_window("Button Background Test", 640, 345)
     if not click_result:
@@ -90,10 +89,9 @@ def main():
     
     # Capture "after"
     print("   Capturing AFTER screenshot...")
-    img_after = capture.capture_screen()
+    frame_after = capture.grab_screen()
     path_after = screenshot_path / "phase1_after.png"
-    capture.save_screenshot(img_after, path_after)
-    print(f"   ✓ Saved: {path_after.name}")
+    capture.save_async(frame_after, path_after)
     
     # Stop Godot
     print("   Stopping Godot...")
@@ -102,7 +100,7 @@ def main():
     
     # Verify
     print("\n👁️  Verifying color change...")
-    passed = verify_color_change(path_before, path_after)
+    passed = verify_color_change(frame_before, frame_after)
     
     # Results
     print("\n" + "=" * 60)
@@ -110,7 +108,7 @@ def main():
         print("✅ PHASE 1 PASSED")
         print("\nFull autonomous loop working:")
         print("  ✓ Godot starts with display")
-        print("  ✓ Input injection (xdotool)")
+        print("  ✓ Input injection (X11)")
         print("  ✓ Before/after screenshots")
         print("  ✓ Color change verified")
     else:
@@ -128,26 +126,11 @@ def main():
 def focus_window(title_substring: str) -> bool:
     """Focus window by title substring."""
     try:
-        # Find window ID
-        result = subprocess.run(
-            ["xdotool", "search", "--name", title_substring],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode != 0 or not result.stdout.strip():
+        windows = get_window_backend()
+        window_ids = windows.search(title_substring)
+        if not window_ids:
             return False
-        
-        window_id = result.stdout.strip().split("\n")[0]
-        
-        # Activate/focus window
-        subprocess.run(
-            ["xdotool", "windowactivate", window_id],
-            check=True,
-            timeout=5,
-            capture_output=True
-        )
-        return True
+        return windows.activate(window_ids[0])
     except Exception as e:
         print(f"   Focus failed: {e}")
         return False
@@ -156,91 +139,42 @@ def focus_window(title_substring: str) -> bool:
 def click_in_window(title_substring: str, x: int, y: int) -> bool:
     """Click at coordinates relative to window."""
     try:
-        # Find window ID
-        result = subprocess.run(
-            ["xdotool", "search", "--name", title_substring],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode != 0 or not result.stdout.strip():
+        windows = get_window_backend()
+        geometry = windows.find_window(title_substring)
+        if geometry is None:
             return False
-        
-        window_id = result.stdout.strip().split("\n")[0]
-        
-        # Get window geometry
-        geo_result = subprocess.run(
-            ["xdotool", "getwindowgeometry", window_id],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        # Parse position from output
-        # Format: Window 1234567
-        #   Position: 100,200 (screen: 0)
-        win_x, win_y = 0, 0
-        for line in geo_result.stdout.split("\n"):
-            if "Position:" in line:
-                # Extract "100,200" part
-                pos_part = line.split("Position:")[1].split("(")[0].strip()
-                coords = pos_part.split(",")
-                win_x = int(coords[0])
-                win_y = int(coords[1])
-                break
-        
+
         # Click at absolute position (window pos + relative pos)
-        abs_x = win_x + x
-        abs_y = win_y + y
-        
-        print(f"   Window at ({win_x}, {win_y}), clicking at ({abs_x}, {abs_y})")
-        
-        subprocess.run(
-            ["xdotool", "mousemove", str(abs_x), str(abs_y), "click", "1"],
-            check=True,
-            timeout=5,
-            capture_output=True
-        )
-        return True
+        abs_x = geometry.left + x
+        abs_y = geometry.top + y
+
+        print(f"   Window at ({geometry.left}, {geometry.top}), clicking at ({abs_x}, {abs_y})")
+        return windows.click(abs_x, abs_y)
     except Exception as e:
         print(f"   Window click failed: {e}")
         return False
 
 
 def click_at(x: int, y: int) -> bool:
-    """Click at absolute screen coordinates using xdotool."""
+    """Click at absolute screen coordinates."""
     try:
-        subprocess.run(
-            ["xdotool", "mousemove", str(x), str(y), "click", "1"],
-            check=True,
-            timeout=5,
-            capture_output=True
-        )
-        return True
+        return get_window_backend().click(x, y)
     except Exception as e:
         print(f"   Absolute click failed: {e}")
         return False
 
 
-def verify_color_change(before: Path, after: Path) -> bool:
-    """Verify background color changed."""
-    from PIL import Image
-    
-    img_before = Image.open(before)
-    img_after = Image.open(after)
-    
+def verify_color_change(before: Frame, after: Frame) -> bool:
+    """Verify background color changed (reads the captured frames directly)."""
     # Sample from left side (background, not UI)
     samples = [(200, 360), (320, 240), (320, 480)]
     
-    total_diff = 0
     for x, y in samples:
-        color_before = img_before.getpixel((x, y))
-        color_after = img_after.getpixel((x, y))
-        diff = sum(abs(a - b) for a, b in zip(color_before[:3], color_after[:3]))
-        total_diff += diff
-        print(f"   Pixel ({x},{y}): {color_before} → {color_after} (diff: {diff})")
+        color_before = before.pixel(x, y)
+        color_after = after.pixel(x, y)
+        print(f"   Pixel ({x},{y}): {color_before} → {color_after}")
     
-    avg_diff = total_diff / len(samples)
+    avg_diff = verify.sample_diff(before, after, samples)
     print(f"   Average difference: {avg_diff:.1f}")
     
     return avg_diff > 100
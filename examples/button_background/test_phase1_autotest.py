@@ -13,7 +13,6 @@ This proves:
 """
 
 import sys
-import time
 from pathlib import Path
 
 # Add src to path
@@ -57,9 +56,10 @@ def main():
     print("   (GDScript will auto-click button after 2 seconds)")
     process = runner.run_with_display(project, "main_auto_test.tscn")
     
-    # Wait for test to complete
-    print("   Waiting for auto-test (6s)...")
-    time.sleep(6)
+    # Wait for the auto-test verdict instead of a fixed sleep
+    print("   Waiting for auto-test verdict...")
+    waited = runner.run_until(r"AUTO-TEST (PASSED|FAILED)", timeout=15)
+    print(f"   Finished waiting ({waited.reason}) after {waited.elapsed:.1f}s")
     
     # Capture result
     print("   Capturing result screenshot...")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Phase 1 Test: Button That Changes Background (Headless, In-Engine Input)
+
+Clicks the button by injecting InputEvents into the running scene through
+the warm driver, so no display, window focus or screen coordinates are
+involved and every run clicks on the same frame.
+
+This proves:
+1. Warm driver boots headless
+2. Click is injected at a fixed frame via Input.parse_input_event
+3. Button handler runs (checked from the scene's output)
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from godot_bridge import BridgeInput, GodotProject, WarmGodotRunner
+
+
+def main():
+    print("=" * 60)
+    print("OpenClaw-Godot: Phase 1 - Headless Input Test")
+    print("=" * 60)
+
+    repo_root = Path(__file__).parent.parent.parent
+    project_path = repo_root / "godot" / "button_background"
+    print(f"\n📁 Project: {project_path}")
+
+    runner = WarmGodotRunner()
+    if not runner.verify_godot():
+        print("❌ Godot not found")
+        return 1
+
+    project = GodotProject(project_path)
+    print(f"✓ {project.name}")
+
+    print("\n🎮 Booting warm driver (headless)...")
+    runner.start(project)
+
+    try:
+        # Click the button (viewport coordinates) on frame 10 of the run
+        clicks = BridgeInput.recorder(fps=runner.fixed_fps)
+        clicks.wait_frames(10)
+        clicks.click(640, 345)
+
+        print("   Running main.tscn for 30 frames with a click on frame 10...")
+        result = runner.run_scene("main.tscn", frames=30, input=clicks)
+    finally:
+        runner.stop()
+
+    for line in result.get("stdout", []):
+        print(f"   {line}")
+
+    passed = any("Background changed to RED" in line for line in result.get("stdout", []))
+
+    print("\n" + "=" * 60)
+    if passed:
+        print("✅ PHASE 1 (HEADLESS) PASSED")
+        print("  ✓ Click injected in-engine")
+        print("  ✓ Background changed to RED")
+    else:
+        print("❌ PHASE 1 (HEADLESS) FAILED")
+        print(f"  Run result: {result.get('error', 'no color change logged')}")
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,7 +16,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from godot_bridge import GodotProject, GodotRunner
+from godot_bridge import GodotProject, GodotRunner, LogAssertions, LogParser
 
 
 def main():
@@ -39,13 +39,26 @@ def main():
     project = GodotProject(project_path)
     print(f"✓ Project: {project.name}")
     
+    # Every check is one pattern in a single streaming matcher; a script
+    # error fails the run as soon as it is printed
+    checks = LogAssertions()
+    checks.expect("TEST_START", "TEST_START", stream="stdout")
+    checks.expect("INFO message", "INFO: Scene loaded", stream="stdout")
+    checks.expect("DEBUG message", "DEBUG: Player position", stream="stdout")
+    checks.expect("WARNING message", "This is a test warning", stream="stderr")
+    checks.expect("ERROR message", "This is a test error", stream="stderr")
+    checks.expect("LOOP iterations", "LOOP: Iteration", count=3, stream="stdout")
+    checks.expect("TEST_COMPLETE", "TEST_COMPLETE", stream="stdout")
+    checks.forbid_errors(script_only=True)
+    
     # Run headless and capture ALL output
     print("\n🎮 Running test (capturing logs)...")
     runner.run_headless(project, quit_after=120, fixed_fps=30)
     
-    # Wait for completion
-    import time
-    time.sleep(5)
+    # Returns once every expectation has matched (or on a script error,
+    # exit or timeout) instead of waiting for a fixed sleep
+    outcome = checks.run(runner, timeout=30)
+    print(f"   Finished checking ({outcome.reason}) after {outcome.elapsed:.1f}s")
     
     result = runner.stop()
     
@@ -53,41 +66,36 @@ def main():
     print("CAPTURED OUTPUT:")
     print("=" * 60)
     
-    # Combine stdout and stderr from result
+    # Parse the run's interleaved output into typed, indexed records
+    logs = LogParser()
+    logs.update(runner)
     all_output = "\n".join(result.get("stdout", []) + result.get("stderr", []))
     
     print(f"\nStdout lines: {len(result.get('stdout', []))}")
     print(f"Stderr lines: {len(result.get('stderr', []))}")
-    
-    # Check for expected content in combined output
-    checks = {
-        "TEST_START": "TEST_START" in all_output,
-        "INFO message": "INFO: Scene loaded" in all_output,
-        "DEBUG message": "DEBUG: Player position" in all_output,
-        "WARNING message": "WARNING: This is a test warning" in all_output,
-        "ERROR message": "ERROR: This is a test error" in all_output,
-        "LOOP iterations": all_output.count("LOOP: Iteration") >= 3,
-        "TEST_COMPLETE": "TEST_COMPLETE" in all_output,
-    }
-    
-    passed_count = sum(checks.values())
-    total = len(checks)
-    
+    print(f"Records: {logs.summary()}")
     print(f"\nCombined Output:\n{all_output}\n")
     
     print("Verification:")
-    for check, passed in checks.items():
-        status = "✅" if passed else "❌"
-        print(f"  {status} {check}")
+    for name, spec in checks.specs.items():
+        if spec.forbidden:
+            continue
+        seen = outcome.first_match(name)
+        status = "✅" if name not in outcome.missing else "❌"
+        timing = f" (first seen at {seen:.2f}s)" if seen is not None else ""
+        print(f"  {status} {name}{timing}")
+    for hit in outcome.violations:
+        print(f"  ❌ Forbidden {hit.name}: {hit.line.text}")
     
     print(f"\nExit code: {result['returncode']}")
     
     print("\n" + "=" * 60)
-    if passed_count == total:
+    total = sum(not spec.forbidden for spec in checks.specs.values())
+    if outcome.passed:
         print(f"✅ PASS: All {total} log checks passed")
         return 0
     else:
-        print(f"❌ FAIL: {passed_count}/{total} checks passed")
+        print(f"❌ FAIL: {total - len(outcome.missing)}/{total} checks passed")
         return 1
 
 
@@ -16,7 +16,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from godot_bridge import GodotProject, GodotRunner
+from godot_bridge import GodotProject, GodotRunner, LogAssertions, LogParser
 
 
 def main():
@@ -39,13 +39,22 @@ def main():
     project = GodotProject(project_path)
     print(f"✓ Project: {project.name}")
     
+    # Expected debug output, matched while the run streams in
+    checks = LogAssertions()
+    checks.expect("Test started", "DEBUGGER_TEST: Starting", stream="stdout")
+    checks.expect("Null node check", "Null node check passed", stream="stdout")
+    checks.expect("Node operations", "Created and queued 10 nodes", stream="stdout")
+    checks.expect("Loop operations", "Updated label 100 times", stream="stdout")
+    checks.expect("Test completed", "DEBUGGER_TEST: Test completed", stream="stdout")
+    checks.expect("Godot version", "Godot Engine v4.", stream="stdout")
+    
     # Run with --debug flag to enable debugger output
     print("\n🎮 Running with debug output enabled...")
     runner.run_headless(project, quit_after=120, fixed_fps=30)
     
-    # Wait for completion
-    import time
-    time.sleep(5)
+    # Returns as soon as every expected line has been seen
+    outcome = checks.run(runner, timeout=30)
+    print(f"   Finished checking ({outcome.reason}) after {outcome.elapsed:.1f}s")
     
     result = runner.stop()
     
@@ -53,37 +62,35 @@ def main():
     print("CAPTURED OUTPUT:")
     print("=" * 60)
     
-    # Combine stdout and stderr from result
+    # Parse the run's interleaved output into typed, indexed records
+    logs = LogParser()
+    logs.update(runner)
     all_output = "\n".join(result.get("stdout", []) + result.get("stderr", []))
     
     print(f"\nStdout lines: {len(result.get('stdout', []))}")
     print(f"Stderr lines: {len(result.get('stderr', []))}")
     print(f"\n{all_output}\n")
     
-    # Check for expected patterns in debug output
-    checks = {
-        "Test started": "DEBUGGER_TEST: Starting" in all_output,
-        "Null node check": "Null node check passed" in all_output,
-        "Node operations": "Created and queued 10 nodes" in all_output,
-        "Loop operations": "Updated label 100 times" in all_output,
-        "Test completed": "DEBUGGER_TEST: Test completed" in all_output,
-        "Godot version": "Godot Engine v4." in all_output,
-    }
-    
-    # Check for any warnings or errors (these show debugger is active)
-    has_warnings = "WARNING:" in all_output.upper() or "WARN:" in all_output.upper()
-    has_errors = "ERROR:" in all_output.upper() and "test error" not in all_output.lower()
+    # Any warnings or errors show the debugger is active
+    warnings = logs.warnings()
+    errors = [record for record in logs.errors() if "test error" not in record.message.lower()]
+    has_warnings = bool(warnings)
+    has_errors = bool(errors)
     
-    passed_count = sum(checks.values())
-    total = len(checks)
+    total = len(checks.specs)
+    passed_count = total - len(outcome.missing)
     
     print("Verification:")
-    for check, passed in checks.items():
-        status = "✅" if passed else "❌"
-        print(f"  {status} {check}")
+    for name in checks.specs:
+        seen = outcome.first_match(name)
+        status = "✅" if seen is not None else "❌"
+        timing = f" (first seen at {seen:.2f}s)" if seen is not None else ""
+        print(f"  {status} {name}{timing}")
     
     print(f"\n  ⚠️  Warnings detected: {has_warnings}")
     print(f"  ❌ Errors detected: {has_errors}")
+    for record in errors:
+        print(f"     {record.level} {record.location}: {record.message}")
     
     print(f"\nExit code: {result['returncode']}")
     
@@ -2,15 +2,70 @@
 
 __version__ = "0.1.0"
 
-from .capture import ScreenshotCapture
-from .godot import GodotProject, GodotRunner
+from .aio import AsyncGodotRunner
+from .archive import ArchiveWriter, LogArchive, archive_runner
+from .assertions import AssertionResult, LogAssertions, PatternHit
+from .bridge import BridgeClient, BridgeError, BridgeImage, LogPage
+from .capture import (
+    CaptureStream,
+    Frame,
+    HashEntry,
+    ScreenshotCapture,
+    ScreenshotStore,
+    ScreenshotWriter,
+)
+from .events import BridgeInput
+from .godot import GodotProject, GodotRunner, OutputLine, WaitResult
+from .logs import LogParser, LogRecord, LogSubscription, StackFrame
+from .match import Match, TemplateMatcher
+from .pool import GodotRunnerPool, JobResult, JobSpec
+from .scene import MirrorNode, NodePage, NodeRecord, SceneTreeMirror
+from .warm import SceneRun, WarmGodotRunner
+from .window import WindowBackend, WindowGeometry, get_window_backend
 
 # InputInjector requires tkinter - import only when needed
 # from .input import InputInjector
 
 __all__ = [
     "ScreenshotCapture",
+    "CaptureStream",
+    "Frame",
+    "ScreenshotWriter",
+    "ScreenshotStore",
+    "HashEntry",
+    "TemplateMatcher",
+    "Match",
     # "InputInjector",  # Requires tkinter
     "GodotProject",
     "GodotRunner",
+    "AsyncGodotRunner",
+    "OutputLine",
+    "WaitResult",
+    "GodotRunnerPool",
+    "JobSpec",
+    "JobResult",
+    "WarmGodotRunner",
+    "SceneRun",
+    "BridgeInput",
+    "BridgeClient",
+    "BridgeError",
+    "BridgeImage",
+    "LogPage",
+    "LogSubscription",
+    "LogParser",
+    "LogRecord",
+    "StackFrame",
+    "LogAssertions",
+    "AssertionResult",
+    "PatternHit",
+    "ArchiveWriter",
+    "LogArchive",
+    "archive_runner",
+    "SceneTreeMirror",
+    "MirrorNode",
+    "NodeRecord",
+    "NodePage",
+    "WindowBackend",
+    "WindowGeometry",
+    "get_window_backend",
 ]
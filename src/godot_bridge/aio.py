@@ -0,0 +1,214 @@
+"""asyncio-native Godot runner.
+
+Lets a single event loop drive many Godot processes at once without a
+reader thread per pipe.
+"""
+
+import asyncio
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional, Pattern, Union
+
+from .godot import GodotProject, OutputBuffer, OutputLine, display_command, headless_command
+
+# asyncio's default StreamReader limit is 64 KiB per line; Godot stack
+# dumps can exceed that.
+LINE_LIMIT = 1024 * 1024
+
+
+class AsyncGodotRunner:
+    """Run Godot projects on asyncio subprocesses and stream their output."""
+
+    def __init__(self, godot_path: str = "godot", buffer_size: int = 10000):
+        self.godot_path = godot_path
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.buffer = OutputBuffer(buffer_size)
+        self._changed = asyncio.Event()
+        self._pumps: List["asyncio.Task[None]"] = []
+
+    async def verify_godot(self) -> bool:
+        """Check if Godot is installed and accessible."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self.godot_path,
+                "--version",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            return await asyncio.wait_for(proc.wait(), timeout=5) == 0
+        except Exception:
+            return False
+
+    async def run_headless(
+        self,
+        project: GodotProject,
+        scene: Optional[str] = None,
+        quit_after: Optional[int] = None,
+        fixed_fps: int = 60,
+    ) -> asyncio.subprocess.Process:
+        """Run project in headless mode.
+
+        Args:
+            project: GodotProject to run
+            scene: Optional specific scene to run
+            quit_after: Quit after N frames (for testing)
+            fixed_fps: Fixed FPS for deterministic playback
+
+        Returns:
+            Running asyncio subprocess
+        """
+        cmd = headless_command(self.godot_path, project, scene, quit_after, fixed_fps)
+        return await self._start(cmd)
+
+    async def run_with_display(
+        self, project: GodotProject, scene: Optional[str] = None
+    ) -> asyncio.subprocess.Process:
+        """Run project with display (for interactive testing).
+
+        Args:
+            project: GodotProject to run
+            scene: Optional specific scene to run
+
+        Returns:
+            Running asyncio subprocess
+        """
+        cmd = display_command(self.godot_path, project, scene)
+        return await self._start(cmd)
+
+    async def _start(self, cmd: List[str]) -> asyncio.subprocess.Process:
+        """Launch ``cmd`` and start pumping its pipes into the buffer."""
+        if self.is_running():
+            await self.stop()
+        self.buffer.clear()
+
+        self.process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=LINE_LIMIT,
+        )
+        self._pumps = [
+            asyncio.create_task(self._pump(self.process.stdout, "stdout")),
+            asyncio.create_task(self._pump(self.process.stderr, "stderr")),
+        ]
+        return self.process
+
+    async def _pump(self, stream: Optional[asyncio.StreamReader], name: str) -> None:
+        """Copy lines from ``stream`` into the buffer until EOF."""
+        if stream is None:
+            return
+        try:
+            while True:
+                try:
+                    raw = await stream.readline()
+                except ValueError:
+                    # Line longer than LINE_LIMIT: take what is buffered
+                    raw = await stream.read(LINE_LIMIT)
+                if not raw:
+                    break
+                self.buffer.append(name, raw.decode("utf-8", "replace").rstrip("\r\n"))
+                self._changed.set()
+        finally:
+            self._changed.set()
+
+    def _pumps_done(self) -> bool:
+        return all(task.done() for task in self._pumps)
+
+    async def lines(self, since: Optional[int] = None) -> AsyncIterator[OutputLine]:
+        """Iterate output lines as they arrive.
+
+        Ends once the process has exited and both pipes are drained.
+
+        Args:
+            since: Sequence number to start from (default: oldest buffered line)
+
+        Yields:
+            OutputLine in arrival order
+        """
+        cursor = 0 if since is None else since
+        while True:
+            batch = self.buffer.since(cursor)
+            if batch:
+                cursor = batch[-1].seq + 1
+                for line in batch:
+                    yield line
+                continue
+            if self._pumps_done():
+                return
+            # Clearing cannot lose a wakeup for other waiters: set() has
+            # already resolved their futures.
+            self._changed.clear()
+            if self.buffer.next_seq <= cursor and not self._pumps_done():
+                await self._changed.wait()
+
+    async def wait_for_line(
+        self, pattern: Union[str, Pattern[str]], timeout: Optional[float] = None, since: int = 0
+    ) -> Optional[OutputLine]:
+        """Wait for an output line matching ``pattern``.
+
+        Lines already in the buffer are checked first.
+
+        Args:
+            pattern: Regex (string or compiled) searched in each line
+            timeout: Max seconds to wait (None = until the process exits)
+            since: Sequence number to start searching from
+
+        Returns:
+            Matching OutputLine, or None on timeout or process exit
+        """
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+
+        async def search() -> Optional[OutputLine]:
+            async for line in self.lines(since):
+                if regex.search(line.text):
+                    return line
+            return None
+
+        try:
+            return await asyncio.wait_for(search(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Wait for the process to exit.
+
+        Returns:
+            Exit code, or None if still running after ``timeout``
+        """
+        if not self.process:
+            return None
+        try:
+            return await asyncio.wait_for(self.process.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def stop(self) -> Dict[str, Any]:
+        """Stop running process and collect final output.
+
+        Returns:
+            Dict with 'stdout', 'stderr', 'returncode'
+        """
+        if not self.process:
+            return {"stdout": [], "stderr": [], "returncode": None}
+
+        if self.process.returncode is None:
+            self.process.terminate()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+
+        await asyncio.gather(*self._pumps, return_exceptions=True)
+
+        lines = self.buffer.since(0)
+        return {
+            "stdout": [line.text for line in lines if line.stream == "stdout"],
+            "stderr": [line.text for line in lines if line.stream == "stderr"],
+            "returncode": self.process.returncode,
+        }
+
+    def is_running(self) -> bool:
+        """Check if process is still running."""
+        if not self.process:
+            return False
+        return self.process.returncode is None
@@ -0,0 +1,496 @@
+"""Compressed, seekable per-run log archives.
+
+An archive is two files:
+
+``<path>``
+    Independently compressed chunks, back to back (gzip members, or zstd
+    frames when the ``zstandard`` package is installed). Each chunk holds
+    a run of output lines as JSON arrays ``[seq, timestamp, stream, text]``,
+    one per line. A gzip archive is a valid .gz file, so ``zcat`` reads it.
+
+``<path>.idx``
+    JSON lines: a header, then one entry per chunk with its byte offset and
+    size, seq and time range, and for every level except "print" the
+    positions of that level's lines inside the chunk.
+
+The index entry is written after its chunk, so a reader never sees a
+partial chunk and can follow an archive that is still being written.
+Queries by time, seq or level only decompress the chunks they need.
+"""
+
+import bisect
+import gzip
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from itertools import accumulate
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .godot import OutputLine
+from .logs import PRINT, line_level
+
+if TYPE_CHECKING:
+    from .godot import GodotRunner
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+FORMAT = "openclaw-log"
+VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+
+def _compress(codec: str, data: bytes, level: int) -> bytes:
+    if codec == "zstd":
+        compressed: bytes = zstandard.ZstdCompressor(level=level).compress(data)
+        return compressed
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if not HAS_ZSTD:
+            raise RuntimeError("Archive is zstd-compressed; install zstandard to read it")
+        decompressed: bytes = zstandard.ZstdDecompressor().decompress(data)
+        return decompressed
+    return gzip.decompress(data)
+
+
+@dataclass
+class ChunkInfo:
+    """Index entry for one compressed chunk.
+
+    Ranges are min/max rather than first/last line: stdout and stderr are
+    appended from separate threads, so lines can arrive slightly out of
+    seq and timestamp order.
+    """
+
+    offset: int  # Byte offset in the data file
+    size: int  # Compressed size
+    first_seq: int  # Lowest seq in the chunk
+    last_seq: int  # Highest seq
+    start: float  # Earliest timestamp
+    end: float  # Latest timestamp
+    lines: int
+    levels: Dict[str, List[int]] = field(default_factory=dict)  # Positions, except "print"
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "offset": self.offset,
+            "size": self.size,
+            "first_seq": self.first_seq,
+            "last_seq": self.last_seq,
+            "start": self.start,
+            "end": self.end,
+            "lines": self.lines,
+            "levels": self.levels,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "ChunkInfo":
+        return cls(
+            offset=int(data["offset"]),
+            size=int(data["size"]),
+            first_seq=int(data["first_seq"]),
+            last_seq=int(data["last_seq"]),
+            start=float(data["start"]),
+            end=float(data["end"]),
+            lines=int(data["lines"]),
+            levels={level: list(positions) for level, positions in data.get("levels", {}).items()},
+        )
+
+
+def _read_index(path: Path) -> Tuple[Optional[Dict[str, Any]], List[ChunkInfo]]:
+    """Header and chunk entries; a torn last line (writer mid-append) is ignored."""
+    if not path.exists():
+        return None, []
+    header = None
+    chunks: List[ChunkInfo] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            if not raw.endswith("\n"):
+                break
+            data = json.loads(raw)
+            if header is None:
+                if data.get("format") != FORMAT:
+                    raise ValueError(f"Not a log archive index: {path}")
+                header = data
+            else:
+                chunks.append(ChunkInfo.from_json(data))
+    return header, chunks
+
+
+class ArchiveWriter:
+    """Appends output lines to an archive, one compressed chunk at a time.
+
+    A chunk is written once it holds ``chunk_lines`` lines or its first
+    line is ``chunk_seconds`` old, and on :meth:`flush` / :meth:`close`.
+    Age is checked on append and by a background timer, so the tail of a
+    run that goes quiet still reaches live readers. Appending is thread-safe, so :meth:`attach` can feed
+    it straight from a runner's pipe readers. Reopening an existing archive
+    continues it; bytes after the last indexed chunk are discarded.
+
+    Seqs stay unique across runs: when :meth:`attach` is given a runner
+    whose seqs would fall below what is already archived (a new runner, or
+    a reopened archive), its lines are stored shifted past the last one.
+
+    Example:
+        with ArchiveWriter("runs/soak.log.gz").attach(runner):
+            runner.run_headless(project)
+            runner.wait()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        codec: Optional[str] = None,
+        level: Optional[int] = None,
+        chunk_lines: int = 4096,
+        chunk_seconds: float = 5.0,
+    ):
+        """
+        Args:
+            path: Data file; the index goes next to it with ``.idx`` appended
+            codec: "zstd" or "gzip" (default: zstd when installed)
+            level: Compression level (default: 3 for zstd, 6 for gzip)
+            chunk_lines: Max lines per chunk
+            chunk_seconds: Max age of a buffered chunk before it is written
+        """
+        self.path = Path(path)
+        self.index_path = Path(str(self.path) + INDEX_SUFFIX)
+        self.chunk_lines = chunk_lines
+        self.chunk_seconds = chunk_seconds
+        self._lock = threading.Lock()
+        self._pending: List[OutputLine] = []
+        self._pending_since = 0.0
+        self._runner: Optional["GodotRunner"] = None
+        self._seq_base = 0  # Added to the attached run's seqs
+
+        header, chunks = _read_index(self.index_path)
+        if header is not None:
+            self.codec = header["codec"]
+            if codec is not None and codec != self.codec:
+                raise ValueError(f"Archive uses {self.codec}, not {codec}")
+        else:
+            self.codec = codec or ("zstd" if HAS_ZSTD else "gzip")
+        if self.codec not in ("zstd", "gzip"):
+            raise ValueError(f"Unknown codec: {self.codec}")
+        if self.codec == "zstd" and not HAS_ZSTD:
+            raise RuntimeError("zstd archives need the zstandard package")
+        self.level = level if level is not None else (3 if self.codec == "zstd" else 6)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.chunks = len(chunks)
+        self.lines = sum(chunk.lines for chunk in chunks)
+        self._next_seq = max((chunk.last_seq for chunk in chunks), default=-1) + 1
+        end = chunks[-1].offset + chunks[-1].size if chunks else 0
+        self._data = open(self.path, "ab")
+        self._data.truncate(end)  # Drop a chunk whose index entry never made it
+        self._data.seek(end)
+        # Rewritten from what parsed, so a torn last entry is dropped too
+        if header is None:
+            header = {"format": FORMAT, "version": VERSION, "codec": self.codec}
+        self._index = open(self.index_path, "w", encoding="utf-8")
+        self._index.write(json.dumps(header) + "\n")
+        for chunk in chunks:
+            self._index.write(json.dumps(chunk.to_json()) + "\n")
+        self._index.flush()
+
+        self._stop = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        if chunk_seconds > 0:
+            self._timer = threading.Thread(
+                target=self._flush_loop, name="archive-flush", daemon=True
+            )
+            self._timer.start()
+
+    def _flush_loop(self) -> None:
+        """Timer thread: write the buffered chunk once it is old enough."""
+        while not self._stop.wait(self.chunk_seconds / 2):
+            with self._lock:
+                if not self._stop.is_set() and self._due():
+                    self._write_chunk()
+
+    def _due(self) -> bool:
+        return bool(self._pending) and (
+            len(self._pending) >= self.chunk_lines
+            or time.monotonic() - self._pending_since >= self.chunk_seconds
+        )
+
+    def append(self, line: OutputLine) -> None:
+        """Buffer a line, writing a chunk when one is due."""
+        with self._lock:
+            if self._seq_base:
+                line = replace(line, seq=line.seq + self._seq_base)
+            self._next_seq = max(self._next_seq, line.seq + 1)
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append(line)
+            if self._due():
+                self._write_chunk()
+
+    def extend(self, lines: Sequence[OutputLine]) -> None:
+        for line in lines:
+            self.append(line)
+
+    def flush(self) -> None:
+        """Write buffered lines as a chunk now."""
+        with self._lock:
+            self._write_chunk()
+
+    def _write_chunk(self) -> None:
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, []
+        levels: Dict[str, List[int]] = {}
+        rows = []
+        for position, line in enumerate(lines):
+            level = line_level(line.text, line.stream)
+            if level != PRINT:
+                levels.setdefault(level, []).append(position)
+            rows.append(json.dumps([line.seq, line.timestamp, line.stream, line.text]))
+        payload = _compress(self.codec, ("\n".join(rows) + "\n").encode("utf-8"), self.level)
+
+        seqs = [line.seq for line in lines]
+        stamps = [line.timestamp for line in lines]
+        info = ChunkInfo(
+            offset=self._data.tell(),
+            size=len(payload),
+            first_seq=min(seqs),
+            last_seq=max(seqs),
+            start=min(stamps),
+            end=max(stamps),
+            lines=len(lines),
+            levels=levels,
+        )
+        self._data.write(payload)
+        self._data.flush()
+        # Index after data: readers only ever see complete chunks
+        self._index.write(json.dumps(info.to_json()) + "\n")
+        self._index.flush()
+        self.chunks += 1
+        self.lines += len(lines)
+
+    def attach(self, runner: "GodotRunner") -> "ArchiveWriter":
+        """Archive every line ``runner`` reads from now on."""
+        self.detach()
+        with self._lock:
+            self._seq_base = max(0, self._next_seq - runner.buffer.next_seq)
+        self._runner = runner
+        runner.add_listener(self.append)
+        return self
+
+    def detach(self) -> None:
+        """Stop following the attached runner."""
+        if self._runner is not None:
+            self._runner.remove_listener(self.append)
+            self._runner = None
+
+    def close(self) -> None:
+        """Detach, write the last chunk and close the files."""
+        self.detach()
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join()
+            self._timer = None
+        with self._lock:
+            self._write_chunk()
+            self._data.close()
+            self._index.close()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+class LogArchive:
+    """Random-access reader for an archive written by :class:`ArchiveWriter`.
+
+    The chunk index is held in memory; :meth:`refresh` picks up chunks
+    appended since it was loaded, so an archive can be read while its run
+    is still going.
+
+    Example:
+        archive = LogArchive("runs/soak.log.gz")
+        for line in archive.read(level="script_error"):
+            print(line.seq, line.text)
+        last_minute = list(archive.read(start=archive.end - 60))
+    """
+
+    def __init__(self, path: Union[str, Path], cache_chunks: int = 4):
+        self.path = Path(path)
+        self.index_path = Path(str(self.path) + INDEX_SUFFIX)
+        self.cache_chunks = cache_chunks
+        self.codec = "gzip"
+        self.chunks: List[ChunkInfo] = []
+        # Bisectable bounds that hold even if chunk ranges overlap: running
+        # max of end / last_seq, and min of start over each chunk and later
+        self._max_ends: List[float] = []
+        self._max_last_seqs: List[int] = []
+        self._min_starts: List[float] = []
+        self._cache: Dict[int, List[OutputLine]] = {}  # Chunk number -> lines, LRU order
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Reload the index; returns the number of new chunks."""
+        header, chunks = _read_index(self.index_path)
+        if header is None:
+            raise FileNotFoundError(f"No archive index at {self.index_path}")
+        self.codec = header["codec"]
+        added = len(chunks) - len(self.chunks)
+        self.chunks = chunks
+        self._max_ends = list(accumulate((chunk.end for chunk in chunks), max))
+        self._max_last_seqs = list(accumulate((chunk.last_seq for chunk in chunks), max))
+        self._min_starts = list(accumulate((chunk.start for chunk in reversed(chunks)), min))[::-1]
+        return added
+
+    def __len__(self) -> int:
+        """Lines in the archive."""
+        return sum(chunk.lines for chunk in self.chunks)
+
+    @property
+    def start(self) -> Optional[float]:
+        return self.chunks[0].start if self.chunks else None
+
+    @property
+    def end(self) -> Optional[float]:
+        return self.chunks[-1].end if self.chunks else None
+
+    def level_counts(self) -> Dict[str, int]:
+        """Lines per level across the archive, from the index alone."""
+        counts: Dict[str, int] = {}
+        for chunk in self.chunks:
+            other = 0
+            for level, positions in chunk.levels.items():
+                counts[level] = counts.get(level, 0) + len(positions)
+                other += len(positions)
+            counts[PRINT] = counts.get(PRINT, 0) + chunk.lines - other
+        return counts
+
+    def chunk(self, number: int) -> List[OutputLine]:
+        """Decompress one chunk (kept in a small LRU cache)."""
+        lines = self._cache.pop(number, None)
+        if lines is None:
+            info = self.chunks[number]
+            with open(self.path, "rb") as f:
+                f.seek(info.offset)
+                payload = f.read(info.size)
+            text = _decompress(self.codec, payload).decode("utf-8")
+            lines = [OutputLine(*json.loads(row)) for row in text.splitlines()]
+            if len(self._cache) >= self.cache_chunks:
+                self._cache.pop(next(iter(self._cache)))
+        self._cache[number] = lines
+        return lines
+
+    def _span(self, start: Optional[float], end: Optional[float], since: Optional[int]) -> range:
+        """Chunk numbers that can hold lines in the time and seq bounds."""
+        first = 0
+        last = len(self.chunks)
+        if start is not None:
+            # Every chunk before `first` ends before `start`
+            first = bisect.bisect_left(self._max_ends, start)
+        if since is not None:
+            first = max(first, bisect.bisect_left(self._max_last_seqs, since))
+        if end is not None:
+            # Every chunk from `last` on starts after `end`
+            last = bisect.bisect_right(self._min_starts, end)
+        return range(first, last)
+
+    def read(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        since: Optional[int] = None,
+        level: Union[str, Sequence[str], None] = None,
+        stream: Optional[str] = None,
+    ) -> Iterator[OutputLine]:
+        """Lines in archive order, filtered by time, seq, level and stream.
+
+        Args:
+            start: Only lines with timestamp >= start (time.time() scale)
+            end: Only lines with timestamp <= end
+            since: Only lines with seq >= since
+            level: Level or levels (see :mod:`godot_bridge.logs`); chunks
+                whose index has none of them are not decompressed
+            stream: "stdout" or "stderr"
+
+        Yields:
+            OutputLine
+        """
+        levels = None if level is None else ([level] if isinstance(level, str) else list(level))
+        for number in self._span(start, end, since):
+            info = self.chunks[number]
+            if (
+                (start is not None and info.end < start)
+                or (end is not None and info.start > end)
+                or (since is not None and info.last_seq < since)
+            ):
+                continue
+            if levels is not None:
+                positions = self._positions(info, levels)
+                if not positions:
+                    continue
+                lines = self.chunk(number)
+                candidates: Iterator[OutputLine] = (lines[i] for i in positions)
+            else:
+                candidates = iter(self.chunk(number))
+            for line in candidates:
+                if start is not None and line.timestamp < start:
+                    continue
+                if end is not None and line.timestamp > end:
+                    continue
+                if since is not None and line.seq < since:
+                    continue
+                if stream is not None and line.stream != stream:
+                    continue
+                yield line
+
+    def _positions(self, info: ChunkInfo, levels: List[str]) -> List[int]:
+        if PRINT in levels:
+            # Prints are everything the index doesn't list
+            listed = set()
+            for positions in info.levels.values():
+                listed.update(positions)
+            wanted = set(range(info.lines)) - listed
+        else:
+            wanted = set()
+        for level in levels:
+            wanted.update(info.levels.get(level, []))
+        return sorted(wanted)
+
+    def tail(self, count: int) -> List[OutputLine]:
+        """The last ``count`` lines."""
+        lines: List[OutputLine] = []
+        for number in range(len(self.chunks) - 1, -1, -1):
+            lines[:0] = self.chunk(number)
+            if len(lines) >= count:
+                break
+        return lines[-count:] if count else []
+
+    def text(self, **filters: Any) -> str:
+        """Matching lines joined with newlines (see :meth:`read`)."""
+        return "\n".join(line.text for line in self.read(**filters))
+
+
+def archive_runner(
+    runner: "GodotRunner", directory: Union[str, Path], name: Optional[str] = None, **options: Any
+) -> ArchiveWriter:
+    """Start archiving ``runner``'s output to ``directory/<name>``.
+
+    The default name is the current local time plus the archive extension.
+    Call ``close()`` on the returned writer when the run is over.
+    """
+    if name is None:
+        codec = options.get("codec") or ("zstd" if HAS_ZSTD else "gzip")
+        extension = ".log.zst" if codec == "zstd" else ".log.gz"
+        name = time.strftime("run-%Y%m%d-%H%M%S") + extension
+    return ArchiveWriter(os.path.join(directory, name), **options).attach(runner)
@@ -0,0 +1,335 @@
+"""Streaming pass/fail checks over Godot output.
+
+:class:`LogAssertions` holds a set of expected and forbidden patterns and
+matches them against output lines as they arrive. All patterns still
+waiting for a match are combined into one regex, so a line that matches
+nothing (nearly all of them) costs a single search; only lines that hit
+are checked against the individual patterns. Patterns drop out of the
+combined regex once resolved. Regexes with capture groups or inline flags
+would change meaning inside the alternation, so those are always searched
+on their own.
+
+:meth:`LogAssertions.run` follows a :class:`GodotRunner` and returns as
+soon as the outcome is known: on the first forbidden match, or once every
+expectation has been seen, without waiting for the process to exit.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+from .godot import OutputLine
+
+if TYPE_CHECKING:
+    from .godot import GodotRunner
+
+STREAMS = ("stdout", "stderr")
+
+# Global inline flags such as "(?i)" are only valid at the start of a regex
+_INLINE_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+@dataclass
+class PatternSpec:
+    """One expected or forbidden pattern."""
+
+    name: str
+    regex: Pattern[str]
+    forbidden: bool = False
+    count: int = 1  # Matches needed before an expectation is met
+    stream: Optional[str] = None  # "stdout", "stderr" or None for both
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    """First match of a pattern."""
+
+    name: str
+    line: OutputLine
+    elapsed: float  # Seconds from the start of the check to the line's arrival
+
+
+@dataclass
+class AssertionResult:
+    """Outcome of :meth:`LogAssertions.run` / :meth:`LogAssertions.check`."""
+
+    passed: bool
+    reason: str  # "satisfied", "forbidden", "exit", "timeout" or "end"
+    hits: Dict[str, PatternHit] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+    missing: List[str] = field(default_factory=list)  # Expectations not met
+    violations: List[PatternHit] = field(default_factory=list)  # Forbidden matches
+    elapsed: float = 0.0
+
+    def first_match(self, name: str) -> Optional[float]:
+        """Seconds until ``name`` first matched, or None."""
+        hit = self.hits.get(name)
+        return hit.elapsed if hit else None
+
+
+class LogAssertions:
+    """Expected/forbidden output patterns, matched incrementally.
+
+    Patterns are literal substrings unless ``regex=True``.
+
+    Example:
+        checks = LogAssertions()
+        checks.expect("started", "TEST_START")
+        checks.expect("loops", "LOOP: Iteration", count=3)
+        checks.forbid("script error", r"^SCRIPT ERROR:", regex=True, stream="stderr")
+
+        runner.run_headless(project)
+        result = checks.run(runner, timeout=30)
+        if not result.passed:
+            print(result.reason, result.missing, result.violations)
+    """
+
+    def __init__(self) -> None:
+        self.specs: Dict[str, PatternSpec] = {}
+        # Per stream: combined prefilter and the patterns it cannot include
+        self._combined: Optional[Dict[str, Tuple[Optional[Pattern[str]], List[PatternSpec]]]] = None
+        self.reset()
+
+    # -- Patterns -----------------------------------------------------------
+
+    def _add(
+        self,
+        name: str,
+        pattern: str,
+        regex: bool,
+        forbidden: bool,
+        count: int,
+        stream: Optional[str],
+        ignore_case: bool,
+    ) -> "LogAssertions":
+        if name in self.specs:
+            raise ValueError(f"Duplicate pattern name: {name}")
+        if stream is not None and stream not in STREAMS:
+            raise ValueError(f"Unknown stream: {stream}")
+        source = pattern if regex else re.escape(pattern)
+        compiled = re.compile(source, re.IGNORECASE if ignore_case else 0)
+        self.specs[name] = PatternSpec(name, compiled, forbidden, count, stream)
+        self._combined = None
+        return self
+
+    def expect(
+        self,
+        name: str,
+        pattern: str,
+        count: int = 1,
+        regex: bool = False,
+        stream: Optional[str] = None,
+        ignore_case: bool = False,
+    ) -> "LogAssertions":
+        """Require ``pattern`` to appear on at least ``count`` lines."""
+        return self._add(name, pattern, regex, False, count, stream, ignore_case)
+
+    def forbid(
+        self,
+        name: str,
+        pattern: str,
+        regex: bool = False,
+        stream: Optional[str] = None,
+        ignore_case: bool = False,
+    ) -> "LogAssertions":
+        """Fail if ``pattern`` appears on any line."""
+        return self._add(name, pattern, regex, True, 1, stream, ignore_case)
+
+    def forbid_errors(self, script_only: bool = False) -> "LogAssertions":
+        """Forbid Godot's ``SCRIPT ERROR:`` (and, unless ``script_only``, ``ERROR:``) lines."""
+        if script_only:
+            return self.forbid(
+                "script error", r"^(?:USER )?SCRIPT ERROR:", regex=True, stream="stderr"
+            )
+        return self.forbid("error", r"^(?:USER )?(?:SCRIPT )?ERROR:", regex=True, stream="stderr")
+
+    # -- State --------------------------------------------------------------
+
+    def reset(self) -> None:
+        """Forget matches so the same patterns can check another run."""
+        self.counts: Dict[str, int] = {}
+        self.hits: Dict[str, PatternHit] = {}
+        self.violations: List[PatternHit] = []
+        self.started = time.time()
+        self._resolved: Set[str] = set()
+        self._combined = None
+
+    def _active(self, stream: str) -> List[PatternSpec]:
+        return [
+            spec
+            for spec in self.specs.values()
+            if spec.name not in self._resolved and spec.stream in (None, stream)
+        ]
+
+    @staticmethod
+    def _combinable(spec: PatternSpec) -> bool:
+        """Whether ``spec`` keeps its meaning inside the combined alternation.
+
+        Capture groups would be renumbered (breaking backreferences, and
+        duplicate group names do not compile), and global inline flags are
+        an error anywhere but at the start.
+        """
+        return spec.regex.groups == 0 and _INLINE_FLAGS.search(spec.regex.pattern) is None
+
+    def _compile(self) -> Dict[str, Tuple[Optional[Pattern[str]], List[PatternSpec]]]:
+        """One alternation per stream over the unresolved combinable patterns."""
+        combined: Dict[str, Tuple[Optional[Pattern[str]], List[PatternSpec]]] = {}
+        for stream in STREAMS:
+            active = self._active(stream)
+            parts = [
+                (
+                    f"(?i:{spec.regex.pattern})"
+                    if spec.regex.flags & re.IGNORECASE
+                    else f"(?:{spec.regex.pattern})"
+                )
+                for spec in active
+                if self._combinable(spec)
+            ]
+            separate = [spec for spec in active if not self._combinable(spec)]
+            combined[stream] = (re.compile("|".join(parts)) if parts else None, separate)
+        return combined
+
+    @property
+    def satisfied(self) -> bool:
+        """Every expectation met."""
+        return all(
+            self.counts.get(spec.name, 0) >= spec.count
+            for spec in self.specs.values()
+            if not spec.forbidden
+        )
+
+    @property
+    def failed(self) -> bool:
+        """A forbidden pattern has matched."""
+        return bool(self.violations)
+
+    @property
+    def has_expectations(self) -> bool:
+        return any(not spec.forbidden for spec in self.specs.values())
+
+    # -- Matching -----------------------------------------------------------
+
+    def feed(self, line: OutputLine) -> bool:
+        """Match one line.
+
+        Returns:
+            True if the line matched at least one pattern
+        """
+        if self._combined is None:
+            self._combined = self._compile()
+        prefilter, separate = self._combined.get(line.stream, self._combined["stdout"])
+        if prefilter is not None and prefilter.search(line.text) is not None:
+            candidates = self._active(line.stream)
+        elif separate:
+            candidates = separate
+        else:
+            return False
+
+        matched = False
+        resolved = len(self._resolved)
+        for spec in candidates:
+            if spec.regex.search(line.text) is None:
+                continue
+            matched = True
+            hit = PatternHit(spec.name, line, max(line.timestamp - self.started, 0.0))
+            self.counts[spec.name] = self.counts.get(spec.name, 0) + 1
+            self.hits.setdefault(spec.name, hit)
+            if spec.forbidden:
+                self.violations.append(hit)
+                self._resolved.add(spec.name)
+            elif self.counts[spec.name] >= spec.count:
+                self._resolved.add(spec.name)
+        if len(self._resolved) != resolved:
+            self._combined = None  # Resolved patterns leave the prefilter
+        return matched
+
+    def result(self, reason: str) -> AssertionResult:
+        """Snapshot of the current outcome."""
+        missing = [
+            spec.name
+            for spec in self.specs.values()
+            if not spec.forbidden and self.counts.get(spec.name, 0) < spec.count
+        ]
+        return AssertionResult(
+            passed=not self.violations and not missing,
+            reason=reason,
+            hits=dict(self.hits),
+            counts=dict(self.counts),
+            missing=missing,
+            violations=list(self.violations),
+            elapsed=time.time() - self.started,
+        )
+
+    def check(self, lines: Iterable[OutputLine], fail_fast: bool = True) -> AssertionResult:
+        """Match already-captured lines (e.g. ``runner.get_lines()``)."""
+        for line in lines:
+            self.feed(line)
+            if self.failed and fail_fast:
+                return self.result("forbidden")
+        if self.failed:
+            return self.result("forbidden")
+        return self.result("satisfied" if self.satisfied else "end")
+
+    def run(
+        self,
+        runner: "GodotRunner",
+        timeout: Optional[float] = None,
+        since: Optional[int] = None,
+        fail_fast: bool = True,
+        until_exit: bool = False,
+        poll_interval: float = 0.05,
+    ) -> AssertionResult:
+        """Follow ``runner``'s output until the outcome is decided.
+
+        Returns on the first forbidden match (``fail_fast``), once every
+        expectation is met (unless ``until_exit``, which keeps watching the
+        forbidden patterns until the process ends), on exit, or on timeout.
+        With only forbidden patterns it watches until exit. The process is
+        left running; call ``runner.stop()`` afterwards. First-match times
+        are measured from the process start.
+
+        Args:
+            runner: GodotRunner whose process is running
+            timeout: Max seconds to wait (None = no limit)
+            since: First output seq to check (default: start of the run)
+            fail_fast: Stop on the first forbidden match
+            until_exit: Keep checking forbidden patterns after all
+                expectations are met, until the process exits
+            poll_interval: How often to re-check for process exit
+
+        Returns:
+            AssertionResult
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        cursor = since or 0
+        if runner.started_at is not None:
+            self.started = runner.started_at
+        stop_when_satisfied = self.has_expectations and not until_exit
+
+        while True:
+            exited = runner.process is None or runner.process.poll() is not None
+            if exited:
+                runner.wait(timeout=5)  # Drain the pipes
+
+            lines = runner.get_lines(since=cursor)
+            for line in lines:
+                self.feed(line)
+                if self.failed and fail_fast:
+                    return self.result("forbidden")
+            if lines:
+                cursor = lines[-1].seq + 1
+
+            if stop_when_satisfied and self.satisfied and not self.failed:
+                return self.result("satisfied")
+            if exited:
+                return self.result("forbidden" if self.failed else "exit")
+
+            wait = poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return self.result("timeout")
+                wait = min(wait, remaining)
+            runner.buffer.wait_for(cursor, wait)
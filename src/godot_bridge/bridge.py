@@ -0,0 +1,408 @@
+"""Client for the OpenClaw Bridge editor plugin.
+
+Wire format: each message is a 4-byte big-endian length followed by a
+UTF-8 JSON payload. Requests carry an ``id`` that the server echoes back,
+so many requests can be in flight at once and responses may arrive out of
+order. Messages without an ``id`` are server-pushed events.
+
+A message with ``"binary": true`` is followed by one raw frame (e.g.
+screenshot pixels), which is attached to the message as ``data``.
+"""
+
+import io
+import json
+import logging
+import socket
+import struct
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from PIL import Image
+
+from .logs import LogSubscription
+from .scene import NodePage, NodeRecord, SceneTreeMirror
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 9742
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+_HEADER = struct.Struct(">I")
+
+
+class BridgeError(Exception):
+    """Raised when the bridge reports a failed request."""
+
+
+@dataclass
+class BridgeImage:
+    """Screenshot received as a binary frame."""
+
+    width: int
+    height: int
+    format: str  # "rgba", "png" or "webp"
+    data: memoryview
+
+    def to_image(self) -> Image.Image:
+        """Convert to a PIL Image.
+
+        Raw RGBA frames are wrapped without copying, so the image shares
+        memory with ``data``.
+        """
+        if self.format == "rgba":
+            return Image.frombuffer(
+                "RGBA",
+                (self.width, self.height),
+                self.data,  # type: ignore[arg-type]  # PIL reads any buffer
+                "raw",
+                "RGBA",
+                0,
+                1,
+            )
+        return Image.open(io.BytesIO(self.data))
+
+
+@dataclass
+class LogPage:
+    """One page of editor log entries from :meth:`BridgeClient.read_logs`."""
+
+    entries: List[Dict[str, Any]]
+    next_cursor: int  # Pass back to resume after the last entry
+    has_more: bool  # More entries are already waiting
+    dropped: int = 0  # Entries overwritten in the ring before they were read
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> "LogPage":
+        return cls(
+            entries=response["logs"],
+            next_cursor=int(response["next_cursor"]),
+            has_more=bool(response.get("has_more", False)),
+            dropped=int(response.get("dropped", 0)),
+        )
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """Prefix ``payload`` with its length."""
+    return _HEADER.pack(len(payload)) + payload
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytearray]:
+    """Read exactly ``size`` bytes, or None on EOF."""
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:], size - received)
+        if n == 0:
+            return None
+        received += n
+    return buf
+
+
+def read_frame(sock: socket.socket) -> Optional[bytearray]:
+    """Read one frame payload from ``sock``, or None on EOF."""
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise BridgeError(f"Frame too large: {size} bytes")
+    return _recv_exact(sock, size)
+
+
+class BridgeClient:
+    """Pipelined request/response client for the OpenClaw bridge.
+
+    Example:
+        with BridgeClient() as client:
+            # Fire several requests, then collect the results
+            tree = client.request("get_scene_tree")
+            logs = client.request("get_logs", since=0)
+            print(tree.result()["tree"], logs.result()["logs"])
+    """
+
+    # Pushed to event handlers by the client itself once the connection drops
+    DISCONNECTED_EVENT = "disconnected"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader: Optional[threading.Thread] = None
+        self._pending: Dict[int, "Future[Dict[str, Any]]"] = {}
+        self._event_handlers: List[Callable[[Dict[str, Any]], None]] = []
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._ids = count(1)
+
+    def connect(self) -> "BridgeClient":
+        """Open the connection and start the response reader."""
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # The reader blocks until data arrives; per-call timeouts live on the futures
+        self._sock.settimeout(None)
+        self._reader = threading.Thread(target=self._read_loop, name="bridge-reader", daemon=True)
+        self._reader.start()
+        return self
+
+    def close(self) -> None:
+        """Close the connection and fail any outstanding requests."""
+        sock, self._sock = self._sock, None
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+        if self._reader and self._reader is not threading.current_thread():
+            self._reader.join(timeout=1)
+        self._fail_pending(ConnectionError("Bridge connection closed"))
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(exc)
+
+    def _read_loop(self) -> None:
+        """Reader thread body: route responses to futures, events to handlers."""
+        sock = self._sock
+        try:
+            while sock is not None:
+                payload = read_frame(sock)
+                if payload is None:
+                    break
+                message = json.loads(payload)
+                if message.get("binary"):
+                    data = read_frame(sock)
+                    if data is None:
+                        break
+                    message["data"] = memoryview(data)
+                self._dispatch(message)
+        except (OSError, ValueError, BridgeError):
+            pass
+        finally:
+            if sock is not None and self._sock is sock:
+                # The server hung up: mark the client closed so readers stop
+                self._sock = None
+                sock.close()
+            self._fail_pending(ConnectionError("Bridge connection lost"))
+            self._dispatch({"event": self.DISCONNECTED_EVENT})
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        request_id = message.get("id")
+        if request_id is None:
+            if "event" not in message and message.get("success") is False:
+                # An error the server could not tie to a request
+                logger.warning("Bridge error without a request id: %s", message.get("error"))
+            for handler in list(self._event_handlers):
+                try:
+                    handler(message)
+                except Exception:
+                    # A failing handler must not take the reader (and every
+                    # pending request) down with it
+                    logger.exception("Bridge event handler %r failed", handler)
+            return
+
+        with self._pending_lock:
+            future = self._pending.pop(request_id, None)
+        if future is not None and not future.done():
+            future.set_result(message)
+
+    def add_event_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callback for server-pushed messages (no ``id``).
+
+        Handlers run on the reader thread and should return quickly.
+        Exceptions they raise are logged and otherwise ignored. Errors the
+        server could not tie to a request also arrive here.
+        """
+        self._event_handlers.append(handler)
+
+    def remove_event_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """Unregister a callback added with :meth:`add_event_handler`."""
+        if handler in self._event_handlers:
+            self._event_handlers.remove(handler)
+
+    def request(self, action: str, **params: Any) -> "Future[Dict[str, Any]]":
+        """Send a request without waiting for its response.
+
+        Args:
+            action: Bridge action name (e.g. "get_scene_tree")
+            **params: Action parameters
+
+        Returns:
+            Future resolving to the response dict
+        """
+        if not self._sock:
+            raise ConnectionError("Bridge client not connected")
+
+        request_id = next(self._ids)
+        future: "Future[Dict[str, Any]]" = Future()
+        with self._pending_lock:
+            self._pending[request_id] = future
+
+        frame = encode_frame(
+            json.dumps({"id": request_id, "action": action, **params}).encode("utf-8")
+        )
+        try:
+            with self._send_lock:
+                self._sock.sendall(frame)
+        except OSError:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise
+        return future
+
+    def call(self, action: str, timeout: Optional[float] = None, **params: Any) -> Dict[str, Any]:
+        """Send a request and wait for a successful response.
+
+        Raises:
+            BridgeError: If the bridge reports ``success: false``
+            TimeoutError: If no response arrives within ``timeout``
+        """
+        response = self.request(action, **params).result(
+            timeout=self.timeout if timeout is None else timeout
+        )
+        if not response.get("success", False):
+            raise BridgeError(response.get("error", f"{action} failed"))
+        return response
+
+    def ping(self) -> bool:
+        """Check the bridge is responsive."""
+        return bool(self.call("ping").get("pong"))
+
+    def get_scene_tree(self) -> Dict[str, Any]:
+        """Serialized tree of the currently edited scene."""
+        tree: Dict[str, Any] = self.call("get_scene_tree")["tree"]
+        return tree
+
+    def query_nodes(
+        self,
+        root: str = "",
+        max_depth: Optional[int] = None,
+        types: Optional[Sequence[str]] = None,
+        properties: Optional[Sequence[str]] = None,
+        limit: int = 200,
+        cursor: Optional[int] = None,
+    ) -> NodePage:
+        """Query part of the edited scene without shipping the whole tree.
+
+        Args:
+            root: NodePath relative to the scene root (e.g. "UI")
+            max_depth: Levels below ``root`` to visit (None = unlimited)
+            types: Class names to keep (e.g. ["Button"]); subclasses match
+            properties: Properties to return (None = bridge defaults)
+            limit: Max records in this page
+            cursor: ``next_cursor`` from the previous page
+
+        Returns:
+            NodePage of NodeRecord
+        """
+        params: Dict[str, Any] = {"root": root, "limit": limit}
+        if max_depth is not None:
+            params["max_depth"] = max_depth
+        if types:
+            params["types"] = list(types)
+        if properties is not None:
+            params["properties"] = list(properties)
+        if cursor is not None:
+            params["cursor"] = cursor
+        return NodePage.from_response(self.call("query_scene_tree", **params))
+
+    def iter_nodes(self, page_size: int = 200, **query: Any) -> Iterator[NodeRecord]:
+        """Iterate over every match of :meth:`query_nodes`, page by page."""
+        cursor = None
+        while True:
+            page = self.query_nodes(limit=page_size, cursor=cursor, **query)
+            yield from page.nodes
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def subscribe_scene_tree(self, timeout: Optional[float] = None) -> SceneTreeMirror:
+        """Mirror the edited scene tree locally, kept current by deltas."""
+        return SceneTreeMirror(self).subscribe(timeout)
+
+    def get_logs(self, since: int = 0) -> List[Dict[str, Any]]:
+        """Editor log entries since the given time (ms since the plugin loaded).
+
+        Each entry has ``seq``, ``time``, ``level`` ("info", "error",
+        "warning", "script_error", "shader_error") and ``message``; errors
+        and warnings add ``file``, ``line``, ``function`` and ``stack``.
+        Returns at most one page; use :meth:`read_logs` to follow the log.
+        """
+        logs: List[Dict[str, Any]] = self.call("get_logs", since=since)["logs"]
+        return logs
+
+    def read_logs(self, cursor: int = 0, limit: int = 1000) -> LogPage:
+        """Entries from ``cursor`` on (a ``next_cursor`` from the last page).
+
+        Resuming from a cursor costs O(page) on the bridge, so this is the
+        cheap way to poll. Start from 0 to read everything still held.
+        """
+        return LogPage.from_response(self.call("get_logs", cursor=cursor, limit=limit))
+
+    def subscribe_logs(
+        self,
+        levels: Optional[Sequence[str]] = None,
+        pattern: Optional[str] = None,
+        cursor: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> LogSubscription:
+        """Stream editor log entries as they are logged, instead of polling.
+
+        Args:
+            levels: Levels to receive (e.g. ["error", "script_error"]); None = all
+            pattern: Regex (Godot RegEx syntax) searched in each message
+            cursor: Replay from this seq first (e.g. a LogPage.next_cursor);
+                None = only entries logged after subscribing
+            timeout: Wait for the subscription to be acknowledged
+
+        Returns:
+            LogSubscription to iterate over (sync or ``async for``)
+        """
+        return LogSubscription(self, levels, pattern, cursor).subscribe(timeout)
+
+    def capture_screenshot(self) -> Dict[str, Any]:
+        """Capture the editor viewport as base64 PNG inside JSON."""
+        return self.call("capture_screenshot")
+
+    def capture_image(self, format: str = "rgba", quality: float = 0.8) -> BridgeImage:
+        """Capture the editor viewport over a binary frame.
+
+        Args:
+            format: "rgba" (raw pixels, no encode/decode cost), "png" or "webp"
+            quality: WebP quality; below 1.0 is lossy
+
+        Returns:
+            BridgeImage whose ``data`` is a memoryview of the received bytes
+        """
+        response = self.call("capture_screenshot", format=format, binary=True, quality=quality)
+        return BridgeImage(
+            width=int(response["width"]),
+            height=int(response["height"]),
+            format=response["format"],
+            data=response["data"],
+        )
+
+    def reload_script(self, path: str) -> Dict[str, Any]:
+        """Force reload a script resource."""
+        return self.call("reload_script", path=path)
+
+    def __enter__(self) -> "BridgeClient":
+        if not self._sock:
+            self.connect()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
@@ -1,118 +1,201 @@
 """Screenshot capture for Godot windows."""
 
-import subprocess
+import json
+import os
+import queue
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import mss
+import mss.exception
 import mss.tools
+import numpy as np
 from PIL import Image
 
+from .window import WindowBackend, WindowGeometry, get_window_backend
+
 
 class ScreenshotCapture:
     """Capture screenshots of Godot windows using mss (Multi-Screen Shot)."""
 
-    def __init__(self):
+    def __init__(
+        self, window_cache_ttl: float = 2.0, window_backend: Optional[WindowBackend] = None
+    ):
         self.sct = mss.mss()
+        self.windows = window_backend or get_window_backend()
+        # Window title -> (geometry, lookup time). Saves the window search per
+        # capture; entries expire after window_cache_ttl seconds so moves and
+        # resizes are picked up.
+        self.window_cache_ttl = window_cache_ttl
+        self._window_cache: Dict[str, Tuple[WindowGeometry, float]] = {}
+        self._writer: Optional["ScreenshotWriter"] = None
 
     def capture_screen(self, monitor: int = 1) -> Image.Image:
         """Capture entire screen/monitor.
-        
+
         Args:
             monitor: Monitor number (1 = primary, etc.)
-            
+
         Returns:
             PIL Image
         """
-        screenshot = self.sct.grab(self.sct.monitors[monitor])
-        return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+        return self.grab_screen(monitor).to_image()
+
+    def grab_screen(self, monitor: int = 1) -> "Frame":
+        """Grab a monitor without converting it.
+
+        Args:
+            monitor: Monitor number (1 = primary, etc.)
+
+        Returns:
+            Frame wrapping the raw BGRA buffer (``frame.array`` is a
+            zero-copy NumPy view; PIL conversion happens on ``to_image()``)
+        """
+        return Frame.from_screenshot(self.sct.grab(self.sct.monitors[monitor]))
+
+    def grab_region(self, left: int, top: int, width: int, height: int) -> "Frame":
+        """Grab a screen region without converting it.
+
+        Args:
+            left: X coordinate
+            top: Y coordinate
+            width: Region width
+            height: Region height
+
+        Returns:
+            Frame wrapping the raw BGRA buffer
+        """
+        monitor = {"left": left, "top": top, "width": width, "height": height}
+        return Frame.from_screenshot(self.sct.grab(monitor))
+
+    def find_window(self, window_title: str = "Godot") -> Optional[WindowGeometry]:
+        """Look up a window's geometry by title, using the cache when fresh.
+
+        Args:
+            window_title: Substring to match in window title
+
+        Returns:
+            WindowGeometry or None if no window matched
+        """
+        cached = self._window_cache.get(window_title)
+        if cached and time.monotonic() - cached[1] < self.window_cache_ttl:
+            return cached[0]
+
+        geometry = self.windows.find_window(window_title)
+        if geometry:
+            self._window_cache[window_title] = (geometry, time.monotonic())
+        else:
+            self._window_cache.pop(window_title, None)
+        return geometry
+
+    def invalidate_window_cache(self, window_title: Optional[str] = None) -> None:
+        """Forget cached geometry (for one title, or all).
+
+        Call after moving or resizing a window to avoid waiting for the TTL.
+        """
+        if window_title is None:
+            self._window_cache.clear()
+        else:
+            self._window_cache.pop(window_title, None)
+
+    def _clip_to_screen(self, geometry: WindowGeometry) -> Optional[Dict[str, int]]:
+        """Intersect a window with the virtual screen (mss monitor 0)."""
+        screen = self.sct.monitors[0]
+        left = max(geometry.left, screen["left"])
+        top = max(geometry.top, screen["top"])
+        right = min(geometry.left + geometry.width, screen["left"] + screen["width"])
+        bottom = min(geometry.top + geometry.height, screen["top"] + screen["height"])
+        if right <= left or bottom <= top:
+            return None
+        return {"left": left, "top": top, "width": right - left, "height": bottom - top}
 
     def capture_window(
-        self, 
-        window_title: str = "Godot", 
-        fallback_to_screen: bool = True
+        self, window_title: str = "Godot", fallback_to_screen: bool = True
     ) -> Optional[Image.Image]:
         """Capture specific window by title.
-        
-        Uses xdotool on Linux to find window geometry, falls back
-        to full screen capture if window not found.
-        
+
+        Finds the window through the window backend (python-xlib, or
+        xdotool as fallback), caches its geometry for ``window_cache_ttl``
+        seconds, and grabs only that region. Falls
+        back to full screen capture if the window is not found.
+
         Args:
             window_title: Substring to match in window title
             fallback_to_screen: Capture full screen if window not found
-            
+
         Returns:
             PIL Image or None if capture failed
         """
-        try:
-            # Get window ID
-            result = subprocess.run(
-                ["xdotool", "search", "--name", window_title],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if result.returncode != 0 or not result.stdout.strip():
-                if fallback_to_screen:
-                    return self.capture_screen()
-                return None
-            
-            window_id = result.stdout.strip().split("\n")[0]
-            
-            # Get window geometry
-            geo_result = subprocess.run(
-                ["xdotool", "getwindowgeometry", window_id],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            # Parse geometry (format varies, this is simplified)
-            # TODO: Parse actual window coordinates from xdotool output
-            # For now, fall back to full screen
+        for attempt in range(2):
+            geometry = self.find_window(window_title)
+            region = self._clip_to_screen(geometry) if geometry else None
+            if region is None:
+                break
+            try:
+                return self.capture_region(**region)
+            except mss.exception.ScreenShotError:
+                # Stale geometry (window moved, resized or closed): retry fresh
+                self.invalidate_window_cache(window_title)
+
+        if fallback_to_screen:
             return self.capture_screen()
-            
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            if fallback_to_screen:
-                return self.capture_screen()
-            return None
+        return None
 
     def capture_region(self, left: int, top: int, width: int, height: int) -> Image.Image:
         """Capture specific screen region.
-        
+
         Args:
             left: X coordinate
             top: Y coordinate
             width: Region width
             height: Region height
-            
+
         Returns:
             PIL Image
         """
-        monitor = {
-            "left": left,
-            "top": top,
-            "width": width,
-            "height": height
-        }
-        screenshot = self.sct.grab(monitor)
-        return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-
-    def save_screenshot(
-        self, 
-        image: Image.Image, 
-        path: Path,
-        format: str = "PNG"
-    ) -> Path:
+        return self.grab_region(left, top, width, height).to_image()
+
+    def stream(
+        self,
+        window_title: Optional[str] = None,
+        fps: float = 60.0,
+        buffer_frames: int = 120,
+        monitor: int = 1,
+    ) -> "CaptureStream":
+        """Create a CaptureStream over a window or monitor.
+
+        Args:
+            window_title: Window to follow (None = whole monitor)
+            fps: Target capture rate
+            buffer_frames: Ring buffer size
+            monitor: Monitor to use when no window is given or found
+
+        Returns:
+            CaptureStream (not started)
+        """
+        region = None
+        if window_title is not None:
+            geometry = self.find_window(window_title)
+            region = self._clip_to_screen(geometry) if geometry else None
+        if region is None:
+            region = dict(self.sct.monitors[monitor])
+        return CaptureStream(region, fps=fps, buffer_frames=buffer_frames)
+
+    def save_screenshot(self, image: Image.Image, path: Path, format: str = "PNG") -> Path:
         """Save screenshot to file.
-        
+
         Args:
             image: PIL Image to save
             path: Output file path
             format: Image format (PNG, JPEG, etc.)
-            
+
         Returns:
             Path to saved file
         """
@@ -121,12 +204,746 @@ class ScreenshotCapture:
         image.save(path, format=format)
         return path
 
-    def close(self):
-        """Release resources."""
+    @property
+    def writer(self) -> "ScreenshotWriter":
+        """Shared background writer used by :meth:`save_async`."""
+        if self._writer is None:
+            self._writer = ScreenshotWriter()
+        return self._writer
+
+    def save_async(
+        self, image: Union[Image.Image, "Frame"], path: Path, format: str = "PNG"
+    ) -> "Future[Path]":
+        """Save a screenshot on a background thread.
+
+        Goes through :attr:`writer` (PNG at compression level 1 unless
+        configured otherwise), so the caller only pays for queueing. Frames
+        from a CaptureStream must be ``copy()``-ed first, since their ring
+        slot may be reused before the write runs.
+
+        Args:
+            image: PIL Image or Frame to save
+            path: Output file path
+            format: "PNG", "QOI", "NPY" or any other Pillow format
+
+        Returns:
+            Future resolving to the saved path
+        """
+        return self.writer.submit(image, path, format=format)
+
+    def close(self) -> None:
+        """Release resources. Waits for pending :meth:`save_async` writes."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
         self.sct.close()
 
-    def __enter__(self):
+    def __enter__(self) -> "ScreenshotCapture":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+@dataclass
+class Frame:
+    """A raw captured frame (BGRA, 4 bytes per pixel, rows tightly packed).
+
+    Returned by :meth:`ScreenshotCapture.grab_screen` / ``grab_region`` and
+    by :class:`CaptureStream`. For stream frames ``data`` is a view into the
+    ring buffer; the slot is reused once ``buffer_frames`` newer frames have
+    been captured, so call :meth:`copy` to keep one.
+    """
+
+    seq: int
+    timestamp: float  # time.monotonic() at capture
+    width: int
+    height: int
+    data: memoryview
+    _image: Optional[Image.Image] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_screenshot(cls, screenshot: "mss.screenshot.ScreenShot", seq: int = 0) -> "Frame":
+        """Wrap an mss grab without copying its pixels."""
+        width, height = screenshot.size
+        return cls(seq, time.monotonic(), width, height, memoryview(screenshot.raw))
+
+    @property
+    def array(self) -> np.ndarray:
+        """Zero-copy ``(height, width, 4)`` uint8 view, channels B, G, R, A."""
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.height, self.width, 4)
+
+    def pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        """RGB value at ``(x, y)`` without converting the frame."""
+        offset = (y * self.width + x) * 4
+        b, g, r = self.data[offset : offset + 3]
+        return (r, g, b)
+
+    def to_image(self) -> Image.Image:
+        """Convert to an RGB PIL Image (done once, then cached)."""
+        if self._image is None:
+            self._image = Image.frombuffer(
+                "RGB",
+                (self.width, self.height),
+                self.data,  # type: ignore[arg-type]  # PIL reads any buffer
+                "raw",
+                "BGRX",
+                0,
+                1,
+            )
+        return self._image
+
+    def copy(self) -> "Frame":
+        """Detach from the ring buffer."""
+        return Frame(
+            self.seq, self.timestamp, self.width, self.height, memoryview(bytearray(self.data))
+        )
+
+
+class CaptureStream:
+    """Capture a screen region continuously on a background thread.
+
+    Each grab is copied into a ring of preallocated buffers, so memory
+    stays bounded however long the stream runs. mss still allocates a
+    buffer for every grab; only the retained frames are preallocated.
+
+    Ticks are scheduled against absolute deadlines. If a grab overruns,
+    missed ticks are skipped (and counted in ``missed_ticks``) rather than
+    bursting to catch up.
+
+    Example:
+        with capture.stream("Godot", fps=60) as stream:
+            runner.run_until("TRANSITION_DONE", timeout=5)
+            for frame in stream.frames(since=0, timeout=0):
+                check(frame)
+    """
+
+    def __init__(self, region: Dict[str, int], fps: float = 60.0, buffer_frames: int = 120):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        if buffer_frames < 2:
+            raise ValueError("buffer_frames must be at least 2")
+        self.region = {key: int(region[key]) for key in ("left", "top", "width", "height")}
+        self.fps = fps
+        self.width = self.region["width"]
+        self.height = self.region["height"]
+
+        frame_size = self.width * self.height * 4
+        self._buffers = [bytearray(frame_size) for _ in range(buffer_frames)]
+        self._views = [memoryview(buf) for buf in self._buffers]
+        self._seqs: List[int] = [-1] * buffer_frames
+        self._stamps: List[float] = [0.0] * buffer_frames
+        self._next_seq = 0
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.missed_ticks = 0
+        self.error: Optional[BaseException] = None
+
+    # -- Lifecycle ----------------------------------------------------------
+
+    def start(self) -> "CaptureStream":
+        """Start the capture thread."""
+        if self.running:
+            return self
+        self._stop.clear()
+        self.error = None
+        self._thread = threading.Thread(
+            target=self._capture_loop, name="capture-stream", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop capturing. Buffered frames stay readable."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        with self._cond:
+            self._cond.notify_all()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _capture_loop(self) -> None:
+        # mss keeps per-thread display handles, so the grabber lives here
+        period = 1.0 / self.fps
+        ring = len(self._buffers)
+        try:
+            with mss.mss() as sct:
+                deadline = time.monotonic()
+                while not self._stop.is_set():
+                    now = time.monotonic()
+                    if now < deadline:
+                        if self._stop.wait(deadline - now):
+                            break
+                        now = time.monotonic()
+                    elif now - deadline >= period:
+                        # Overran: skip the ticks we missed instead of bursting
+                        skipped = int((now - deadline) / period)
+                        self.missed_ticks += skipped
+                        deadline += skipped * period
+
+                    shot = sct.grab(self.region)
+                    seq = self._next_seq
+                    slot = seq % ring
+                    # Invalidate the slot before overwriting it
+                    self._seqs[slot] = -1
+                    self._buffers[slot][:] = shot.raw
+                    with self._cond:
+                        self._stamps[slot] = now
+                        self._seqs[slot] = seq
+                        self._next_seq = seq + 1
+                        self._cond.notify_all()
+                    deadline += period
+        except Exception as exc:
+            self.error = exc
+        finally:
+            with self._cond:
+                self._cond.notify_all()
+
+    # -- Reading ------------------------------------------------------------
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next captured frame will get."""
+        return self._next_seq
+
+    def _frame(self, seq: int) -> Optional[Frame]:
+        slot = seq % len(self._buffers)
+        if self._seqs[slot] != seq:
+            return None
+        return Frame(seq, self._stamps[slot], self.width, self.height, self._views[slot])
+
+    def get(self, seq: int) -> Optional[Frame]:
+        """Frame ``seq`` if it is still in the ring."""
+        with self._cond:
+            return self._frame(seq)
+
+    def latest(self, timeout: Optional[float] = 0.0) -> Optional[Frame]:
+        """Most recent frame, waiting up to ``timeout`` for the first one."""
+        with self._cond:
+            if self._next_seq == 0 and timeout != 0.0:
+                self._cond.wait_for(lambda: self._next_seq > 0 or not self.running, timeout)
+            if self._next_seq == 0:
+                return None
+            return self._frame(self._next_seq - 1)
+
+    def frames(
+        self, since: Optional[int] = None, timeout: Optional[float] = None
+    ) -> Iterator[Frame]:
+        """Iterate frames in capture order.
+
+        Args:
+            since: First sequence number to yield (None = next new frame).
+                Frames that already left the ring are skipped.
+            timeout: Seconds to wait for each new frame; None waits until the
+                stream stops, 0 yields only what is already buffered
+
+        Yields:
+            Frame
+        """
+        seq = self._next_seq if since is None else since
+        while True:
+            with self._cond:
+                if seq >= self._next_seq:
+                    if timeout == 0 or not self.running:
+                        return
+                    if not self._cond.wait_for(
+                        lambda: self._next_seq > seq or not self.running, timeout
+                    ):
+                        return
+                    if seq >= self._next_seq:
+                        return
+                oldest = max(0, self._next_seq - len(self._buffers) + 1)
+                seq = max(seq, oldest)
+                frame = self._frame(seq)
+            seq += 1
+            if frame is not None:
+                yield frame
+
+    def measured_fps(self) -> float:
+        """Capture rate over the frames currently in the ring."""
+        with self._cond:
+            newest = self._frame(self._next_seq - 1) if self._next_seq else None
+            oldest_seq = max(0, self._next_seq - len(self._buffers) + 1)
+            oldest = self._frame(oldest_seq)
+        if newest is None or oldest is None or newest.seq == oldest.seq:
+            return 0.0
+        return (newest.seq - oldest.seq) / (newest.timestamp - oldest.timestamp)
+
+    def __enter__(self) -> "CaptureStream":
+        return self.start()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.stop()
+
+
+_EXTENSIONS = {
+    "png": ".png",
+    "qoi": ".qoi",
+    "npy": ".npy",
+    "bmp": ".bmp",
+    "jpeg": ".jpg",
+    "webp": ".webp",
+}
+
+
+def _qoi_supported() -> bool:
+    Image.init()
+    return "QOI" in Image.SAVE
+
+
+class ScreenshotWriter:
+    """Persist screenshots on background threads.
+
+    zlib and the image encoders release the GIL, so a small thread pool
+    keeps encoding off the capture thread. ``max_pending`` bounds memory:
+    once that many images are queued, :meth:`submit` blocks (back-pressure)
+    or, with ``block=False``, raises ``queue.Full``.
+
+    With ``batch_size`` > 1, submitted images are handed to the pool in
+    batches (one task per batch), which keeps per-frame overhead in tight
+    capture loops to a list append. :meth:`flush` dispatches a partial batch
+    and waits for everything queued so far.
+
+    Formats:
+        png: zlib, ``compress_level`` 0-9 (1 is several times faster than
+            Pillow's default 6 for slightly larger files)
+        qoi: needs a Pillow with QOI save support. Pillow's QOI encoder
+            is pure Python and much slower than png level 1, so only use it
+            when the consumer needs QOI files
+        npy: raw array via ``numpy.save``, no encoding at all. Frames are
+            stored as captured (BGRA); PIL images as RGB(A)
+        Anything else is passed to Pillow as-is.
+
+    Example:
+        with ScreenshotWriter(format="qoi", workers=2) as writer:
+            for frame in stream.frames(since=0, timeout=0):
+                writer.submit(frame.copy(), out_dir / f"{frame.seq:05d}")
+    """
+
+    def __init__(
+        self,
+        format: str = "png",
+        compress_level: int = 1,
+        workers: int = 2,
+        max_pending: int = 64,
+        batch_size: int = 1,
+    ):
+        if batch_size > max_pending:
+            # A partial batch would hold every slot and submit() would wait forever
+            raise ValueError("batch_size must not exceed max_pending")
+        self.format = self._check_format(format)
+        self.compress_level = compress_level
+        self.batch_size = max(1, batch_size)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot-writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._batch: List[Tuple[Union[Image.Image, Frame], Path, str, "Future[Path]"]] = []
+        self._pending: "set[Future[Path]]" = set()
+        self.written = 0
+        self.bytes_written = 0
+        self.errors = 0
+
+    @staticmethod
+    def _check_format(format: str) -> str:
+        format = format.lower()
+        if format == "jpg":
+            format = "jpeg"
+        if format == "qoi" and not _qoi_supported():
+            raise ValueError("This Pillow build cannot write QOI; use png or npy")
+        return format
+
+    def submit(
+        self,
+        image: Union[Image.Image, Frame],
+        path: Path,
+        format: Optional[str] = None,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> "Future[Path]":
+        """Queue an image for writing.
+
+        Args:
+            image: PIL Image or Frame (must not be modified until written)
+            path: Output path; the format's extension is added if missing
+            format: Override the writer's format for this image
+            block: Wait for a free slot when the queue is full
+            timeout: Max seconds to wait for a slot
+
+        Returns:
+            Future resolving to the written path
+
+        Raises:
+            queue.Full: If no slot frees up (``block=False`` or timeout)
+        """
+        format = self.format if format is None else self._check_format(format)
+        path = Path(path)
+        if not path.suffix:
+            path = path.with_suffix(_EXTENSIONS.get(format, "." + format))
+
+        if not self._slots.acquire(blocking=False):
+            # Hand the partial batch to the pool before waiting on its slots
+            self._dispatch_partial()
+            if not block or not self._slots.acquire(timeout=timeout):
+                raise queue.Full("Screenshot writer queue is full")
+
+        future: "Future[Path]" = Future()
+        future.add_done_callback(self._release)
+        with self._lock:
+            self._pending.add(future)
+            self._batch.append((image, path, format, future))
+            if len(self._batch) < self.batch_size:
+                return future
+            batch, self._batch = self._batch, []
+        self._pool.submit(self._write_batch, batch)
+        return future
+
+    def submit_many(
+        self, items: Sequence[Tuple[Union[Image.Image, Frame], Path]]
+    ) -> List["Future[Path]"]:
+        """Queue several ``(image, path)`` pairs and dispatch them together."""
+        futures = [self.submit(image, path) for image, path in items]
+        self._dispatch_partial()
+        return futures
+
+    def _release(self, future: "Future[Path]") -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _dispatch_partial(self) -> None:
+        with self._lock:
+            batch, self._batch = self._batch, []
+        if batch:
+            self._pool.submit(self._write_batch, batch)
+
+    def _write_batch(
+        self, batch: List[Tuple[Union[Image.Image, Frame], Path, str, "Future[Path]"]]
+    ) -> None:
+        for image, path, format, future in batch:
+            try:
+                size = self._write(image, path, format)
+            except Exception as exc:
+                with self._lock:
+                    self.errors += 1
+                future.set_exception(exc)
+                continue
+            with self._lock:
+                self.written += 1
+                self.bytes_written += size
+            future.set_result(path)
+
+    def _write(self, image: Union[Image.Image, Frame], path: Path, format: str) -> int:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if format == "npy":
+            array = image.array if isinstance(image, Frame) else np.asarray(image)
+            with open(path, "wb") as f:
+                np.save(f, array, allow_pickle=False)
+        else:
+            pil_image = image.to_image() if isinstance(image, Frame) else image
+            params = {"compress_level": self.compress_level} if format == "png" else {}
+            pil_image.save(path, format=format.upper(), **params)
+        return path.stat().st_size
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Dispatch any partial batch and wait for all queued writes.
+
+        Returns:
+            True if everything finished within ``timeout``
+        """
+        self._dispatch_partial()
+        with self._lock:
+            pending = list(self._pending)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for future in pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                future.exception(timeout=remaining)
+            except FutureTimeoutError:
+                return False
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Images queued or being written."""
+        with self._lock:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Flush and stop the worker threads."""
+        self.flush()
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "ScreenshotWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+# -- Perceptual hashing -------------------------------------------------------
+
+
+def _downscale_gray(image: Union[Image.Image, Frame], width: int, height: int) -> np.ndarray:
+    """Area-average a frame down to ``(height, width)`` float32 luma."""
+    if isinstance(image, Frame):
+        bgra = image.array
+    else:
+        bgra = np.asarray(image.convert("RGB"))[..., ::-1]
+    src_h, src_w = bgra.shape[:2]
+    # Subsample large frames first; averaging ~8x8 samples per cell is plenty
+    step = max(1, min(src_h // (height * 8), src_w // (width * 8)))
+    pixels = bgra[::step, ::step, :3].astype(np.float32)
+    gray = pixels[..., 0] * 0.114 + pixels[..., 1] * 0.587 + pixels[..., 2] * 0.299
+    if gray.shape[0] < height or gray.shape[1] < width:
+        # Smaller than the grid: repeat pixels so every cell gets at least one
+        size = (max(gray.shape[1], width), max(gray.shape[0], height))
+        gray = np.asarray(Image.fromarray(gray).resize(size, Image.Resampling.NEAREST))
+    rows = np.linspace(0, gray.shape[0], height + 1).astype(int)[:-1]
+    cols = np.linspace(0, gray.shape[1], width + 1).astype(int)[:-1]
+    sums = np.add.reduceat(np.add.reduceat(gray, rows, axis=0), cols, axis=1)
+    counts = np.outer(
+        np.diff(np.append(rows, gray.shape[0])), np.diff(np.append(cols, gray.shape[1]))
+    )
+    cells: np.ndarray = sums / counts
+    return cells
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+def average_hash(image: Union[Image.Image, Frame], hash_size: int = 8) -> int:
+    """aHash: one bit per cell, set when the cell is brighter than the mean."""
+    cells = _downscale_gray(image, hash_size, hash_size)
+    return _bits_to_int(cells > cells.mean())
+
+
+def difference_hash(image: Union[Image.Image, Frame], hash_size: int = 8) -> int:
+    """dHash: one bit per cell, set when brighter than its right neighbour."""
+    cells = _downscale_gray(image, hash_size + 1, hash_size)
+    return _bits_to_int(cells[:, 1:] > cells[:, :-1])
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return bin(a ^ b).count("1")
+
+
+_HASHERS = {"ahash": average_hash, "dhash": difference_hash}
+
+
+@dataclass
+class HashEntry:
+    """One stored screenshot in a :class:`ScreenshotStore`."""
+
+    hash: int
+    path: Optional[str] = None  # Relative to the store directory
+    verdict: Any = None  # JSON-serializable analysis result
+    hits: int = 0  # Times a later frame matched this entry
+    created: float = 0.0  # time.time()
+
+
+class ScreenshotStore:
+    """Content-addressed screenshot store keyed by perceptual hash.
+
+    Frames whose hash is within ``threshold`` bits of a stored entry count
+    as duplicates: they are not written again, and any verdict recorded for
+    the entry can be reused instead of re-running analysis. Entries are kept
+    in LRU order and the least recently matched are evicted (with their
+    files) beyond ``max_entries``.
+
+    With a ``directory`` the images are written there through a
+    ScreenshotWriter and an ``index.json`` lets a later session reuse the
+    hashes and verdicts.
+
+    Example:
+        store = ScreenshotStore("test_outputs/frames", threshold=4)
+        entry, is_new = store.add(capture.grab_screen())
+        if entry.verdict is None:
+            store.set_verdict(entry, analyze(entry))
+        store.close()
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        threshold: int = 4,
+        max_entries: int = 1024,
+        method: str = "dhash",
+        hash_size: int = 8,
+        writer: Optional[ScreenshotWriter] = None,
+    ):
+        if method not in _HASHERS:
+            raise ValueError(f"Unknown hash method: {method}")
+        self.directory = Path(directory) if directory is not None else None
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.method = method
+        self.hash_size = hash_size
+        self._writer = writer
+        self._owns_writer = writer is None
+        self._entries: "OrderedDict[int, HashEntry]" = OrderedDict()
+        self._writes: Dict[int, "Future[Path]"] = {}  # Hash -> write still in flight
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load_index(self.directory)
+
+    # -- Hashing / lookup ---------------------------------------------------
+
+    def hash(self, image: Union[Image.Image, Frame]) -> int:
+        """Perceptual hash of ``image`` with this store's method."""
+        return _HASHERS[self.method](image, self.hash_size)
+
+    def _nearest(self, value: int) -> Optional[HashEntry]:
+        entry = self._entries.get(value)
+        if entry is None and self.threshold > 0:
+            best = self.threshold + 1
+            for candidate in self._entries.values():
+                distance = hamming_distance(value, candidate.hash)
+                if distance < best:
+                    entry, best = candidate, distance
+        return entry
+
+    def lookup(self, image: Union[Image.Image, Frame, int]) -> Optional[HashEntry]:
+        """Stored entry matching ``image`` (or a precomputed hash), if any."""
+        value = image if isinstance(image, int) else self.hash(image)
+        with self._lock:
+            entry = self._nearest(value)
+            if entry is not None:
+                self._entries.move_to_end(entry.hash)
+            return entry
+
+    def get_verdict(self, image: Union[Image.Image, Frame, int]) -> Any:
+        """Cached verdict for a matching frame, or None."""
+        entry = self.lookup(image)
+        return entry.verdict if entry else None
+
+    # -- Updates ------------------------------------------------------------
+
+    def add(self, image: Union[Image.Image, Frame], verdict: Any = None) -> Tuple[HashEntry, bool]:
+        """Store ``image`` unless a near-identical one is already stored.
+
+        Args:
+            image: Frame or PIL Image (stream frames must be ``copy()``-ed)
+            verdict: Optional verdict to record for a new entry
+
+        Returns:
+            (entry, is_new). For duplicates ``entry`` is the existing one
+        """
+        value = self.hash(image)
+        with self._lock:
+            entry = self._nearest(value)
+            if entry is not None:
+                entry.hits += 1
+                self._entries.move_to_end(entry.hash)
+                return entry, False
+
+            entry = HashEntry(hash=value, verdict=verdict, created=time.time())
+            if self.directory is not None:
+                entry.path = f"{value:0{(self.hash_size * self.hash_size + 3) // 4}x}.png"
+            self._entries[value] = entry
+            evicted = self._evict()
+
+        if self.directory is not None and entry.path is not None:
+            future = self.writer.submit(image, self.directory / entry.path, format="png")
+            with self._lock:
+                self._writes[value] = future
+            future.add_done_callback(lambda done: self._write_done(value, done))
+        for old in evicted:
+            self._delete_file(old)
+        return entry, True
+
+    def set_verdict(self, entry: Union[HashEntry, int], verdict: Any) -> None:
+        """Record an analysis result for an entry (or hash)."""
+        value = entry.hash if isinstance(entry, HashEntry) else entry
+        with self._lock:
+            stored = self._entries.get(value)
+            if stored is not None:
+                stored.verdict = verdict
+
+    def _evict(self) -> List[HashEntry]:
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            _, old = self._entries.popitem(last=False)
+            evicted.append(old)
+        return evicted
+
+    def _write_done(self, value: int, future: "Future[Path]") -> None:
+        with self._lock:
+            if self._writes.get(value) is future:
+                del self._writes[value]
+
+    def _delete_file(self, entry: HashEntry) -> None:
+        with self._lock:
+            write = self._writes.pop(entry.hash, None)
+        if write is not None:
+            # Unlinking before the write lands would leave an orphan file
+            write.exception()
+        if self.directory is not None and entry.path:
+            try:
+                (self.directory / entry.path).unlink()
+            except FileNotFoundError:
+                pass
+
+    # -- Persistence --------------------------------------------------------
+
+    @property
+    def writer(self) -> ScreenshotWriter:
+        if self._writer is None:
+            self._writer = ScreenshotWriter()
+        return self._writer
+
+    def _load_index(self, directory: Path) -> None:
+        index_path = directory / self.INDEX_FILE
+        try:
+            data = json.loads(index_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return
+        if data.get("method") != self.method or data.get("hash_size") != self.hash_size:
+            return  # Hashes are not comparable; start fresh
+        for item in data.get("entries", []):
+            entry = HashEntry(**{**item, "hash": int(item["hash"], 16)})
+            self._entries[entry.hash] = entry
+        for old in self._evict():
+            self._delete_file(old)
+
+    def save_index(self) -> None:
+        """Write ``index.json`` (atomically), oldest entry first."""
+        if self.directory is None:
+            return
+        with self._lock:
+            entries = [{**asdict(e), "hash": f"{e.hash:x}"} for e in self._entries.values()]
+        data = {"method": self.method, "hash_size": self.hash_size, "entries": entries}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.directory / self.INDEX_FILE)
+
+    def close(self) -> None:
+        """Finish pending writes and save the index."""
+        if self._writer is not None:
+            if self._owns_writer:
+                self._writer.close()
+            else:
+                self._writer.flush()
+        self.save_index()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, image: Union[Image.Image, Frame, int]) -> bool:
+        return self.lookup(image) is not None
+
+    def __enter__(self) -> "ScreenshotStore":
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         self.close()
@@ -0,0 +1,321 @@
+"""In-engine input injection through the warm driver.
+
+Events are described as JSON, scheduled by frame and fed to the running
+scene with ``Input.parse_input_event``, so tests need no display, window
+focus or screen coordinates. Positions are viewport coordinates.
+
+:class:`BridgeInput` mirrors :class:`InputInjector`; delays are expressed
+in frames (``wait()`` converts seconds at the runner's fixed FPS).
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .bridge import BridgeClient, BridgeError
+
+BUTTONS = {"left": 1, "right": 2, "middle": 3}
+WHEEL_UP = 4
+WHEEL_DOWN = 5
+
+# pyautogui key names -> Godot key names (OS.find_keycode_from_string)
+_KEY_NAMES = {
+    "enter": "Enter",
+    "return": "Enter",
+    "esc": "Escape",
+    "escape": "Escape",
+    "space": "Space",
+    " ": "Space",
+    "tab": "Tab",
+    "\t": "Tab",
+    "\n": "Enter",
+    "backspace": "Backspace",
+    "delete": "Delete",
+    "del": "Delete",
+    "insert": "Insert",
+    "home": "Home",
+    "end": "End",
+    "pageup": "PageUp",
+    "pagedown": "PageDown",
+    "up": "Up",
+    "down": "Down",
+    "left": "Left",
+    "right": "Right",
+    "ctrl": "Ctrl",
+    "ctrlleft": "Ctrl",
+    "ctrlright": "Ctrl",
+    "shift": "Shift",
+    "shiftleft": "Shift",
+    "shiftright": "Shift",
+    "alt": "Alt",
+    "altleft": "Alt",
+    "altright": "Alt",
+    "win": "Meta",
+    "command": "Meta",
+    "meta": "Meta",
+}
+
+_MODIFIER_KEYS = {"Ctrl": "ctrl", "Shift": "shift", "Alt": "alt", "Meta": "meta"}
+
+
+def godot_key_name(key: str) -> str:
+    """Translate a pyautogui-style key name to Godot's name for it."""
+    lowered = key.lower()
+    if lowered in _KEY_NAMES:
+        return _KEY_NAMES[lowered]
+    if len(key) == 1:
+        return key.upper()
+    if lowered.startswith("f") and lowered[1:].isdigit():
+        return lowered.upper()
+    return key[:1].upper() + key[1:]
+
+
+class BridgeInput:
+    """Frame-accurate input for scenes run by :class:`WarmGodotRunner`.
+
+    Outside :meth:`batch` every call is sent immediately and returns once
+    the driver has dispatched it. Inside a batch, calls only queue events;
+    the whole batch goes out in one request when the block exits. A
+    :meth:`recorder` (no client) only queues, for ``run_scene(input=...)``.
+
+    Example:
+        runner.start(project)
+        done = runner.start_scene("main.tscn", frames=120)
+        inp = runner.input()
+        with inp.batch():
+            inp.wait_frames(5)
+            inp.click(640, 345)
+            inp.wait(0.5)
+            inp.type_text("hello")
+        result = runner.finish_scene(done)
+
+        # Or schedule everything up front, relative to the scene's first frame
+        script = BridgeInput.recorder()
+        script.wait_frames(10)
+        script.key_press("space")
+        runner.run_scene("main.tscn", frames=60, input=script)
+    """
+
+    def __init__(self, client: Optional[BridgeClient], fps: int = 60, timeout: float = 10.0):
+        self.client = client
+        self.fps = fps
+        self.timeout = timeout
+        self.events: List[Dict[str, Any]] = []
+        self.frame = 0  # Offset for the next queued event
+        self._batching = 0
+        self._modifiers: List[str] = []  # Held modifier keys
+        self._buttons = 0  # Held mouse button mask
+        self._position = (0.0, 0.0)
+
+    @classmethod
+    def recorder(cls, fps: int = 60) -> "BridgeInput":
+        """Queue-only instance whose events are sent with a scene run."""
+        return cls(None, fps=fps)
+
+    # -- Batching -----------------------------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator["BridgeInput"]:
+        """Collect calls and send them as one request on exit."""
+        self._batching += 1
+        try:
+            yield self
+        finally:
+            self._batching -= 1
+        if self._batching == 0 and self.client is not None:
+            self.flush()
+
+    def take_events(self) -> List[Dict[str, Any]]:
+        """Remove and return the queued events (e.g. for ``run_scene(input=...)``)."""
+        events, self.events = self.events, []
+        self.frame = 0
+        return events
+
+    def flush(self, wait: bool = True) -> Optional[Dict[str, Any]]:
+        """Send queued events.
+
+        The request covers ``self.frame`` frames, so with ``wait`` a trailing
+        :meth:`wait` also blocks until that many frames have passed.
+
+        Args:
+            wait: Block until the last event has been dispatched
+
+        Returns:
+            Driver response, or None if nothing was queued
+        """
+        if self.client is None:
+            raise RuntimeError("Recorder has no bridge client; pass it to run_scene(input=...)")
+        if not self.events and not self.frame:
+            return None
+        span = self.frame  # Trailing waits count too
+        events = self.take_events()
+        # Leave room for the frames the events span
+        timeout = self.timeout + span / max(self.fps, 1)
+        response = self.client.request(
+            "inject_input", events=events, frames=span, wait=wait
+        ).result(timeout=timeout)
+        if not response.get("success", False):
+            raise BridgeError(response.get("error", "inject_input failed"))
+        return response
+
+    def _add(self, event: Dict[str, Any]) -> None:
+        event["frame"] = self.frame
+        if self._modifiers and event["type"] != "action":
+            event["modifiers"] = list(self._modifiers)
+        self.events.append(event)
+
+    def _done(self) -> None:
+        if self._batching == 0 and self.client is not None:
+            self.flush()
+
+    # -- Timing -------------------------------------------------------------
+
+    def wait_frames(self, frames: int) -> None:
+        """Delay the following events by ``frames``."""
+        self.frame += frames
+        self._done()
+
+    def wait(self, seconds: float) -> None:
+        """Delay the following events by ``seconds`` of game time."""
+        self.wait_frames(round(seconds * self.fps))
+
+    # -- Mouse --------------------------------------------------------------
+
+    def _motion(self, x: float, y: float) -> None:
+        relative = (x - self._position[0], y - self._position[1])
+        self._position = (x, y)
+        self._add(
+            {
+                "type": "mouse_motion",
+                "position": [x, y],
+                "relative": list(relative),
+                "button_mask": self._buttons,
+            }
+        )
+
+    def _button(self, x: float, y: float, button: int, pressed: bool, **extra: Any) -> None:
+        mask = 1 << (button - 1)
+        self._buttons = self._buttons | mask if pressed else self._buttons & ~mask
+        self._add(
+            {
+                "type": "mouse_button",
+                "position": [x, y],
+                "button": button,
+                "pressed": pressed,
+                "button_mask": self._buttons,
+                **extra,
+            }
+        )
+
+    def click(self, x: int, y: int, button: str = "left") -> None:
+        """Move to (x, y) and press + release a mouse button."""
+        index = BUTTONS[button]
+        self._motion(x, y)
+        self._button(x, y, index, True)
+        self._button(x, y, index, False)
+        self._done()
+
+    def double_click(self, x: int, y: int, button: str = "left") -> None:
+        index = BUTTONS[button]
+        self._motion(x, y)
+        self._button(x, y, index, True)
+        self._button(x, y, index, False)
+        self._button(x, y, index, True, double_click=True)
+        self._button(x, y, index, False)
+        self._done()
+
+    def mouse_down(self, button: str = "left") -> None:
+        self._button(*self._position, BUTTONS[button], True)
+        self._done()
+
+    def mouse_up(self, button: str = "left") -> None:
+        self._button(*self._position, BUTTONS[button], False)
+        self._done()
+
+    def move_to(self, x: int, y: int, duration: float = 0.0) -> None:
+        """Move the pointer, interpolating one motion event per frame over ``duration``."""
+        steps = max(1, round(duration * self.fps))
+        start_x, start_y = self._position
+        for step in range(1, steps + 1):
+            if step > 1:
+                self.frame += 1
+            t = step / steps
+            self._motion(start_x + (x - start_x) * t, start_y + (y - start_y) * t)
+        self._done()
+
+    def scroll(self, clicks: int, x: Optional[int] = None, y: Optional[int] = None) -> None:
+        """Scroll the wheel (positive = up) at (x, y) or the current position."""
+        if x is not None and y is not None:
+            self._motion(x, y)
+        button = WHEEL_UP if clicks > 0 else WHEEL_DOWN
+        for _ in range(abs(clicks)):
+            self._button(*self._position, button, True)
+            self._button(*self._position, button, False)
+        self._done()
+
+    # -- Keyboard -----------------------------------------------------------
+
+    def _key(self, key: str, pressed: bool, unicode: int = 0) -> None:
+        name = godot_key_name(key)
+        modifier = _MODIFIER_KEYS.get(name)
+        if modifier and pressed and modifier not in self._modifiers:
+            self._modifiers.append(modifier)
+        event: Dict[str, Any] = {"type": "key", "key": name, "pressed": pressed}
+        if unicode:
+            event["unicode"] = unicode
+        self._add(event)
+        if modifier and not pressed and modifier in self._modifiers:
+            self._modifiers.remove(modifier)
+
+    def key_down(self, key: str) -> None:
+        self._key(key, True)
+        self._done()
+
+    def key_up(self, key: str) -> None:
+        self._key(key, False)
+        self._done()
+
+    def key_press(self, key: str) -> None:
+        """Press a key and release it on the next frame.
+
+        A press released in the same frame is never seen by
+        ``Input.is_action_just_pressed``.
+        """
+        self._key(key, True)
+        self.frame += 1
+        self._key(key, False)
+        self._done()
+
+    def hotkey(self, *keys: str) -> None:
+        """Press keys in order, release in reverse on the next frame (e.g. "ctrl", "s")."""
+        for key in keys:
+            self._key(key, True)
+        self.frame += 1
+        for key in reversed(keys):
+            self._key(key, False)
+        self._done()
+
+    def type_text(self, text: str, interval: float = 0.0) -> None:
+        """Type text; ``interval`` seconds (rounded to frames) between characters.
+
+        Each key is released one frame after its press, so characters are
+        at least a frame apart.
+        """
+        gap = round(interval * self.fps)
+        for index, char in enumerate(text):
+            if index and gap > 1:
+                self.frame += gap - 1  # The release already advanced one frame
+            self._key(char, True, unicode=ord(char))
+            self.frame += 1
+            self._key(char, False)
+        self._done()
+
+    # -- Actions ------------------------------------------------------------
+
+    def action_press(self, action: str, strength: float = 1.0) -> None:
+        """Trigger an InputMap action (e.g. "ui_accept")."""
+        self._add({"type": "action", "action": action, "pressed": True, "strength": strength})
+        self._done()
+
+    def action_release(self, action: str) -> None:
+        self._add({"type": "action", "action": action, "pressed": False})
+        self._done()
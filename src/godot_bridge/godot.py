@@ -1,11 +1,16 @@
 """Godot project and runner management."""
 
 import json
+import re
 import subprocess
 import tempfile
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import IO, Any, Callable, Deque, Dict, List, Optional, Pattern, Union
 
 
 @dataclass
@@ -14,7 +19,7 @@ class GodotProject:
 
     path: Path
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         self.path = Path(self.path)
         if not self.is_valid:
             raise ValueError(f"Not a valid Godot project: {self.path}")
@@ -36,7 +41,7 @@ class GodotProject:
             content = self.project_file.read_text()
             # Simple parse: config/name="Project Name"
             for line in content.split("\n"):
-                if 'config/name=' in line:
+                if "config/name=" in line:
                     return line.split('"')[1]
         except Exception:
             pass
@@ -52,10 +57,10 @@ class GodotProject:
 
     def read_script(self, script_path: str) -> str:
         """Read GDScript file contents.
-        
+
         Args:
             script_path: Relative path (e.g., "scripts/player.gd")
-            
+
         Returns:
             File contents as string
         """
@@ -64,11 +69,11 @@ class GodotProject:
 
     def write_script(self, script_path: str, content: str) -> Path:
         """Write GDScript file.
-        
+
         Args:
             script_path: Relative path (e.g., "scripts/player.gd")
             content: Script content
-            
+
         Returns:
             Path to written file
         """
@@ -78,23 +83,158 @@ class GodotProject:
         return full_path
 
 
+def headless_command(
+    godot_path: str,
+    project: GodotProject,
+    scene: Optional[str] = None,
+    quit_after: Optional[int] = None,
+    fixed_fps: int = 60,
+) -> List[str]:
+    """Build the command line for a headless run."""
+    cmd = [
+        godot_path,
+        "--headless",
+        "--debug",
+        "--path",
+        str(project.path),
+        "--fixed-fps",
+        str(fixed_fps),
+    ]
+
+    if quit_after:
+        cmd.extend(["--quit-after", str(quit_after)])
+
+    if scene:
+        cmd.append(scene)
+
+    return cmd
+
+
+def display_command(
+    godot_path: str, project: GodotProject, scene: Optional[str] = None
+) -> List[str]:
+    """Build the command line for a run with display."""
+    cmd = [godot_path, "--debug", "--path", str(project.path)]
+
+    if scene:
+        cmd.append(scene)
+
+    return cmd
+
+
+@dataclass(frozen=True)
+class OutputLine:
+    """A single line of process output."""
+
+    seq: int
+    timestamp: float
+    stream: str  # "stdout" or "stderr"
+    text: str
+
+
+@dataclass(frozen=True)
+class WaitResult:
+    """Why :meth:`GodotRunner.run_until` returned."""
+
+    reason: str  # "pattern", "exit" or "timeout"
+    line: Optional[OutputLine]
+    returncode: Optional[int]
+    elapsed: float
+
+    @property
+    def matched(self) -> bool:
+        """True if the sentinel pattern was seen."""
+        return self.reason == "pattern"
+
+
+class OutputBuffer:
+    """Bounded, timestamped ring buffer of output lines.
+
+    Lines are numbered with a monotonic sequence number so readers can
+    resume from where they left off. Once ``maxlen`` lines are held the
+    oldest are evicted.
+    """
+
+    def __init__(self, maxlen: int = 10000):
+        self.maxlen = maxlen
+        self._lines: Deque[OutputLine] = deque(maxlen=maxlen)
+        self._next_seq = 0
+        self._cond = threading.Condition()
+
+    def append(self, stream: str, text: str) -> OutputLine:
+        """Append a line and wake any waiting readers."""
+        with self._cond:
+            line = OutputLine(self._next_seq, time.time(), stream, text)
+            self._lines.append(line)
+            self._next_seq += 1
+            self._cond.notify_all()
+        return line
+
+    @property
+    def next_seq(self) -> int:
+        """Sequence number the next appended line will get."""
+        return self._next_seq
+
+    def since(self, seq: int) -> List[OutputLine]:
+        """Get buffered lines with sequence number >= ``seq``.
+
+        Lines already evicted from the buffer are silently skipped.
+        """
+        with self._cond:
+            if not self._lines:
+                return []
+            start = max(seq - self._lines[0].seq, 0)
+            if start >= len(self._lines):
+                return []
+            return list(islice(self._lines, start, None))
+
+    def wait_for(self, seq: int, timeout: Optional[float] = None) -> bool:
+        """Block until a line with sequence number >= ``seq`` exists.
+
+        Returns:
+            True if such a line is available, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._next_seq > seq, timeout)
+
+    def notify(self) -> None:
+        """Wake waiting readers without appending (e.g. on stream close)."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def clear(self) -> None:
+        """Drop all buffered lines. Sequence numbers keep increasing."""
+        with self._cond:
+            self._lines.clear()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+
 class GodotRunner:
-    """Run Godot projects and capture output."""
+    """Run Godot projects and capture output.
+
+    Output is drained continuously by one reader thread per pipe into a
+    bounded :class:`OutputBuffer`, so a chatty process never stalls on a
+    full OS pipe.
+    """
 
-    def __init__(self, godot_path: str = "godot"):
+    def __init__(self, godot_path: str = "godot", buffer_size: int = 10000):
         self.godot_path = godot_path
-        self.process: Optional[subprocess.Popen] = None
-        self.output: List[str] = []
-        self.errors: List[str] = []
+        self.process: Optional["subprocess.Popen[str]"] = None
+        self.buffer = OutputBuffer(buffer_size)
+        self.output: Deque[str] = deque(maxlen=buffer_size)
+        self.errors: Deque[str] = deque(maxlen=buffer_size)
+        self._readers: List[threading.Thread] = []
+        self._cursor = 0
+        self.started_at: Optional[float] = None  # time.time() of the last launch
+        self._listeners: List[Callable[[OutputLine], None]] = []
 
     def verify_godot(self) -> bool:
         """Check if Godot is installed and accessible."""
         try:
             result = subprocess.run(
-                [self.godot_path, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
+                [self.godot_path, "--version"], capture_output=True, text=True, timeout=5
             )
             return result.returncode == 0
         except Exception:
@@ -105,119 +245,227 @@ class GodotRunner:
         project: GodotProject,
         scene: Optional[str] = None,
         quit_after: Optional[int] = None,
-        fixed_fps: int = 60
-    ) -> subprocess.Popen:
+        fixed_fps: int = 60,
+    ) -> "subprocess.Popen[str]":
         """Run project in headless mode.
-        
+
         Args:
             project: GodotProject to run
             scene: Optional specific scene to run
             quit_after: Quit after N frames (for testing)
             fixed_fps: Fixed FPS for deterministic playback
-            
+
         Returns:
             Running subprocess
         """
-        cmd = [
-            self.godot_path,
-            "--headless",
-            "--debug",
-            "--path", str(project.path),
-            "--fixed-fps", str(fixed_fps)
-        ]
-        
-        if quit_after:
-            cmd.extend(["--quit-after", str(quit_after)])
-        
-        if scene:
-            cmd.append(scene)
-
-        self.process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
-        )
-        
-        return self.process
+        cmd = headless_command(self.godot_path, project, scene, quit_after, fixed_fps)
+        return self._start(cmd)
 
     def run_with_display(
-        self,
-        project: GodotProject,
-        scene: Optional[str] = None
-    ) -> subprocess.Popen:
+        self, project: GodotProject, scene: Optional[str] = None
+    ) -> "subprocess.Popen[str]":
         """Run project with display (for interactive testing).
-        
+
         Args:
             project: GodotProject to run
             scene: Optional specific scene to run
-            
+
         Returns:
             Running subprocess
         """
-        cmd = [
-            self.godot_path,
-            "--debug",
-            "--path", str(project.path)
-        ]
-        
-        if scene:
-            cmd.append(scene)
+        cmd = display_command(self.godot_path, project, scene)
+        return self._start(cmd)
 
+    def _start(self, cmd: List[str]) -> "subprocess.Popen[str]":
+        """Launch ``cmd`` and start draining its pipes."""
+        if self.process and self.is_running():
+            self.stop()
+        self.buffer.clear()
+        self.output.clear()
+        self.errors.clear()
+        self._cursor = self.buffer.next_seq
+
+        self.started_at = time.time()
         self.process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1
         )
-        
+
+        self._readers = [
+            threading.Thread(
+                target=self._drain,
+                args=(self.process.stdout, "stdout", self.output),
+                name="godot-stdout",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._drain,
+                args=(self.process.stderr, "stderr", self.errors),
+                name="godot-stderr",
+                daemon=True,
+            ),
+        ]
+        for reader in self._readers:
+            reader.start()
+
         return self.process
 
-    def get_output(self, timeout: float = 0.5) -> Dict[str, List[str]]:
-        """Get accumulated output from running process.
-        
+    def _drain(self, pipe: Optional[IO[str]], stream: str, sink: Deque[str]) -> None:
+        """Reader thread body: copy lines from ``pipe`` into the buffer."""
+        if pipe is None:
+            return
+        try:
+            for raw in iter(pipe.readline, ""):
+                text = raw.rstrip("\r\n")
+                sink.append(text)
+                line = self.buffer.append(stream, text)
+                for listener in list(self._listeners):
+                    try:
+                        listener(line)
+                    except Exception:
+                        # Keep draining the pipe; a broken listener is dropped
+                        self.remove_listener(listener)
+        except (OSError, ValueError):
+            # Pipe closed underneath us during shutdown
+            pass
+        finally:
+            self.buffer.notify()
+
+    def add_listener(self, listener: Callable[[OutputLine], None]) -> None:
+        """Call ``listener`` with every output line as it is read.
+
+        Listeners run on the pipe reader threads (one per stream, so two
+        can run at once) and should return quickly. A listener that raises
+        is removed.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[OutputLine], None]) -> None:
+        """Unregister a callback added with :meth:`add_listener`."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _join_readers(self, timeout: Optional[float] = None) -> None:
+        """Wait for reader threads to hit EOF."""
+        for reader in self._readers:
+            reader.join(timeout)
+
+    def get_output(self, timeout: float = 0.0) -> Dict[str, List[str]]:
+        """Get output produced since the previous call.
+
+        Never blocks longer than ``timeout``, and only waits at all when
+        nothing new has been buffered yet.
+
         Args:
-            timeout: Time to wait for new output
-            
+            timeout: Max time to wait if no new output is available
+
         Returns:
             Dict with 'stdout' and 'stderr' lists
         """
         if not self.process:
             return {"stdout": [], "stderr": []}
 
-        # Non-blocking read of available output
-        import select
-        
-        stdout_lines = []
-        stderr_lines = []
-        
-        if self.process.stdout:
-            ready, _, _ = select.select([self.process.stdout], [], [], timeout)
-            if ready:
-                line = self.process.stdout.readline()
-                if line:
-                    stdout_lines.append(line.strip())
-        
-        if self.process.stderr:
-            ready, _, _ = select.select([self.process.stderr], [], [], timeout)
-            if ready:
-                line = self.process.stderr.readline()
-                if line:
-                    stderr_lines.append(line.strip())
-
-        self.output.extend(stdout_lines)
-        self.errors.extend(stderr_lines)
-        
+        if timeout > 0:
+            self.buffer.wait_for(self._cursor, timeout)
+
+        lines = self.buffer.since(self._cursor)
+        if lines:
+            self._cursor = lines[-1].seq + 1
+
         return {
-            "stdout": stdout_lines,
-            "stderr": stderr_lines
+            "stdout": [line.text for line in lines if line.stream == "stdout"],
+            "stderr": [line.text for line in lines if line.stream == "stderr"],
         }
 
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Wait for the process to exit and its output to be drained.
+
+        Args:
+            timeout: Max seconds to wait (None = forever)
+
+        Returns:
+            Exit code, or None if still running after ``timeout``
+        """
+        if not self.process:
+            return None
+        try:
+            returncode = self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return None
+        self._join_readers(timeout=5)
+        return returncode
+
+    def run_until(
+        self,
+        pattern: Union[str, Pattern[str], None] = None,
+        timeout: Optional[float] = None,
+        since: int = 0,
+        poll_interval: float = 0.05,
+    ) -> WaitResult:
+        """Wait until a sentinel line appears, the process exits, or time runs out.
+
+        Whichever happens first ends the wait. The process is left running
+        when the sentinel is seen; call :meth:`stop` to collect final output.
+
+        Args:
+            pattern: Regex searched in each output line (None = wait for exit)
+            timeout: Max seconds to wait (None = no limit)
+            since: Sequence number to start searching from (default: start of run)
+            poll_interval: How often to re-check for process exit
+
+        Returns:
+            WaitResult with reason "pattern", "exit" or "timeout"
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        cursor = since
+
+        def result(reason: str, line: Optional[OutputLine] = None) -> WaitResult:
+            returncode = self.process.poll() if self.process else None
+            return WaitResult(reason, line, returncode, time.monotonic() - started)
+
+        if not self.process:
+            return result("exit")
+
+        while True:
+            exited = self.process.poll() is not None
+            if exited:
+                # Everything the process wrote is in the buffer after this
+                self._join_readers(timeout=5)
+
+            if regex is not None:
+                lines = self.buffer.since(cursor)
+                for line in lines:
+                    if regex.search(line.text):
+                        return result("pattern", line)
+                if lines:
+                    cursor = lines[-1].seq + 1
+
+            if exited:
+                return result("exit")
+
+            wait = poll_interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return result("timeout")
+                wait = min(wait, remaining)
+            self.buffer.wait_for(cursor if regex is not None else self.buffer.next_seq, wait)
+
+    def get_lines(self, since: int = 0) -> List[OutputLine]:
+        """Get buffered output lines, interleaved in arrival order.
+
+        Args:
+            since: Only return lines with seq >= this value
+
+        Returns:
+            List of OutputLine
+        """
+        return self.buffer.since(since)
+
     def stop(self) -> Dict[str, Any]:
         """Stop running process and collect final output.
-        
+
         Returns:
             Dict with 'stdout', 'stderr', 'returncode'
         """
@@ -225,19 +473,21 @@ class GodotRunner:
             return {"stdout": [], "stderr": [], "returncode": None}
 
         # Kill process
-        self.process.terminate()
-        try:
-            self.process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            self.process.kill()
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+        # Readers exit once the pipes hit EOF
+        self._join_readers(timeout=5)
 
-        # Collect remaining output
-        stdout, stderr = self.process.communicate()
-        
         return {
-            "stdout": stdout.split("\n") if stdout else [],
-            "stderr": stderr.split("\n") if stderr else [],
-            "returncode": self.process.returncode
+            "stdout": list(self.output),
+            "stderr": list(self.errors),
+            "returncode": self.process.returncode,
         }
 
     def is_running(self) -> bool:
@@ -247,5 +497,5 @@ class GodotRunner:
         return self.process.poll() is None
 
     def get_all_logs(self) -> str:
-        """Get all accumulated logs as single string."""
-        return "\n".join(self.output + self.errors)
+        """Get all buffered stdout and stderr as one string, in arrival order."""
+        return "\n".join(line.text for line in self.buffer.since(0))
@@ -1,23 +1,33 @@
 """Input injection for Godot windows using PyAutoGUI."""
 
 import time
-from typing import Optional, Tuple
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
 
-import pyautogui
+import pyautogui  # type: ignore[import-untyped]
+
+from .capture import Frame, ScreenshotCapture
+from .match import TemplateMatcher
+from .verify import Region
 
 
 class InputInjector:
     """Inject keyboard and mouse input into Godot windows."""
 
-    def __init__(self):
+    def __init__(self) -> None:
         # Fail-safe: move mouse to corner to abort
         pyautogui.FAILSAFE = True
-        # Small delay between actions for reliability
-        pyautogui.PAUSE = 0.05
+        # No implicit sleep after every call; use InputScript (or wait())
+        # when a scenario needs explicit timing
+        pyautogui.PAUSE = 0
+        # Created on first image lookup
+        self._capture: Optional[ScreenshotCapture] = None
+        self.matcher = TemplateMatcher()
 
     def click(self, x: int, y: int, button: str = "left") -> None:
         """Click at screen coordinates.
-        
+
         Args:
             x: X coordinate
             y: Y coordinate
@@ -27,7 +37,7 @@ class InputInjector:
 
     def move_to(self, x: int, y: int, duration: float = 0.0) -> None:
         """Move mouse to coordinates.
-        
+
         Args:
             x: X coordinate
             y: Y coordinate
@@ -37,7 +47,7 @@ class InputInjector:
 
     def key_press(self, key: str) -> None:
         """Press a key.
-        
+
         Args:
             key: Key name (e.g., "space", "enter", "esc", "a", "1")
         """
@@ -45,7 +55,7 @@ class InputInjector:
 
     def key_down(self, key: str) -> None:
         """Hold a key down.
-        
+
         Args:
             key: Key name
         """
@@ -53,15 +63,15 @@ class InputInjector:
 
     def key_up(self, key: str) -> None:
         """Release a key.
-        
+
         Args:
             key: Key name
         """
         pyautogui.keyUp(key)
 
-    def type_text(self, text: str, interval: float = 0.01) -> None:
+    def type_text(self, text: str, interval: float = 0.0) -> None:
         """Type text.
-        
+
         Args:
             text: Text to type
             interval: Seconds between keystrokes
@@ -70,7 +80,7 @@ class InputInjector:
 
     def hotkey(self, *keys: str) -> None:
         """Press key combination (e.g., Ctrl+C).
-        
+
         Args:
             *keys: Key names in order (e.g., "ctrl", "c")
         """
@@ -78,7 +88,7 @@ class InputInjector:
 
     def scroll(self, clicks: int, x: Optional[int] = None, y: Optional[int] = None) -> None:
         """Scroll mouse wheel.
-        
+
         Args:
             clicks: Number of clicks (positive=up, negative=down)
             x: Optional X position to scroll at
@@ -91,73 +101,256 @@ class InputInjector:
 
     def get_mouse_position(self) -> Tuple[int, int]:
         """Get current mouse position.
-        
+
         Returns:
             (x, y) tuple
         """
-        return pyautogui.position()
+        x, y = pyautogui.position()
+        return (int(x), int(y))
 
     def get_screen_size(self) -> Tuple[int, int]:
         """Get screen dimensions.
-        
+
         Returns:
             (width, height) tuple
         """
-        return pyautogui.size()
+        width, height = pyautogui.size()
+        return (int(width), int(height))
 
     def wait(self, seconds: float) -> None:
         """Sleep for duration.
-        
+
         Args:
             seconds: Time to sleep
         """
         time.sleep(seconds)
 
+    def script(self) -> "InputScript":
+        """Start an empty InputScript."""
+        return InputScript()
+
     def find_on_screen(
-        self, 
-        image_path: str, 
+        self,
+        image_path: str,
         confidence: float = 0.9,
-        grayscale: bool = False
+        grayscale: bool = False,
+        region: Optional[Region] = None,
+        frame: Optional[Frame] = None,
     ) -> Optional[Tuple[int, int, int, int]]:
         """Find image on screen.
-        
+
+        Uses :class:`TemplateMatcher` (cached template, pyramid search)
+        instead of pyautogui.locateOnScreen.
+
         Args:
             image_path: Path to image to search for
             confidence: Match confidence (0.0-1.0)
-            grayscale: Convert to grayscale for matching
-            
+            grayscale: Ignored; matching always runs on luma
+            region: (left, top, width, height) in screen coordinates
+            frame: Already captured primary-monitor frame to search
+                instead of grabbing a new one
+
         Returns:
             (left, top, width, height) of match or None
         """
+        if self._capture is None:
+            self._capture = ScreenshotCapture()
+        monitor = self._capture.sct.monitors[1]
+        if frame is None:
+            frame = self._capture.grab_screen()
+
+        search_region = None
+        if region is not None:
+            left, top, width, height = region
+            search_region = (left - monitor["left"], top - monitor["top"], width, height)
         try:
-            location = pyautogui.locateOnScreen(
-                image_path, 
-                confidence=confidence,
-                grayscale=grayscale
-            )
-            return location if location else None
-        except Exception:
+            match = self.matcher.find(frame, image_path, search_region, confidence)
+        except (OSError, ValueError):
+            return None
+        if match is None:
             return None
+        return (match.left + monitor["left"], match.top + monitor["top"], match.width, match.height)
 
     def click_image(
-        self, 
-        image_path: str, 
+        self,
+        image_path: str,
         confidence: float = 0.9,
-        button: str = "left"
+        button: str = "left",
+        region: Optional[Region] = None,
     ) -> bool:
         """Click on image if found on screen.
-        
+
         Args:
             image_path: Path to image to click
             confidence: Match confidence
             button: Mouse button
-            
+            region: Optional (left, top, width, height) to search in
+
         Returns:
             True if clicked, False if not found
         """
-        location = self.find_on_screen(image_path, confidence)
+        location = self.find_on_screen(image_path, confidence, region=region)
         if location:
-            center = pyautogui.center(location)
-            self.click(center.x, center.y, button)
+            left, top, width, height = location
+            self.click(left + width // 2, top + height // 2, button)
             return True
         return False
+
+
+@dataclass
+class ScriptAction:
+    """One scheduled step of an InputScript."""
+
+    at: float  # Seconds from script start
+    name: str
+    call: Callable[[], Any] = field(repr=False)
+
+
+@dataclass
+class ScriptResult:
+    """Timing of an executed InputScript."""
+
+    duration: float
+    lateness: List[float]  # Per action: actual start - scheduled start (s)
+
+    @property
+    def max_lateness(self) -> float:
+        return max(self.lateness, default=0.0)
+
+
+def _sleep_until(deadline: float, spin: float = 0.002) -> None:
+    """Sleep to ``deadline`` (perf_counter); spin the last ``spin`` seconds.
+
+    time.sleep overshoots by up to a scheduler tick, so the final stretch
+    is busy-waited for sub-millisecond accuracy.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > spin:
+        time.sleep(remaining - spin)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class InputScript:
+    """A timeline of input actions, executed with explicit scheduling.
+
+    Actions are appended at the script's cursor; ``wait()`` moves the
+    cursor forward and ``at()`` sets it. Nothing sleeps between actions
+    unless the script says so, and delays are measured from the script
+    start, so per-call overhead does not accumulate as drift.
+
+    Example:
+        script = (
+            injector.script()
+            .click(640, 345)
+            .wait(0.1)
+            .type("hello", interval=0.02)
+            .key("enter")
+        )
+        result = script.run()
+        print(result.duration, result.max_lateness)
+    """
+
+    def __init__(self) -> None:
+        self.actions: List[ScriptAction] = []
+        self.cursor = 0.0
+
+    def _add(self, name: str, call: Callable[[], Any]) -> "InputScript":
+        self.actions.append(ScriptAction(self.cursor, name, call))
+        return self
+
+    # -- Timing -------------------------------------------------------------
+
+    def wait(self, seconds: float) -> "InputScript":
+        """Advance the cursor: later actions start ``seconds`` later."""
+        self.cursor += seconds
+        return self
+
+    def at(self, seconds: float) -> "InputScript":
+        """Place following actions at an absolute offset from script start."""
+        self.cursor = seconds
+        return self
+
+    # -- Actions ------------------------------------------------------------
+
+    def move(self, x: int, y: int) -> "InputScript":
+        return self._add(f"move {x},{y}", lambda: pyautogui.moveTo(x, y, _pause=False))
+
+    def click(
+        self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left"
+    ) -> "InputScript":
+        """Click at (x, y), or at the current position when omitted."""
+        return self._add(
+            f"click {button} {x},{y}", lambda: pyautogui.click(x, y, button=button, _pause=False)
+        )
+
+    def mouse_down(self, button: str = "left") -> "InputScript":
+        return self._add(
+            f"mouse_down {button}", lambda: pyautogui.mouseDown(button=button, _pause=False)
+        )
+
+    def mouse_up(self, button: str = "left") -> "InputScript":
+        return self._add(
+            f"mouse_up {button}", lambda: pyautogui.mouseUp(button=button, _pause=False)
+        )
+
+    def key_down(self, key: str) -> "InputScript":
+        return self._add(f"key_down {key}", lambda: pyautogui.keyDown(key, _pause=False))
+
+    def key_up(self, key: str) -> "InputScript":
+        return self._add(f"key_up {key}", lambda: pyautogui.keyUp(key, _pause=False))
+
+    def key(self, key: str, hold: float = 0.0) -> "InputScript":
+        """Press and release a key, optionally held for ``hold`` seconds."""
+        self.key_down(key)
+        self.cursor += hold
+        return self.key_up(key)
+
+    def hotkey(self, *keys: str) -> "InputScript":
+        for key in keys:
+            self.key_down(key)
+        for key in reversed(keys):
+            self.key_up(key)
+        return self
+
+    def type(self, text: str, interval: float = 0.0) -> "InputScript":
+        """Type ``text``; each character is its own scheduled action."""
+        for char in text:
+            self._add(f"type {char!r}", partial(pyautogui.write, char, _pause=False))
+            self.cursor += interval
+        return self
+
+    def scroll(
+        self, clicks: int, x: Optional[int] = None, y: Optional[int] = None
+    ) -> "InputScript":
+        return self._add(f"scroll {clicks}", lambda: pyautogui.scroll(clicks, x, y, _pause=False))
+
+    def call(self, func: Callable[[], Any], name: str = "call") -> "InputScript":
+        """Schedule an arbitrary callable (e.g. a screenshot) on the timeline."""
+        return self._add(name, func)
+
+    # -- Execution ----------------------------------------------------------
+
+    @property
+    def duration(self) -> float:
+        """Scheduled length of the script."""
+        return max([self.cursor] + [a.at for a in self.actions])
+
+    def run(self) -> ScriptResult:
+        """Execute all actions at their scheduled offsets."""
+        pause = pyautogui.PAUSE
+        pyautogui.PAUSE = 0
+        lateness = []
+        start = time.perf_counter()
+        try:
+            for action in sorted(self.actions, key=lambda a: a.at):
+                deadline = start + action.at
+                _sleep_until(deadline)
+                lateness.append(time.perf_counter() - deadline)
+                action.call()
+        finally:
+            pyautogui.PAUSE = pause
+        return ScriptResult(time.perf_counter() - start, lateness)
+
+    def __len__(self) -> int:
+        return len(self.actions)
@@ -0,0 +1,567 @@
+"""Structured Godot logs.
+
+:class:`LogParser` turns Godot's stdout/stderr lines into typed
+:class:`LogRecord` objects (prints, warnings, errors and script errors with
+their stack frames) and indexes them by level, file and message, so checks
+like "script errors in player.gd" are lookups instead of rescans of the
+whole output. :class:`LogSubscription` streams the editor's own log from
+the bridge's ``subscribe_logs`` action.
+"""
+
+import asyncio
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+from .godot import OutputLine
+
+if TYPE_CHECKING:
+    from .bridge import BridgeClient
+    from .godot import GodotRunner
+
+PRINT = "print"
+STDERR = "stderr"  # printerr() and other unmarked stderr lines
+WARNING = "warning"
+ERROR = "error"
+SCRIPT_WARNING = "script_warning"
+SCRIPT_ERROR = "script_error"
+
+ERROR_LEVELS = (ERROR, SCRIPT_ERROR)
+WARNING_LEVELS = (WARNING, SCRIPT_WARNING)
+
+# Header prefixes Godot writes to stderr; USER_ variants come from push_error()
+# and push_warning() in some 4.x versions.
+_HEADER = re.compile(r"^(?:USER )?(SCRIPT ERROR|SCRIPT WARNING|ERROR|WARNING): ?(.*)$")
+_HEADER_LEVELS = {
+    "ERROR": ERROR,
+    "WARNING": WARNING,
+    "SCRIPT ERROR": SCRIPT_ERROR,
+    "SCRIPT WARNING": SCRIPT_WARNING,
+}
+# "   at: _ready (res://player.gd:12)" and "   [0] _ready (res://player.gd:12)"
+_FRAME = re.compile(r"^\s+(?:at:|\[\d+\])\s*(.*?)\s*\((.+):(\d+)\)\s*$")
+# "   GDScript backtrace (most recent call first):"
+_BACKTRACE = re.compile(r"^\s+\S.*backtrace", re.IGNORECASE)
+# Message prefixed with its location: "res://player.gd:12 - Invalid call"
+_LOCATED = re.compile(r"^((?:res|user)://[^:]+):(\d+) - (.*)$")
+_SCRIPT_PATHS = ("res://", "user://")
+
+
+@dataclass(frozen=True)
+class StackFrame:
+    """One ``at:`` / backtrace line of an error."""
+
+    function: str
+    file: str
+    line: int
+
+
+@dataclass
+class LogRecord:
+    """One parsed log message; continuation lines are folded into ``frames``."""
+
+    seq: int  # Position in the parser, 0-based
+    level: str
+    message: str
+    timestamp: float = 0.0
+    stream: str = "stdout"
+    source_seq: Optional[int] = None  # OutputLine.seq of the first line
+    file: Optional[str] = None  # Script location (res://...) when known
+    line: Optional[int] = None
+    function: Optional[str] = None
+    frames: List[StackFrame] = field(default_factory=list)
+
+    @property
+    def is_error(self) -> bool:
+        return self.level in ERROR_LEVELS
+
+    @property
+    def is_warning(self) -> bool:
+        return self.level in WARNING_LEVELS
+
+    @property
+    def location(self) -> str:
+        """ "file:line", or "" when unknown."""
+        return f"{self.file}:{self.line}" if self.file else ""
+
+    @classmethod
+    def from_bridge(cls, entry: Dict[str, Any], seq: int = 0) -> "LogRecord":
+        """Record from a bridge ``get_logs`` / ``subscribe_logs`` entry."""
+        level = entry.get("level", PRINT)
+        frames = [
+            StackFrame(frame.get("function", ""), frame["file"], int(frame["line"]))
+            for frame in entry.get("stack", [])
+        ]
+        return cls(
+            seq=seq,
+            level={"info": PRINT}.get(level, level),
+            message=entry.get("message", ""),
+            timestamp=float(entry.get("time", 0)) / 1000,
+            stream="editor",
+            source_seq=entry.get("seq"),
+            file=entry.get("file") or None,
+            line=entry.get("line"),
+            function=entry.get("function") or None,
+            frames=frames,
+        )
+
+
+def line_level(text: str, stream: str = "stdout") -> str:
+    """Level of a single output line, without continuation-line context."""
+    if stream != "stderr":
+        return PRINT
+    header = _HEADER.match(text)
+    return _HEADER_LEVELS[header.group(1)] if header else STDERR
+
+
+def _basename(path: str) -> str:
+    return path.rsplit("/", 1)[-1]
+
+
+class LogParser:
+    """Incremental parser and index over Godot output.
+
+    Feed it lines as they arrive (:meth:`feed`, or :meth:`update` to pull
+    what a :class:`GodotRunner` buffered since the last call). Headers on
+    stderr open a record; indented ``at:`` and backtrace lines that follow
+    on the same stream are attached to it. stdout lines are prints, even if
+    they happen to start with "ERROR:".
+
+    Example:
+        logs = LogParser()
+        runner.run_headless(project)
+        runner.run_until("TEST_COMPLETE", timeout=30)
+        logs.update(runner)
+        for record in logs.find(level="script_error", file="player.gd"):
+            print(record.location, record.message)
+    """
+
+    def __init__(self) -> None:
+        self.records: List[LogRecord] = []
+        self.cursor = 0  # Next OutputLine.seq update() reads
+        self._open: Dict[str, LogRecord] = {}  # Per stream: record taking continuation lines
+        self._by_level: Dict[str, List[int]] = {}
+        self._by_file: Dict[str, List[int]] = {}  # Full path and basename
+        self._by_message: Dict[str, List[int]] = {}
+
+    # -- Feeding ------------------------------------------------------------
+
+    def feed(self, line: OutputLine) -> Optional[LogRecord]:
+        """Parse one output line.
+
+        Returns:
+            The record the line started, or None for continuation lines
+        """
+        self.cursor = max(self.cursor, line.seq + 1)
+        return self.feed_text(line.text, line.stream, line.timestamp, line.seq)
+
+    def feed_text(
+        self,
+        text: str,
+        stream: str = "stdout",
+        timestamp: float = 0.0,
+        source_seq: Optional[int] = None,
+    ) -> Optional[LogRecord]:
+        """Parse one line of raw text from ``stream``."""
+        if stream == "stderr":
+            current = self._open.get(stream)
+            if current is not None and text[:1].isspace():
+                frame = _FRAME.match(text)
+                if frame:
+                    self._add_frame(
+                        current, StackFrame(frame.group(1), frame.group(2), int(frame.group(3)))
+                    )
+                    return None
+                if _BACKTRACE.match(text):
+                    return None
+
+            header = _HEADER.match(text)
+            if header:
+                record = self._record(
+                    _HEADER_LEVELS[header.group(1)], header.group(2), stream, timestamp, source_seq
+                )
+                located = _LOCATED.match(record.message)
+                if located:
+                    record.message = located.group(3)
+                    self._set_location(record, located.group(1), int(located.group(2)), None)
+                self._open[stream] = record
+                self.add(record)
+                return record
+            level = STDERR
+        else:
+            level = PRINT
+
+        self._open.pop(stream, None)
+        record = self._record(level, text, stream, timestamp, source_seq)
+        self.add(record)
+        return record
+
+    def feed_all(self, lines: Iterable[OutputLine]) -> List[LogRecord]:
+        """Parse several lines; returns the records they started."""
+        started = []
+        for line in lines:
+            record = self.feed(line)
+            if record is not None:
+                started.append(record)
+        return started
+
+    def update(self, runner: "GodotRunner") -> List[LogRecord]:
+        """Parse whatever ``runner`` buffered since the last update."""
+        return self.feed_all(runner.get_lines(since=self.cursor))
+
+    def add(self, record: LogRecord) -> LogRecord:
+        """Index an already-built record (e.g. :meth:`LogRecord.from_bridge`)."""
+        record.seq = len(self.records)
+        self.records.append(record)
+        self._by_level.setdefault(record.level, []).append(record.seq)
+        self._by_message.setdefault(record.message, []).append(record.seq)
+        if record.file:
+            self._index_file(record)
+        return record
+
+    def _record(
+        self, level: str, message: str, stream: str, timestamp: float, source_seq: Optional[int]
+    ) -> LogRecord:
+        return LogRecord(
+            seq=len(self.records),
+            level=level,
+            message=message,
+            timestamp=timestamp,
+            stream=stream,
+            source_seq=source_seq,
+        )
+
+    def _add_frame(self, record: LogRecord, frame: StackFrame) -> None:
+        record.frames.append(frame)
+        # The first script frame says where the error is; engine frames
+        # (push_error in variant_utility.cpp) only stand in until one shows up.
+        if record.file is None or (
+            frame.file.startswith(_SCRIPT_PATHS) and not record.file.startswith(_SCRIPT_PATHS)
+        ):
+            self._set_location(record, frame.file, frame.line, frame.function)
+
+    def _set_location(
+        self, record: LogRecord, file: str, line: int, function: Optional[str]
+    ) -> None:
+        indexed = record.seq < len(self.records) and self.records[record.seq] is record
+        if indexed and record.file:
+            self._unindex_file(record)  # Moving off an engine frame
+        record.file, record.line = file, line
+        if function is not None:
+            record.function = function
+        if indexed:
+            self._index_file(record)  # Otherwise add() indexes it
+
+    def _file_keys(self, record: LogRecord) -> Set[str]:
+        file = record.file or ""
+        return {file, _basename(file)}
+
+    def _index_file(self, record: LogRecord) -> None:
+        for key in self._file_keys(record):
+            self._by_file.setdefault(key, []).append(record.seq)
+
+    def _unindex_file(self, record: LogRecord) -> None:
+        for key in self._file_keys(record):
+            seqs = self._by_file.get(key)
+            if not seqs:
+                continue
+            # The open record is the newest one, so this is normally a pop()
+            if seqs[-1] == record.seq:
+                seqs.pop()
+            elif record.seq in seqs:
+                seqs.remove(record.seq)
+            if not seqs:
+                del self._by_file[key]
+
+    # -- Queries ------------------------------------------------------------
+
+    def find(
+        self,
+        level: Union[str, Sequence[str], None] = None,
+        file: Optional[str] = None,
+        message: Optional[str] = None,
+        contains: Optional[str] = None,
+    ) -> List[LogRecord]:
+        """Records matching every given filter, in log order.
+
+        Args:
+            level: Level or levels (e.g. "script_error", ERROR_LEVELS)
+            file: Script path ("res://player.gd") or file name ("player.gd")
+            message: Exact message text
+            contains: Substring of the message (scans the other filters' result)
+
+        Returns:
+            List of LogRecord
+        """
+        candidates: List[List[int]] = []
+        if level is not None:
+            levels = [level] if isinstance(level, str) else list(level)
+            merged: List[int] = []
+            for name in levels:
+                merged.extend(self._by_level.get(name, []))
+            candidates.append(sorted(merged) if len(levels) > 1 else merged)
+        if file is not None:
+            candidates.append(self._by_file.get(file, []))
+        if message is not None:
+            candidates.append(self._by_message.get(message, []))
+
+        if candidates:
+            candidates.sort(key=len)
+            seqs: Iterable[int] = candidates[0]
+            if len(candidates) > 1:
+                others = [set(c) for c in candidates[1:]]
+                seqs = [seq for seq in candidates[0] if all(seq in other for other in others)]
+            records: Iterable[LogRecord] = (self.records[seq] for seq in seqs)
+        else:
+            records = self.records
+
+        if contains is not None:
+            return [record for record in records if contains in record.message]
+        return list(records)
+
+    def first(self, **filters: Any) -> Optional[LogRecord]:
+        """Earliest record matching :meth:`find`'s filters."""
+        found = self.find(**filters)
+        return found[0] if found else None
+
+    def count(self, level: str) -> int:
+        """Number of records at ``level``."""
+        return len(self._by_level.get(level, []))
+
+    def errors(self, file: Optional[str] = None) -> List[LogRecord]:
+        """Errors and script errors, optionally only those located in ``file``."""
+        return self.find(level=ERROR_LEVELS, file=file)
+
+    def warnings(self, file: Optional[str] = None) -> List[LogRecord]:
+        """Warnings and script warnings, optionally only those located in ``file``."""
+        return self.find(level=WARNING_LEVELS, file=file)
+
+    def files(self) -> List[str]:
+        """Script paths (``res://``, ``user://``) that have at least one located record."""
+        return [name for name in self._by_file if name.startswith(_SCRIPT_PATHS)]
+
+    def summary(self) -> Dict[str, int]:
+        """Record count per level."""
+        return {level: len(seqs) for level, seqs in self._by_level.items()}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        return iter(self.records)
+
+
+class LogSubscription:
+    """Editor log entries pushed by the bridge as they are logged.
+
+    The bridge filters by level and regex before sending and batches what
+    each frame logged into one ``log_entries`` event. Entries queue up here
+    until read, either by iterating (blocking) or with ``async for``.
+
+    Example:
+        with client.subscribe_logs(levels=["error", "script_error"]) as errors:
+            for entry in errors:
+                print(entry["file"], entry["line"], entry["message"])
+
+        async for entry in client.subscribe_logs(pattern="^Player"):
+            ...
+    """
+
+    EVENT = "log_entries"
+
+    def __init__(
+        self,
+        client: "BridgeClient",
+        levels: Optional[Sequence[str]] = None,
+        pattern: Optional[str] = None,
+        cursor: Optional[int] = None,
+        max_queued: int = 10000,
+    ):
+        self.client = client
+        self.levels = list(levels or [])
+        self.pattern = pattern
+        self.cursor = cursor  # Next seq expected; None = start from now
+        self.id: Optional[int] = None
+        self.dropped = 0  # Entries lost in the bridge ring or to max_queued
+        self.closed = False
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._max_queued = max_queued
+        self._early: List[Dict[str, Any]] = []  # Events seen before the id is known
+        self._listeners: List[Callable[[], None]] = []  # Async wakeups
+        self._lock = threading.Lock()
+        self._arrived = threading.Condition(self._lock)
+
+    # -- Subscription -------------------------------------------------------
+
+    def subscribe(self, timeout: Optional[float] = None) -> "LogSubscription":
+        """Register with the bridge and start queueing entries."""
+        self.client.add_event_handler(self._on_event)
+        params: Dict[str, Any] = {}
+        if self.levels:
+            params["levels"] = self.levels
+        if self.pattern:
+            params["pattern"] = self.pattern
+        if self.cursor is not None:
+            params["cursor"] = self.cursor
+        future = self.client.request("subscribe_logs", **params)
+        # Runs on the reader thread before any later event is dispatched
+        future.add_done_callback(self._on_subscribed)
+        try:
+            response = future.result(timeout=self.client.timeout if timeout is None else timeout)
+        except BaseException:
+            self.client.remove_event_handler(self._on_event)
+            with self._lock:
+                self._early.clear()
+            raise
+        if not response.get("success", False):
+            from .bridge import BridgeError  # bridge imports this module
+
+            self.client.remove_event_handler(self._on_event)
+            raise BridgeError(response.get("error", "subscribe_logs failed"))
+        return self
+
+    def unsubscribe(self) -> None:
+        """Stop the stream. Entries already queued can still be read."""
+        self.client.remove_event_handler(self._on_event)
+        if self.id is not None and self.client.connected:
+            self.client.request("unsubscribe_logs", subscription=self.id)
+        with self._lock:
+            self.closed = True
+            self._arrived.notify_all()
+            listeners = list(self._listeners)
+        for notify in listeners:
+            notify()
+
+    def _on_subscribed(self, future: Any) -> None:
+        failed = future.cancelled() or future.exception() is not None
+        response = {} if failed else future.result()
+        with self._lock:
+            early, self._early = self._early, []
+            if not response.get("success"):
+                return
+            self.id = int(response["subscription"])
+            self.cursor = int(response["cursor"])
+            # Replay under the lock so later events cannot overtake these
+            accepted = [message for message in early if self._accept(message)]
+            listeners = list(self._listeners) if accepted else []
+        for notify in listeners:
+            notify()
+
+    def _on_event(self, message: Dict[str, Any]) -> None:
+        if message.get("event") == self.client.DISCONNECTED_EVENT:
+            # No more entries can arrive; wake readers so iteration ends
+            with self._lock:
+                self.closed = True
+                self._arrived.notify_all()
+                listeners = list(self._listeners)
+            for notify in listeners:
+                notify()
+            return
+        if message.get("event") != self.EVENT:
+            return
+        with self._lock:
+            if self.id is None:
+                self._early.append(message)
+                return
+            if not self._accept(message):
+                return
+            listeners = list(self._listeners)
+        for notify in listeners:
+            notify()
+
+    def _accept(self, message: Dict[str, Any]) -> bool:
+        """Queue a ``log_entries`` event if it is ours. Caller holds the lock."""
+        if int(message["subscription"]) != self.id:
+            return False
+        self.dropped += int(message.get("dropped", 0))
+        self.cursor = max(self.cursor or 0, int(message["next_cursor"]))
+        for entry in message.get("entries", []):
+            if len(self._queue) >= self._max_queued:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(entry)
+        self._arrived.notify_all()
+        return True
+
+    # -- Reading ------------------------------------------------------------
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next entry, waiting up to ``timeout`` (None = forever).
+
+        Returns None on timeout or once unsubscribed and drained.
+        """
+        with self._lock:
+            if not self._queue and not self.closed:
+                self._arrived.wait_for(lambda: self._queue or self.closed, timeout)
+            return self._queue.popleft() if self._queue else None
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Every queued entry, without waiting."""
+        with self._lock:
+            entries = list(self._queue)
+            self._queue.clear()
+        return entries
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yield entries as they arrive until unsubscribed or disconnected."""
+        while True:
+            entry = self.get(timeout=0.5)
+            if entry is not None:
+                yield entry
+            elif self.closed or not self.client.connected:
+                return
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        return self._aiter()
+
+    async def _aiter(self) -> AsyncIterator[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(wakeup.set)
+
+        with self._lock:
+            self._listeners.append(notify)
+        try:
+            while True:
+                entry = self.get(timeout=0)
+                if entry is not None:
+                    yield entry
+                    continue
+                if self.closed or not self.client.connected:
+                    return
+                wakeup.clear()
+                # An entry may have landed between get() and clear()
+                with self._lock:
+                    if self._queue or self.closed:
+                        continue
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    pass  # Recheck the connection
+        finally:
+            with self._lock:
+                self._listeners.remove(notify)
+
+    def __enter__(self) -> "LogSubscription":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.unsubscribe()
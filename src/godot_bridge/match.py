@@ -0,0 +1,385 @@
+"""Template matching on captured frames.
+
+Normalized cross-correlation (the score OpenCV calls ``TM_CCOEFF_NORMED``,
+so ``confidence`` means the same as in pyautogui) computed with NumPy FFTs
+on a coarse pyramid level, then refined at full resolution around the best
+candidates. Matching runs on luma; color is ignored.
+
+Example:
+    matcher = TemplateMatcher()
+    frame = capture.grab_screen()
+    match = matcher.find(frame, "assets/play_button.png", region=(0, 400, 1280, 320))
+    if match:
+        injector.click(*match.center)
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from PIL import Image
+
+from .capture import Frame
+from .verify import ImageLike, Region, as_rgb
+
+TemplateSource = Union[str, Path, Image.Image, np.ndarray, "Template"]
+
+_EPS = 1e-6
+
+
+@dataclass
+class Match:
+    """Location of a template in the searched image."""
+
+    left: int
+    top: int
+    width: int
+    height: int
+    score: float
+    template: str = ""
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        return (self.left + self.width // 2, self.top + self.height // 2)
+
+    @property
+    def box(self) -> Tuple[int, int, int, int]:
+        """(left, top, width, height), as pyautogui.locateOnScreen returns."""
+        return (self.left, self.top, self.width, self.height)
+
+
+def _gray(image: ImageLike, region: Optional[Region] = None) -> Image.Image:
+    """Luma ("L") image, cropped to ``region``.
+
+    Conversion and downsampling go through Pillow's C paths; doing them in
+    NumPy is several times slower on full-screen frames.
+    """
+    if isinstance(image, Frame):
+        img = image.to_image()
+    elif isinstance(image, Image.Image):
+        img = image if image.mode in ("L", "RGB") else image.convert("RGB")
+    else:
+        img = Image.fromarray(np.ascontiguousarray(as_rgb(image)))
+    if region is not None:
+        left, top, width, height = region
+        img = img.crop((left, top, min(left + width, img.width), min(top + height, img.height)))
+    return img if img.mode == "L" else img.convert("L")
+
+
+@dataclass
+class Template:
+    """A preprocessed template: zero-mean luma per pyramid level."""
+
+    name: str
+    width: int
+    height: int
+    levels: List[Tuple[np.ndarray, float]]  # (zero-mean template, L2 norm)
+    _spectra: Dict[Tuple[int, Tuple[int, int]], np.ndarray] = field(
+        default_factory=dict, repr=False
+    )
+
+    @classmethod
+    def from_image(cls, name: str, gray: Image.Image, min_size: int, max_levels: int) -> "Template":
+        """Build from a luma image; each level halves the previous one."""
+        width, height = gray.size
+        levels: List[Tuple[np.ndarray, float]] = []
+        level = gray
+        while True:
+            pixels = np.asarray(level, dtype=np.float32)
+            zero_mean = pixels - pixels.mean()
+            norm = float(np.sqrt((zero_mean * zero_mean).sum()))
+            if norm < _EPS:
+                if not levels:
+                    raise ValueError(f"Template {name!r} is a flat color and cannot be matched")
+                break
+            levels.append((zero_mean, norm))
+            if len(levels) >= max_levels or min(level.size) // 2 < min_size:
+                break
+            level = level.reduce(2)
+        return cls(name, width, height, levels)
+
+    def spectrum(self, level: int, shape: Tuple[int, int]) -> np.ndarray:
+        """Conjugate FFT of the template padded to ``shape`` (cached)."""
+        key = (level, shape)
+        spectrum = self._spectra.get(key)
+        if spectrum is None:
+            spectrum = np.conj(np.fft.rfft2(self.levels[level][0], s=shape))
+            self._spectra[key] = spectrum
+        return spectrum
+
+
+class _SearchImage:
+    """Luma pyramid of one searched image, with lazily built FFTs and sums."""
+
+    def __init__(self, gray: Image.Image):
+        self._images = [gray]
+        self.levels: List[np.ndarray] = []  # uint8 luma per level
+        self._spectra: Dict[int, np.ndarray] = {}
+        self._integrals: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def level(self, index: int) -> np.ndarray:
+        while len(self.levels) <= index:
+            if len(self._images) <= len(self.levels):
+                self._images.append(self._images[-1].reduce(2))
+            self.levels.append(np.asarray(self._images[len(self.levels)]))
+        return self.levels[index]
+
+    def spectrum(self, index: int) -> np.ndarray:
+        if index not in self._spectra:
+            self._spectra[index] = np.fft.rfft2(self.level(index))
+        return self._spectra[index]
+
+    def window_stats(self, index: int, h: int, w: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Sum and sum of squares of every h x w window (valid positions)."""
+        if index not in self._integrals:
+            img = self.level(index).astype(np.float64)
+            sums = np.pad(img.cumsum(0).cumsum(1), ((1, 0), (1, 0)))
+            squares = np.pad((img * img).cumsum(0).cumsum(1), ((1, 0), (1, 0)))
+            self._integrals[index] = (sums, squares)
+        sums, squares = self._integrals[index]
+
+        def box(table: np.ndarray) -> np.ndarray:
+            window: np.ndarray = table[h:, w:] - table[:-h, w:] - table[h:, :-w] + table[:-h, :-w]
+            return window
+
+        return box(sums), box(squares)
+
+
+class TemplateMatcher:
+    """Find templates in frames with FFT-based normalized cross-correlation.
+
+    Templates are preprocessed once (luma pyramid and FFTs) and kept in an
+    LRU cache keyed by path and modification time, so repeated lookups of
+    the same button image only pay for the search.
+
+    Args:
+        min_size: Smallest template side (px) used at the coarse level
+        max_levels: Pyramid levels (1 = full resolution only)
+        cache_size: Templates kept preprocessed
+        candidates: Coarse peaks refined at full resolution per template
+    """
+
+    def __init__(
+        self, min_size: int = 12, max_levels: int = 3, cache_size: int = 64, candidates: int = 5
+    ):
+        self.min_size = min_size
+        self.max_levels = max(1, max_levels)
+        self.cache_size = cache_size
+        self.candidates = candidates
+        self._cache: "OrderedDict[Tuple[str, int], Template]" = OrderedDict()
+
+    # -- Templates ----------------------------------------------------------
+
+    def load(self, source: TemplateSource, name: Optional[str] = None) -> Template:
+        """Preprocess a template.
+
+        Image files are cached by path and modification time. In-memory
+        images are preprocessed on every call; keep the returned Template
+        to reuse them.
+        """
+        if isinstance(source, Template):
+            return source
+        if not isinstance(source, (str, Path)):
+            return Template.from_image(
+                name or "template", _gray(source), self.min_size, self.max_levels
+            )
+
+        path = Path(source)
+        key = (str(path.resolve()), path.stat().st_mtime_ns)
+        template = self._cache.get(key)
+        if template is not None:
+            self._cache.move_to_end(key)
+            return template
+
+        with Image.open(path) as img:
+            gray = _gray(img.convert("RGB"))
+        template = Template.from_image(name or path.name, gray, self.min_size, self.max_levels)
+        self._cache[key] = template
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return template
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    # -- Search -------------------------------------------------------------
+
+    def find(
+        self,
+        image: ImageLike,
+        template: TemplateSource,
+        region: Optional[Region] = None,
+        confidence: float = 0.9,
+    ) -> Optional[Match]:
+        """Best match of ``template`` in ``image``, or None below ``confidence``.
+
+        Args:
+            image: Frame, PIL Image or RGB(A) array to search
+            template: Image path, PIL Image, array or loaded Template
+            region: (left, top, width, height) to restrict the search
+            confidence: Minimum normalized correlation (0.0-1.0)
+
+        Returns:
+            Match in ``image`` coordinates
+        """
+        matches = self.find_all(image, template, region, confidence, max_matches=1)
+        return matches[0] if matches else None
+
+    def find_all(
+        self,
+        image: ImageLike,
+        template: TemplateSource,
+        region: Optional[Region] = None,
+        confidence: float = 0.9,
+        max_matches: int = 10,
+    ) -> List[Match]:
+        """Non-overlapping matches, best first."""
+        search, offset = self._prepare(image, region)
+        return self._search(search, offset, self.load(template), confidence, max_matches)
+
+    def find_many(
+        self,
+        image: ImageLike,
+        templates: Sequence[TemplateSource],
+        region: Optional[Region] = None,
+        confidence: float = 0.9,
+    ) -> List[Optional[Match]]:
+        """Best match for each template, sharing one image pyramid and FFT.
+
+        Returns:
+            Match or None per template, in the order of ``templates``
+        """
+        search, offset = self._prepare(image, region)
+        results: List[Optional[Match]] = []
+        for source in templates:
+            found = self._search(search, offset, self.load(source), confidence, 1)
+            results.append(found[0] if found else None)
+        return results
+
+    def _prepare(
+        self, image: ImageLike, region: Optional[Region]
+    ) -> Tuple[_SearchImage, Tuple[int, int]]:
+        left = top = 0
+        if region is not None:
+            left, top, width, height = region
+            left, top = max(0, left), max(0, top)
+            region = (left, top, width, height)
+        return _SearchImage(_gray(image, region)), (left, top)
+
+    def _search(
+        self,
+        search: _SearchImage,
+        offset: Tuple[int, int],
+        template: Template,
+        confidence: float,
+        max_matches: int,
+    ) -> List[Match]:
+        full = search.level(0)
+        if full.shape[0] < template.height or full.shape[1] < template.width:
+            return []
+
+        # Coarsest level where both the template and the image still fit
+        level = len(template.levels) - 1
+        while level > 0 and any(
+            s < t for s, t in zip(search.level(level).shape, template.levels[level][0].shape)
+        ):
+            level -= 1
+
+        scores = self._ncc_map(search, template, level)
+        # Downsampling blurs edges, so coarse scores run lower than full-res ones
+        floor = confidence - 0.25 * level
+        peaks = self._peaks(
+            scores, template.levels[level][0].shape, floor, max(self.candidates, max_matches * 2)
+        )
+
+        matches = []
+        for y, x in peaks:
+            score = float(scores[y, x])
+            for finer in range(level - 1, -1, -1):
+                y, x, score = self._refine(search, template, finer, y * 2, x * 2)
+            if score >= confidence:
+                matches.append(
+                    Match(
+                        x + offset[0],
+                        y + offset[1],
+                        template.width,
+                        template.height,
+                        score,
+                        template.name,
+                    )
+                )
+
+        return self._suppress(matches, max_matches)
+
+    def _ncc_map(self, search: _SearchImage, template: Template, level: int) -> np.ndarray:
+        """Normalized correlation at every valid position of one level."""
+        img = search.level(level)
+        t0, norm = template.levels[level]
+        h, w = t0.shape
+        corr = np.fft.irfft2(
+            search.spectrum(level) * template.spectrum(level, img.shape), s=img.shape
+        )
+        corr = corr[: img.shape[0] - h + 1, : img.shape[1] - w + 1]
+        sums, squares = search.window_stats(level, h, w)
+        variance = np.maximum(squares - sums * sums / (h * w), 0.0)
+        denom = np.sqrt(variance) * norm
+        return np.where(denom > _EPS, corr / np.maximum(denom, _EPS), 0.0)
+
+    def _peaks(
+        self, scores: np.ndarray, shape: Tuple[int, int], floor: float, count: int
+    ) -> List[Tuple[int, int]]:
+        """Up to ``count`` local maxima above ``floor``, at least a template apart."""
+        scores = scores.copy()
+        h, w = shape
+        peaks = []
+        for _ in range(count):
+            index = int(np.argmax(scores))
+            y, x = divmod(index, scores.shape[1])
+            if scores[y, x] < floor:
+                break
+            peaks.append((y, x))
+            scores[max(0, y - h // 2) : y + h // 2 + 1, max(0, x - w // 2) : x + w // 2 + 1] = (
+                -np.inf
+            )
+        return peaks
+
+    def _refine(
+        self, search: _SearchImage, template: Template, level: int, y: int, x: int, radius: int = 2
+    ) -> Tuple[int, int, float]:
+        """Exact NCC in a small window around (y, x); returns the best spot."""
+        img = search.level(level)
+        t0, norm = template.levels[level]
+        h, w = t0.shape
+        y0, x0 = max(0, y - radius), max(0, x - radius)
+        y1, x1 = min(img.shape[0] - h, y + radius), min(img.shape[1] - w, x + radius)
+        if y1 < y0 or x1 < x0:
+            return y, x, -1.0
+        patches = sliding_window_view(img[y0 : y1 + h, x0 : x1 + w].astype(np.float32), (h, w))
+        num = np.einsum("ijhw,hw->ij", patches, t0, optimize=True)
+        n = h * w
+        sums = patches.sum(axis=(2, 3))
+        variance = np.maximum(
+            np.einsum("ijhw,ijhw->ij", patches, patches, optimize=True) - sums * sums / n, 0.0
+        )
+        denom = np.sqrt(variance) * norm
+        scores = np.where(denom > _EPS, num / np.maximum(denom, _EPS), 0.0).clip(-1.0, 1.0)
+        best = np.unravel_index(int(np.argmax(scores)), scores.shape)
+        return y0 + int(best[0]), x0 + int(best[1]), float(scores[best])
+
+    @staticmethod
+    def _suppress(matches: List[Match], max_matches: int) -> List[Match]:
+        """Keep the best of any overlapping matches."""
+        kept: List[Match] = []
+        for match in sorted(matches, key=lambda m: m.score, reverse=True):
+            if all(
+                abs(match.left - other.left) >= match.width
+                or abs(match.top - other.top) >= match.height
+                for other in kept
+            ):
+                kept.append(match)
+                if len(kept) >= max_matches:
+                    break
+        return kept
@@ -0,0 +1,137 @@
+"""Run many headless Godot jobs in parallel."""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from .godot import GodotProject, GodotRunner
+
+
+@dataclass
+class JobSpec:
+    """A single headless run to perform."""
+
+    project: GodotProject
+    scene: Optional[str] = None
+    quit_after: Optional[int] = None
+    fixed_fps: int = 60
+    timeout: Optional[float] = None  # None = use the pool default
+
+
+@dataclass
+class JobResult:
+    """Outcome of a finished job."""
+
+    spec: JobSpec
+    index: int
+    returncode: Optional[int]
+    stdout: List[str] = field(default_factory=list)
+    stderr: List[str] = field(default_factory=list)
+    wall_time: float = 0.0
+    timed_out: bool = False
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> bool:
+        """True if the job exited cleanly on its own."""
+        return self.returncode == 0 and not self.timed_out and self.error is None
+
+
+JobLike = Union[JobSpec, Tuple[GodotProject, Optional[str], Optional[int]]]
+
+
+class GodotRunnerPool:
+    """Run headless jobs concurrently, capped at the machine's core count.
+
+    Example:
+        pool = GodotRunnerPool(timeout=30)
+        for result in pool.run([(project, "a.tscn", 120), (project, "b.tscn", 120)]):
+            print(result.spec.scene, result.returncode, result.wall_time)
+    """
+
+    def __init__(
+        self,
+        godot_path: str = "godot",
+        max_workers: Optional[int] = None,
+        timeout: float = 60.0,
+        buffer_size: int = 10000,
+    ):
+        self.godot_path = godot_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.buffer_size = buffer_size
+        self._active: Set[GodotRunner] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _to_spec(job: JobLike) -> JobSpec:
+        if isinstance(job, JobSpec):
+            return job
+        return JobSpec(*job)
+
+    def _run_job(self, index: int, spec: JobSpec) -> JobResult:
+        """Worker body: run one job to completion or timeout."""
+        runner = GodotRunner(self.godot_path, buffer_size=self.buffer_size)
+        timeout = spec.timeout if spec.timeout is not None else self.timeout
+        timed_out = False
+        started = time.monotonic()
+
+        with self._lock:
+            self._active.add(runner)
+        try:
+            runner.run_headless(spec.project, spec.scene, spec.quit_after, spec.fixed_fps)
+            timed_out = runner.wait(timeout=timeout) is None
+            result = runner.stop()
+        except OSError as e:
+            return JobResult(spec, index, None, wall_time=time.monotonic() - started, error=str(e))
+        finally:
+            with self._lock:
+                self._active.discard(runner)
+
+        return JobResult(
+            spec=spec,
+            index=index,
+            returncode=result["returncode"],
+            stdout=result["stdout"],
+            stderr=result["stderr"],
+            wall_time=time.monotonic() - started,
+            timed_out=timed_out,
+        )
+
+    def run(self, jobs: Iterable[JobLike]) -> Iterator[JobResult]:
+        """Run jobs in parallel, yielding results as each one completes.
+
+        Args:
+            jobs: JobSpec instances or (project, scene, quit_after) tuples
+
+        Yields:
+            JobResult in completion order (``index`` gives the input position)
+        """
+        specs = [self._to_spec(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="godot-job") as ex:
+            futures: List[Future[JobResult]] = [
+                ex.submit(self._run_job, i, spec) for i, spec in enumerate(specs)
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                # Consumer stopped early: drop queued jobs, kill running ones
+                for future in futures:
+                    future.cancel()
+                self.stop_all()
+
+    def run_all(self, jobs: Sequence[JobLike]) -> List[JobResult]:
+        """Run jobs in parallel and return results in input order."""
+        return sorted(self.run(jobs), key=lambda r: r.index)
+
+    def stop_all(self) -> None:
+        """Stop every job that is currently running."""
+        with self._lock:
+            runners = list(self._active)
+        for runner in runners:
+            if runner.is_running():
+                runner.stop()
@@ -0,0 +1,281 @@
+"""Local mirror of the editor's scene tree, kept current by bridge deltas."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from .bridge import BridgeClient
+
+
+@dataclass
+class MirrorNode:
+    """One node of the mirrored scene tree."""
+
+    id: int
+    name: str
+    type: str
+    parent: int  # 0 for the scene root
+    properties: Dict[str, Any] = field(default_factory=dict)
+    children: List[int] = field(default_factory=list)
+
+
+@dataclass
+class NodeRecord:
+    """Compact result row from :meth:`BridgeClient.query_nodes`."""
+
+    path: str  # Relative to the scene root ("" for the root)
+    type: str
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return self.path.rsplit("/", 1)[-1]
+
+
+@dataclass
+class NodePage:
+    """One page of query results."""
+
+    nodes: List[NodeRecord]
+    next_cursor: Optional[int]  # None = no more pages
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> "NodePage":
+        """Decode the bridge's column-oriented ``fields``/``rows`` payload."""
+        prop_names = response["fields"][2:]
+        nodes = []
+        for row in response["rows"]:
+            path = "" if row[0] == "." else row[0]
+            nodes.append(NodeRecord(path, row[1], dict(zip(prop_names, row[2:]))))
+        cursor = response.get("next_cursor")
+        return cls(nodes, None if cursor is None else int(cursor))
+
+
+class SceneTreeMirror:
+    """Scene tree mirrored from the bridge's ``subscribe_scene_tree`` stream.
+
+    The bridge sends one versioned snapshot, then batches of add / remove /
+    rename / set deltas. Queries run locally against the mirror. If a delta
+    batch is missed (version gap) the mirror resubscribes for a fresh
+    snapshot.
+
+    Example:
+        with BridgeClient() as client:
+            tree = client.subscribe_scene_tree()
+            for node in tree.find(type="Button"):
+                print(tree.path_of(node.id), node.properties.get("visible"))
+    """
+
+    SNAPSHOT_EVENT = "scene_tree_snapshot"
+    DELTA_EVENT = "scene_tree_delta"
+
+    def __init__(self, client: "BridgeClient"):
+        self.client = client
+        self.nodes: Dict[int, MirrorNode] = {}
+        self.root_id: Optional[int] = None
+        self.version = -1  # -1 = no snapshot loaded yet
+        self._early: List[Dict[str, Any]] = []  # Deltas seen before the snapshot
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+
+    # -- Subscription -------------------------------------------------------
+
+    def subscribe(self, timeout: Optional[float] = None) -> "SceneTreeMirror":
+        """Start receiving deltas and load the initial snapshot."""
+        self.client.add_event_handler(self._on_event)
+        future = self.client.request("subscribe_scene_tree")
+        # Runs on the reader thread before any later event is dispatched
+        future.add_done_callback(self._on_snapshot_response)
+        response = future.result(timeout=self.client.timeout if timeout is None else timeout)
+        if not response.get("success", False):
+            from .bridge import BridgeError  # bridge imports this module
+
+            self.client.remove_event_handler(self._on_event)
+            raise BridgeError(response.get("error", "subscribe_scene_tree failed"))
+        return self
+
+    def unsubscribe(self) -> None:
+        """Stop receiving deltas. The mirror keeps its last state."""
+        self.client.remove_event_handler(self._on_event)
+        if self.client.connected:
+            self.client.request("unsubscribe_scene_tree")
+
+    def _on_snapshot_response(self, future: Any) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        response = future.result()
+        if response.get("success"):
+            self.load_snapshot(response.get("tree"), int(response["version"]))
+
+    def _on_event(self, message: Dict[str, Any]) -> None:
+        event = message.get("event")
+        if event == self.SNAPSHOT_EVENT:
+            self.load_snapshot(message.get("tree"), int(message["version"]))
+        elif event == self.DELTA_EVENT:
+            self.apply_delta(message)
+
+    # -- Updates ------------------------------------------------------------
+
+    def load_snapshot(self, tree: Optional[Dict[str, Any]], version: int) -> None:
+        """Replace the mirror with a serialized tree."""
+        with self._lock:
+            self.nodes.clear()
+            self.root_id = None
+            if tree is not None:
+                self.root_id = int(tree["id"])
+                stack = [(tree, 0)]
+                while stack:
+                    data, parent = stack.pop()
+                    node = self._add(data, parent)
+                    children = data.get("children", [])
+                    node.children = [int(child["id"]) for child in children]
+                    stack.extend((child, node.id) for child in children)
+            self.version = version
+
+            early, self._early = self._early, []
+            for delta in early:
+                if int(delta["version"]) > version:
+                    self.apply_delta(delta)
+            self._changed.notify_all()
+
+    def _add(self, data: Dict[str, Any], parent: int) -> MirrorNode:
+        node = MirrorNode(
+            id=int(data["id"]),
+            name=data["name"],
+            type=data["type"],
+            parent=parent,
+            properties=dict(data.get("properties", {})),
+        )
+        self.nodes[node.id] = node
+        return node
+
+    def apply_delta(self, delta: Dict[str, Any]) -> None:
+        """Apply one batch of changes from a ``scene_tree_delta`` event."""
+        version = int(delta["version"])
+        with self._lock:
+            if self.version < 0:
+                self._early.append(delta)
+                return
+            if version <= self.version:
+                return  # Already reflected in the snapshot
+            if version != self.version + 1:
+                self._resync()
+                return
+
+            for change in delta.get("changes", []):
+                op = change.get("op")
+                node_id = int(change["id"])
+                if op == "add":
+                    self._apply_add(change)
+                elif op == "remove":
+                    self._remove_subtree(node_id)
+                elif op == "rename":
+                    if node_id in self.nodes:
+                        self.nodes[node_id].name = change["name"]
+                elif op == "set":
+                    if node_id in self.nodes:
+                        self.nodes[node_id].properties.update(change.get("properties", {}))
+            self.version = version
+            self._changed.notify_all()
+
+    def _apply_add(self, change: Dict[str, Any]) -> None:
+        node_id = int(change["id"])
+        parent = int(change.get("parent", 0))
+        if node_id in self.nodes:
+            self._remove_subtree(node_id)  # Re-added (e.g. reparented)
+        node = self._add(change, parent)
+        if parent == 0:
+            self.root_id = node.id
+        elif parent in self.nodes:
+            siblings = self.nodes[parent].children
+            index = int(change.get("index", len(siblings)))
+            siblings.insert(min(index, len(siblings)), node_id)
+
+    def _remove_subtree(self, node_id: int) -> None:
+        node = self.nodes.get(node_id)
+        if node is None:
+            return
+        parent = self.nodes.get(node.parent)
+        if parent is not None and node_id in parent.children:
+            parent.children.remove(node_id)
+        if self.root_id == node_id:
+            self.root_id = None
+        stack = [node_id]
+        while stack:
+            removed = self.nodes.pop(stack.pop(), None)
+            if removed is not None:
+                stack.extend(removed.children)
+
+    def _resync(self) -> None:
+        """Missed a delta: drop state and request a fresh snapshot."""
+        self.version = -1
+        future = self.client.request("subscribe_scene_tree")
+        future.add_done_callback(self._on_snapshot_response)
+
+    def wait_for_version(self, version: int, timeout: Optional[float] = None) -> bool:
+        """Block until the mirror reaches ``version``."""
+        with self._changed:
+            return self._changed.wait_for(lambda: self.version >= version, timeout)
+
+    # -- Queries ------------------------------------------------------------
+
+    @property
+    def root(self) -> Optional[MirrorNode]:
+        with self._lock:
+            return self.nodes.get(self.root_id) if self.root_id is not None else None
+
+    def get(self, path: str) -> Optional[MirrorNode]:
+        """Look up a node by path relative to the root, e.g. "UI/Button".
+
+        The root itself is "" or its own name.
+        """
+        with self._lock:
+            node = self.root
+            if node is None:
+                return None
+            parts = [p for p in path.split("/") if p]
+            if parts and parts[0] == node.name:
+                parts = parts[1:]
+            for part in parts:
+                node = next(
+                    (self.nodes[c] for c in node.children if self.nodes[c].name == part), None
+                )
+                if node is None:
+                    return None
+            return node
+
+    def path_of(self, node_id: int) -> Optional[str]:
+        """Path of a node relative to the root ("" for the root)."""
+        with self._lock:
+            names: List[str] = []
+            node = self.nodes.get(node_id)
+            while node is not None and node.id != self.root_id:
+                names.append(node.name)
+                node = self.nodes.get(node.parent)
+            if node is None:
+                return None
+            return "/".join(reversed(names))
+
+    def walk(self, start: Optional[int] = None) -> Iterator[MirrorNode]:
+        """Depth-first iteration from ``start`` (default: root)."""
+        with self._lock:
+            first = self.root_id if start is None else start
+            stack = [first] if first in self.nodes else []
+            result: List[MirrorNode] = []
+            while stack:
+                node = self.nodes[stack.pop()]
+                result.append(node)
+                stack.extend(reversed([c for c in node.children if c in self.nodes]))
+        return iter(result)
+
+    def find(self, type: Optional[str] = None, name: Optional[str] = None) -> List[MirrorNode]:
+        """Nodes matching a class name and/or node name."""
+        return [
+            node
+            for node in self.walk()
+            if (type is None or node.type == type) and (name is None or node.name == name)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
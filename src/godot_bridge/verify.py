@@ -0,0 +1,171 @@
+"""In-memory visual checks on captured frames.
+
+Everything here works on NumPy arrays and accepts a :class:`Frame`, a PIL
+Image or an ``(height, width, 3|4)`` uint8 array, so assertions never have
+to round-trip screenshots through PNG files.
+
+Regions are ``(left, top, width, height)`` tuples in image coordinates.
+Color differences are summed over the R, G and B channels (0-765), the
+same scale as the original pixel-sampling checks in the examples.
+"""
+
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from .capture import Frame
+
+ImageLike = Union[Frame, Image.Image, np.ndarray]
+Region = Tuple[int, int, int, int]
+
+
+def as_rgb(image: ImageLike) -> np.ndarray:
+    """``(height, width, 3)`` uint8 RGB array.
+
+    Frames are viewed in place (channel order is flipped with a negative
+    stride, no copy). PIL images are converted once.
+    """
+    if isinstance(image, Frame):
+        return image.array[..., 2::-1]
+    if isinstance(image, Image.Image):
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return np.asarray(image)
+    array = np.asarray(image)
+    if array.ndim != 3 or array.shape[2] < 3:
+        raise ValueError(f"Expected an (H, W, 3|4) array, got shape {array.shape}")
+    return array[..., :3]
+
+
+def crop(pixels: np.ndarray, region: Optional[Region]) -> np.ndarray:
+    """View of ``pixels`` inside ``region`` (whole image when None)."""
+    if region is None:
+        return pixels
+    left, top, width, height = region
+    return pixels[top : top + height, left : left + width]
+
+
+def _pair(
+    before: ImageLike, after: ImageLike, region: Optional[Region]
+) -> Tuple[np.ndarray, np.ndarray]:
+    a = crop(as_rgb(before), region)
+    b = crop(as_rgb(after), region)
+    if a.shape != b.shape:
+        raise ValueError(f"Image sizes differ: {a.shape[:2]} vs {b.shape[:2]}")
+    return a, b
+
+
+def _abs_diff(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Per-pixel color difference summed over channels, ``(H, W)`` int."""
+    diff: np.ndarray = np.abs(a.astype(np.int16) - b).sum(axis=2)
+    return diff
+
+
+def region_mean(image: ImageLike, region: Optional[Region] = None) -> Tuple[float, float, float]:
+    """Mean RGB color of a region."""
+    mean = crop(as_rgb(image), region).reshape(-1, 3).mean(axis=0)
+    return (float(mean[0]), float(mean[1]), float(mean[2]))
+
+
+def region_diff(before: ImageLike, after: ImageLike, region: Optional[Region] = None) -> float:
+    """Mean per-pixel color difference (0-765) over a region."""
+    a, b = _pair(before, after, region)
+    return float(_abs_diff(a, b).mean())
+
+
+def sample_diff(before: ImageLike, after: ImageLike, points: Iterable[Tuple[int, int]]) -> float:
+    """Mean color difference (0-765) at individual ``(x, y)`` points."""
+    a = as_rgb(before)
+    b = as_rgb(after)
+    xs, ys = zip(*points)
+    picked_a = a[list(ys), list(xs)].astype(np.int16)
+    picked_b = b[list(ys), list(xs)]
+    return float(np.abs(picked_a - picked_b).sum(axis=1).mean())
+
+
+def tolerance_mask(
+    before: ImageLike, after: ImageLike, tolerance: int = 0, region: Optional[Region] = None
+) -> np.ndarray:
+    """Boolean ``(H, W)`` mask of pixels whose color moved more than ``tolerance``.
+
+    A pixel counts as changed when any single channel differs by more
+    than ``tolerance``.
+    """
+    a, b = _pair(before, after, region)
+    mask: np.ndarray = (np.abs(a.astype(np.int16) - b) > tolerance).any(axis=2)
+    return mask
+
+
+def changed_fraction(
+    before: ImageLike, after: ImageLike, tolerance: int = 0, region: Optional[Region] = None
+) -> float:
+    """Share of pixels (0-1) outside ``tolerance``."""
+    mask = tolerance_mask(before, after, tolerance, region)
+    return float(mask.mean()) if mask.size else 0.0
+
+
+def images_match(
+    expected: ImageLike,
+    actual: ImageLike,
+    tolerance: int = 8,
+    max_changed: float = 0.0,
+    region: Optional[Region] = None,
+) -> bool:
+    """True when at most ``max_changed`` of the pixels exceed ``tolerance``."""
+    return changed_fraction(expected, actual, tolerance, region) <= max_changed
+
+
+def histogram(image: ImageLike, bins: int = 32, region: Optional[Region] = None) -> np.ndarray:
+    """Normalized per-channel histogram, shape ``(3, bins)``; each row sums to 1."""
+    pixels = crop(as_rgb(image), region)
+    # Quantize to bin indices and count each channel with bincount
+    indices = (pixels.reshape(-1, 3).astype(np.uint16) * bins) >> 8
+    counts = np.stack([np.bincount(indices[:, c], minlength=bins) for c in range(3)])
+    total = max(indices.shape[0], 1)
+    normalized: np.ndarray = counts / total
+    return normalized
+
+
+def histogram_distance(
+    before: ImageLike,
+    after: ImageLike,
+    bins: int = 32,
+    region: Optional[Region] = None,
+    method: str = "bhattacharyya",
+) -> float:
+    """Distance between color histograms, averaged over channels.
+
+    Insensitive to where pixels are, so it tolerates small movement and is
+    a cheap check for "the scene looks roughly the same".
+
+    Args:
+        before: First image
+        after: Second image
+        bins: Histogram bins per channel
+        region: Restrict both images to this region
+        method: "bhattacharyya" (0 = identical, 1 = disjoint),
+            "intersection" (0 = identical, 1 = disjoint) or "chi2"
+
+    Returns:
+        Distance (lower = more similar)
+    """
+    h1 = histogram(before, bins, region)
+    h2 = histogram(after, bins, region)
+    if method == "bhattacharyya":
+        coefficient = np.sqrt(h1 * h2).sum(axis=1)
+        return float(np.sqrt(np.clip(1.0 - coefficient, 0.0, 1.0)).mean())
+    if method == "intersection":
+        return float(1.0 - np.minimum(h1, h2).sum(axis=1).mean())
+    if method == "chi2":
+        total = h1 + h2
+        nonzero = total > 0
+        return float((((h1 - h2) ** 2)[nonzero] / total[nonzero]).sum() / 3)
+    raise ValueError(f"Unknown histogram method: {method}")
+
+
+def color_changed(
+    before: ImageLike, after: ImageLike, points: Sequence[Tuple[int, int]], threshold: float = 100.0
+) -> bool:
+    """True when the mean color difference at ``points`` exceeds ``threshold``."""
+    return sample_diff(before, after, points) > threshold
@@ -0,0 +1,201 @@
+"""Persistent "warm" Godot process for repeated scene runs."""
+
+import re
+import subprocess
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .bridge import BridgeClient, BridgeError
+from .events import BridgeInput
+from .godot import GodotProject, GodotRunner
+
+DRIVER_SCRIPT = (
+    Path(__file__).resolve().parent.parent / "plugin" / "openclaw_bridge" / "warm_driver.gd"
+)
+
+READY_PATTERN = re.compile(r"OPENCLAW_WARM: READY port=(\d+)")
+END_MARKER = "OPENCLAW_WARM: END"
+
+
+@dataclass
+class SceneRun:
+    """A scene run started with :meth:`WarmGodotRunner.start_scene`."""
+
+    response: "Future[Dict[str, Any]]"  # Resolves when the run ends
+    since: int  # Output sequence number when the run started
+
+
+class WarmGodotRunner(GodotRunner):
+    """Keep one headless Godot alive and run scenes in it on request.
+
+    The engine boots and imports the project once in :meth:`start`; each
+    :meth:`run_scene` then only costs a scene load.
+
+    Example:
+        runner = WarmGodotRunner()
+        runner.start(project)
+        for _ in range(10):
+            result = runner.run_scene("main.tscn", frames=120)
+            print(result["elapsed_ms"], result["stdout"])
+        runner.stop()
+    """
+
+    def __init__(
+        self,
+        godot_path: str = "godot",
+        port: int = 0,
+        buffer_size: int = 10000,
+        driver_script: Path = DRIVER_SCRIPT,
+    ):
+        super().__init__(godot_path, buffer_size)
+        self.port = port  # 0 = let Godot pick a free port
+        self.driver_script = Path(driver_script)
+        self.client: Optional[BridgeClient] = None
+        self.fixed_fps = 60
+
+    def start(
+        self, project: GodotProject, fixed_fps: int = 60, timeout: float = 60.0
+    ) -> "subprocess.Popen[str]":
+        """Boot the driver and connect to it.
+
+        Args:
+            project: GodotProject to load
+            fixed_fps: Fixed FPS for deterministic playback
+            timeout: Max seconds to wait for engine boot
+
+        Returns:
+            Running subprocess
+        """
+        cmd = [
+            self.godot_path,
+            "--headless",
+            "--debug",
+            "--path",
+            str(project.path),
+            "--fixed-fps",
+            str(fixed_fps),
+            "--script",
+            str(self.driver_script),
+            "--",
+            f"--openclaw-port={self.port}",
+        ]
+        process = self._start(cmd)
+        self.fixed_fps = fixed_fps
+
+        waited = self.run_until(READY_PATTERN, timeout=timeout)
+        if not waited.matched or waited.line is None:
+            self.stop()
+            raise RuntimeError(f"Warm driver did not start ({waited.reason})")
+
+        match = READY_PATTERN.search(waited.line.text)
+        assert match is not None
+        self.port = int(match.group(1))
+        self.client = BridgeClient(port=self.port, timeout=timeout).connect()
+        return process
+
+    def _request(
+        self, action: str, timeout: Optional[float] = None, **params: Any
+    ) -> Dict[str, Any]:
+        """Send one command and wait for its reply."""
+        if not self.client:
+            raise RuntimeError("Warm runner not started")
+        return self.client.request(action, **params).result(timeout=timeout)
+
+    def ping(self, timeout: float = 5.0) -> bool:
+        """Check the driver is responsive."""
+        return bool(self._request("ping", timeout=timeout).get("pong"))
+
+    def input(self) -> BridgeInput:
+        """In-engine input for the running scene (see :class:`BridgeInput`)."""
+        if not self.client:
+            raise RuntimeError("Warm runner not started")
+        return BridgeInput(self.client, fps=self.fixed_fps)
+
+    def run_scene(
+        self,
+        scene: Optional[str] = None,
+        frames: int = 60,
+        timeout: Optional[float] = 60.0,
+        input: Optional[Union[BridgeInput, List[Dict[str, Any]]]] = None,
+    ) -> Dict[str, Any]:
+        """Run a scene for a number of frames, then reset.
+
+        Args:
+            scene: Scene path (e.g. "main.tscn"); None = project main scene
+            frames: Frames to run before tearing the scene down
+            timeout: Max seconds to wait for the run to finish
+            input: Events to inject, with frame offsets counted from the
+                scene's first frame (a ``BridgeInput.recorder()`` or a list
+                of event dicts)
+
+        Returns:
+            Dict with 'success', 'frames', 'elapsed_ms', 'stdout', 'stderr'
+            (or 'error' on failure)
+        """
+        return self.finish_scene(self.start_scene(scene, frames, input), timeout)
+
+    def start_scene(
+        self,
+        scene: Optional[str] = None,
+        frames: int = 0,
+        input: Optional[Union[BridgeInput, List[Dict[str, Any]]]] = None,
+    ) -> SceneRun:
+        """Start a scene run without waiting for it.
+
+        Use with :meth:`input` to drive the scene interactively, then
+        :meth:`finish_scene` (after ``frames``, or a ``stop_scene``).
+
+        Args:
+            scene: Scene path; None = project main scene
+            frames: Frames to run; 0 = until :meth:`stop_scene`
+            input: Events to schedule from the scene's first frame
+        """
+        if not self.client:
+            raise RuntimeError("Warm runner not started")
+        params: Dict[str, Any] = {"frames": frames}
+        if scene:
+            params["scene"] = scene
+        if input is not None:
+            params["input"] = input.take_events() if isinstance(input, BridgeInput) else list(input)
+        since = self.buffer.next_seq
+        return SceneRun(self.client.request("run_scene", **params), since)
+
+    def stop_scene(self, timeout: float = 5.0) -> Dict[str, Any]:
+        """End the active run early (its run_scene request then completes)."""
+        return self._request("stop_scene", timeout=timeout)
+
+    def finish_scene(self, run: SceneRun, timeout: Optional[float] = 60.0) -> Dict[str, Any]:
+        """Wait for a run started with :meth:`start_scene` and collect its output."""
+        since = run.since
+        response = run.response.result(timeout=timeout)
+
+        if response.get("success"):
+            # The driver prints the end marker before replying; wait for it
+            # to come through the pipe so the run's output is complete.
+            marker = re.compile(re.escape(f"{END_MARKER} id={int(response['id'])}") + r"$")
+            self.run_until(marker, timeout=5, since=since)
+
+        lines = [line for line in self.buffer.since(since) if not line.text.startswith(END_MARKER)]
+        response["stdout"] = [line.text for line in lines if line.stream == "stdout"]
+        response["stderr"] = [line.text for line in lines if line.stream == "stderr"]
+        return response
+
+    def reset(self, timeout: float = 5.0) -> Dict[str, Any]:
+        """Unload the current scene and reset engine state."""
+        return self._request("reset", timeout=timeout)
+
+    def stop(self) -> Dict[str, Any]:
+        """Ask the driver to quit, then stop the process."""
+        if self.client:
+            try:
+                self._request("quit", timeout=2)
+            except (OSError, TimeoutError, FutureTimeoutError, BridgeError):
+                # FutureTimeoutError is not the builtin TimeoutError before 3.11
+                pass
+            self.client.close()
+            self.client = None
+            self.wait(timeout=5)
+        return super().stop()
@@ -0,0 +1,310 @@
+"""Window lookup and X11 input, in-process where possible.
+
+``XlibBackend`` talks to the X server directly through python-xlib (the
+``x11`` extra) and sends input through the XTEST extension, so no process
+is forked per action. ``XdotoolBackend`` shells out to xdotool and is only
+used when python-xlib or an X display is unavailable.
+"""
+
+import os
+import subprocess
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    from Xlib import X, XK, display as xdisplay, error as xerror  # type: ignore[import-untyped]
+    from Xlib.ext import xtest  # type: ignore[import-untyped]
+    from Xlib.protocol import event as xevent  # type: ignore[import-untyped]
+
+    HAS_XLIB = True
+except ImportError:
+    HAS_XLIB = False
+
+
+@dataclass(frozen=True)
+class WindowGeometry:
+    """Window position and size in root (screen) coordinates."""
+
+    window_id: int
+    left: int
+    top: int
+    width: int
+    height: int
+
+    def as_monitor(self) -> Dict[str, int]:
+        """Region dict in the form mss.grab() expects."""
+        return {"left": self.left, "top": self.top, "width": self.width, "height": self.height}
+
+
+# Modifier names accepted in key combos ("ctrl+s"), as xdotool spells them
+_MODIFIERS = {
+    "ctrl": "Control_L",
+    "control": "Control_L",
+    "shift": "Shift_L",
+    "alt": "Alt_L",
+    "super": "Super_L",
+    "meta": "Meta_L",
+}
+
+
+# Characters with a meaning in the POSIX extended regexes xdotool matches with
+_ERE_SPECIAL = set("\\.[]()*+?{}|^$")
+
+
+def _ere_escape(text: str) -> str:
+    return "".join("\\" + char if char in _ERE_SPECIAL else char for char in text)
+
+
+class WindowBackend(ABC):
+    """Find windows and send mouse/keyboard input to the X server.
+
+    Titles match as case-insensitive substrings in every backend, the rule
+    ``xdotool search --name`` applies.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def search(self, title: str) -> List[int]:
+        """Ids of windows whose title contains ``title`` (ignoring case)."""
+
+    @abstractmethod
+    def get_geometry(self, window_id: int) -> Optional[WindowGeometry]:
+        """Window position (root coordinates) and size."""
+
+    @abstractmethod
+    def activate(self, window_id: int) -> bool:
+        """Raise and focus a window."""
+
+    @abstractmethod
+    def move_mouse(self, x: int, y: int) -> bool:
+        """Move the pointer to root coordinates."""
+
+    @abstractmethod
+    def click(self, x: int, y: int, button: int = 1) -> bool:
+        """Move the pointer and click (1 = left, 2 = middle, 3 = right)."""
+
+    @abstractmethod
+    def key(self, combo: str) -> bool:
+        """Press and release a key or combo in xdotool syntax ("Return", "ctrl+s")."""
+
+    def find_window(self, title: str) -> Optional[WindowGeometry]:
+        """Geometry of the first window matching ``title``."""
+        for window_id in self.search(title):
+            geometry = self.get_geometry(window_id)
+            if geometry:
+                return geometry
+        return None
+
+    def close(self) -> None:
+        """Release resources."""
+
+
+class XdotoolBackend(WindowBackend):
+    """Fallback backend that forks xdotool for every call."""
+
+    name = "xdotool"
+
+    def __init__(self, timeout: float = 5.0):
+        self.timeout = timeout
+
+    def _run(self, *args: str) -> Optional["subprocess.CompletedProcess[str]"]:
+        try:
+            return subprocess.run(
+                ["xdotool", *args], capture_output=True, text=True, timeout=self.timeout
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+
+    def search(self, title: str) -> List[int]:
+        # xdotool matches a case-insensitive regex; escaped, that is a substring match
+        result = self._run("search", "--name", _ere_escape(title))
+        if not result or result.returncode != 0:
+            return []
+        return [int(line) for line in result.stdout.split() if line.isdigit()]
+
+    def get_geometry(self, window_id: int) -> Optional[WindowGeometry]:
+        result = self._run("getwindowgeometry", "--shell", str(window_id))
+        if not result or result.returncode != 0:
+            return None
+        return parse_xdotool_geometry(window_id, result.stdout)
+
+    def activate(self, window_id: int) -> bool:
+        result = self._run("windowactivate", str(window_id))
+        return bool(result and result.returncode == 0)
+
+    def move_mouse(self, x: int, y: int) -> bool:
+        result = self._run("mousemove", str(x), str(y))
+        return bool(result and result.returncode == 0)
+
+    def click(self, x: int, y: int, button: int = 1) -> bool:
+        result = self._run("mousemove", str(x), str(y), "click", str(button))
+        return bool(result and result.returncode == 0)
+
+    def key(self, combo: str) -> bool:
+        result = self._run("key", combo)
+        return bool(result and result.returncode == 0)
+
+
+class XlibBackend(WindowBackend):
+    """In-process backend using python-xlib and the XTEST extension."""
+
+    name = "xlib"
+
+    def __init__(self, display_name: Optional[str] = None):
+        if not HAS_XLIB:
+            raise RuntimeError("python-xlib is not installed")
+        self.display = xdisplay.Display(display_name)
+        if not self.display.has_extension("XTEST"):
+            self.display.close()
+            raise RuntimeError("X server lacks the XTEST extension")
+        self.root = self.display.screen().root
+        self._atoms = {
+            name: self.display.intern_atom(name)
+            for name in ("_NET_CLIENT_LIST", "_NET_WM_NAME", "_NET_ACTIVE_WINDOW", "UTF8_STRING")
+        }
+
+    def _title(self, window: Any) -> str:
+        try:
+            prop = window.get_full_property(self._atoms["_NET_WM_NAME"], self._atoms["UTF8_STRING"])
+            if prop and prop.value:
+                value = prop.value
+                return value.decode("utf-8", "replace") if isinstance(value, bytes) else str(value)
+            name = window.get_wm_name()
+            if isinstance(name, bytes):
+                return name.decode("latin-1")
+            return name or ""
+        except xerror.XError:
+            return ""
+
+    def _candidates(self) -> List[int]:
+        """Managed top-level windows, or the whole tree without an EWMH WM."""
+        prop = self.root.get_full_property(self._atoms["_NET_CLIENT_LIST"], X.AnyPropertyType)
+        if prop and len(prop.value):
+            return list(prop.value)
+
+        ids: List[int] = []
+        stack = [self.root]
+        while stack:
+            window = stack.pop()
+            try:
+                children = window.query_tree().children
+            except xerror.XError:
+                continue
+            ids.extend(child.id for child in children)
+            stack.extend(children)
+        return ids
+
+    def search(self, title: str) -> List[int]:
+        wanted = title.casefold()
+        matches = []
+        for window_id in self._candidates():
+            window = self.display.create_resource_object("window", window_id)
+            if wanted in self._title(window).casefold():
+                matches.append(window_id)
+        return matches
+
+    def get_geometry(self, window_id: int) -> Optional[WindowGeometry]:
+        try:
+            window = self.display.create_resource_object("window", window_id)
+            geometry = window.get_geometry()
+            origin = self.root.translate_coords(window, 0, 0)
+        except xerror.XError:
+            return None
+        return WindowGeometry(window_id, origin.x, origin.y, geometry.width, geometry.height)
+
+    def activate(self, window_id: int) -> bool:
+        try:
+            window = self.display.create_resource_object("window", window_id)
+            # EWMH request, as xdotool windowactivate sends it
+            message = xevent.ClientMessage(
+                window=window,
+                client_type=self._atoms["_NET_ACTIVE_WINDOW"],
+                data=(32, [2, X.CurrentTime, 0, 0, 0]),
+            )
+            self.root.send_event(
+                message, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask
+            )
+            window.configure(stack_mode=X.Above)
+            self.display.sync()
+            return True
+        except xerror.XError:
+            return False
+
+    def move_mouse(self, x: int, y: int) -> bool:
+        xtest.fake_input(self.display, X.MotionNotify, x=x, y=y)
+        self.display.sync()
+        return True
+
+    def click(self, x: int, y: int, button: int = 1) -> bool:
+        xtest.fake_input(self.display, X.MotionNotify, x=x, y=y)
+        xtest.fake_input(self.display, X.ButtonPress, button)
+        xtest.fake_input(self.display, X.ButtonRelease, button)
+        self.display.sync()
+        return True
+
+    def _keycode(self, name: str) -> int:
+        keysym = XK.string_to_keysym(_MODIFIERS.get(name.lower(), name))
+        if keysym == 0 and len(name) == 1:
+            keysym = ord(name)
+        return int(self.display.keysym_to_keycode(keysym))
+
+    def key(self, combo: str) -> bool:
+        keycodes = [self._keycode(part) for part in combo.split("+") if part]
+        if not keycodes or 0 in keycodes:
+            return False
+        for keycode in keycodes:
+            xtest.fake_input(self.display, X.KeyPress, keycode)
+        for keycode in reversed(keycodes):
+            xtest.fake_input(self.display, X.KeyRelease, keycode)
+        self.display.sync()
+        return True
+
+    def close(self) -> None:
+        self.display.close()
+
+
+def parse_xdotool_geometry(window_id: int, output: str) -> Optional[WindowGeometry]:
+    """Parse ``xdotool getwindowgeometry --shell`` output.
+
+    Format:
+        WINDOW=1234567
+        X=100
+        Y=200
+        WIDTH=1280
+        HEIGHT=720
+        SCREEN=0
+    """
+    values = {}
+    for line in output.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            values[key.strip()] = value.strip()
+    try:
+        return WindowGeometry(
+            window_id,
+            int(values["X"]),
+            int(values["Y"]),
+            int(values["WIDTH"]),
+            int(values["HEIGHT"]),
+        )
+    except (KeyError, ValueError):
+        return None
+
+
+_backend: Optional[WindowBackend] = None
+
+
+def get_window_backend() -> WindowBackend:
+    """Shared backend: python-xlib when usable, otherwise xdotool."""
+    global _backend
+    if _backend is None:
+        if HAS_XLIB and os.environ.get("DISPLAY"):
+            try:
+                _backend = XlibBackend()
+            except Exception:
+                _backend = XdotoolBackend()
+        else:
+            _backend = XdotoolBackend()
+    return _backend
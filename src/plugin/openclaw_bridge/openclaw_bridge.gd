@@ -7,18 +7,47 @@ This plugin runs inside the Godot Editor to provide:
 - Screenshot capture via Viewport
 - Script hot-reload notifications
 
-Connects to Python bridge via WebSocket or HTTP.
+Talks to the Python BridgeClient over TCP using the framed request/response
+protocol in protocol.gd.
 """
 class_name OpenClawBridge
 extends EditorPlugin
 
 const PORT := 9742  # OCL-GDT on phone keypad
+const Protocol = preload("protocol.gd")
+
+const MAX_CLIENTS := 8
+const MAX_QUEUED_COMMANDS := 256  # Per client; beyond this requests are rejected
+const FRAME_BUDGET_USEC := 4000  # Command time per editor frame, shared by all clients
+const SLICE_BUDGET_USEC := 2000  # Max time a long command runs before yielding a frame
+
+const WATCHED_PROPERTIES := ["position", "rotation", "scale", "visible"]
+const PROPERTY_SCAN_PER_FRAME := 256  # Nodes checked for property changes each frame
+const QUERY_DEFAULT_LIMIT := 200
+const QUERY_MAX_LIMIT := 5000
+const MAX_LOG_ENTRIES := 10000  # Log ring buffer size; older entries are overwritten
+const LOG_DEFAULT_LIMIT := 1000  # Entries per get_logs page
+const LOG_PUSH_PER_FRAME := 500  # Entries each log subscription reads per frame
 
 var _server: TCPServer
-var _connection: StreamPeerTCP
+var _clients: Array[ClientConnection] = []
+var _next_client := 0  # Round-robin position
+var _next_client_id := 1
 var _logger: DebugLogger
 var _screenshotter: Screenshotter
 
+# Scene tree subscriptions
+var _tree_subscribers: Array[ClientConnection] = []
+var _tree_version := 0
+var _tree_changes: Array[Dictionary] = []  # Pending deltas, flushed once per frame
+var _tracked := {}  # instance_id -> {property: value} for nodes in the edited scene
+var _scan_ids: Array = []  # Round-robin order for property polling
+var _scan_index := 0
+
+# Log subscriptions: new entries pushed once per frame
+var _log_subscriptions: Array[LogSubscription] = []
+var _next_log_subscription := 1
+
 func _enter_tree():
     print("OpenClaw Bridge: Initializing...")
     
@@ -36,41 +65,133 @@ func _enter_tree():
         print("OpenClaw Bridge: Listening on port ", PORT)
     else:
         push_error("OpenClaw Bridge: Failed to start server (error %d)" % err)
+    
+    get_tree().node_added.connect(_on_node_added)
+    get_tree().node_removed.connect(_on_node_removed)
+    get_tree().node_renamed.connect(_on_node_renamed)
+    scene_changed.connect(_on_scene_changed)
 
 func _exit_tree():
     print("OpenClaw Bridge: Shutting down...")
+    get_tree().node_added.disconnect(_on_node_added)
+    get_tree().node_removed.disconnect(_on_node_removed)
+    get_tree().node_renamed.disconnect(_on_node_renamed)
+    scene_changed.disconnect(_on_scene_changed)
+    for client in _clients:
+        client.peer.disconnect_from_host()
+    _clients.clear()
     if _server:
         _server.stop()
 
 func _process(_delta):
-    # Accept new connections
-    if _server and _server.is_connection_available():
-        if _connection:
-            _connection.disconnect_from_host()
-        _connection = _server.take_connection()
-        print("OpenClaw Bridge: Client connected")
-    
-    # Handle existing connection
-    if _connection and _connection.get_status() == StreamPeerTCP.STATUS_CONNECTED:
-        _handle_connection()
-
-func _handle_connection():
-    """Process commands from connected client."""
-    var available = _connection.get_available_bytes()
-    if available > 0:
-        var data = _connection.get_string(available)
-        var response = _process_command(data)
-        _connection.put_string(JSON.stringify(response))
-
-func _process_command(cmd_json: String) -> Dictionary:
-    """Parse and execute command."""
-    var result = {"success": false, "error": "Unknown command"}
+    _accept_clients()
+    _read_clients()
+    _run_queued_commands()
+    if not _tree_subscribers.is_empty():
+        _scan_properties()
+        _flush_tree_changes()
+    if not _log_subscriptions.is_empty():
+        _flush_log_subscriptions()
+
+func _accept_clients():
+    """Take every pending connection, up to MAX_CLIENTS."""
+    while _server and _server.is_connection_available():
+        var peer := _server.take_connection()
+        if _clients.size() >= MAX_CLIENTS:
+            push_warning("OpenClaw Bridge: Client limit reached, rejecting connection")
+            peer.disconnect_from_host()
+            continue
+        var client := ClientConnection.new(peer, _next_client_id)
+        _next_client_id += 1
+        _clients.append(client)
+        print("OpenClaw Bridge: Client %d connected (%d total)" % [client.id, _clients.size()])
+
+func _read_clients():
+    """Move complete request frames from each socket into its queue."""
+    for client in _clients.duplicate():
+        client.peer.poll()
+        if client.peer.get_status() != StreamPeerTCP.STATUS_CONNECTED:
+            _drop_client(client)
+            continue
+        
+        var available = client.peer.get_available_bytes()
+        if available > 0:
+            var chunk = client.peer.get_data(available)
+            if chunk[0] == OK:
+                client.reader.feed(chunk[1])
+        
+        var payload = client.reader.next_frame()
+        while payload != null:
+            var text := payload.get_string_from_utf8()
+            var cmd = JSON.parse_string(text)
+            if cmd == null or not cmd is Dictionary:
+                client.send({"id": _recover_id(text), "success": false, "error": "Invalid JSON"})
+            elif client.queue.size() >= MAX_QUEUED_COMMANDS:
+                client.send({"id": cmd.get("id"), "success": false, "error": "Command queue full"})
+            else:
+                client.queue.append(cmd)
+            payload = client.reader.next_frame()
+        
+        if not client.reader.error.is_empty():
+            push_error("OpenClaw Bridge: " + client.reader.error)
+            _drop_client(client)
+
+func _recover_id(text: String):
+    """Best-effort request id from a frame that failed to parse, or null."""
+    var found := RegEx.create_from_string("\"id\"\\s*:\\s*(\\d+)").search(text)
+    return int(found.get_string(1)) if found else null
+
+func _drop_client(client: ClientConnection):
+    client.peer.disconnect_from_host()
+    _clients.erase(client)
+    _unsubscribe_tree(client)
+    _unsubscribe_logs(client)
+    print("OpenClaw Bridge: Client %d disconnected" % client.id)
+
+func _run_queued_commands():
+    """Run queued commands round-robin until the frame budget is spent.
     
-    var parse_result = JSON.parse_string(cmd_json)
-    if parse_result == null:
-        return {"success": false, "error": "Invalid JSON"}
+    One command per client per turn, so a client with a deep queue cannot
+    starve the others. At least one command runs every frame.
+    """
+    var count := _clients.size()
+    if count == 0:
+        return
+    
+    var started := Time.get_ticks_usec()
+    var idle := 0  # Consecutive clients visited with nothing queued
+    while idle < count and Time.get_ticks_usec() - started < FRAME_BUDGET_USEC:
+        _next_client = _next_client % count
+        var client := _clients[_next_client]
+        _next_client += 1
+        if client.queue.is_empty():
+            idle += 1
+            continue
+        idle = 0
+        # Not awaited: commands that wait on the engine (screenshots) must
+        # not hold up the rest. Responses carry the request id.
+        _dispatch(client, client.queue.pop_front())
+
+func _dispatch(client: ClientConnection, cmd: Dictionary):
+    """Run one request and send its response frame."""
+    var response: Dictionary = await _process_command(cmd, client)
+    response["id"] = cmd.get("id")
+    
+    # Commands can hand back raw bytes under "_binary"; those travel as a
+    # separate frame right after the JSON header instead of inside it.
+    var payload = response.get("_binary")
+    if payload is PackedByteArray:
+        response.erase("_binary")
+        response["binary"] = true
+        response["size"] = payload.size()
+        client.send_binary(response, payload)
+    else:
+        client.send(response)
+
+func _process_command(cmd: Dictionary, client: ClientConnection = null) -> Dictionary:
+    """Execute a parsed command."""
+    var result = {"success": false, "error": "Unknown command"}
     
-    var cmd = parse_result
     if not cmd.has("action"):
         return {"success": false, "error": "Missing action"}
     
@@ -79,13 +200,33 @@ func _process_command(cmd_json: String) -> Dictionary:
             result = {"success": true, "pong": true}
         
         "get_scene_tree":
-            result = _get_scene_tree()
+            result = await _get_scene_tree()
+        
+        "query_scene_tree":
+            result = _query_scene_tree(cmd)
+        
+        "subscribe_scene_tree":
+            result = await _subscribe_tree(client)
+        
+        "unsubscribe_scene_tree":
+            _unsubscribe_tree(client)
+            result = {"success": true}
         
         "get_logs":
-            result = _logger.get_logs(cmd.get("since", 0))
+            result = _logger.get_logs(
+                int(cmd.get("since", 0)), int(cmd.get("cursor", -1)),
+                int(cmd.get("limit", LOG_DEFAULT_LIMIT)))
+        
+        "subscribe_logs":
+            result = _subscribe_logs(client, cmd)
+        
+        "unsubscribe_logs":
+            _unsubscribe_logs(client, int(cmd.get("subscription", 0)))
+            result = {"success": true}
         
         "capture_screenshot":
-            result = _screenshotter.capture()
+            result = await _screenshotter.capture(
+                cmd.get("format", "png"), cmd.get("binary", false), cmd.get("quality", 0.8))
         
         "reload_script":
             result = _reload_script(cmd.get("path", ""))
@@ -103,32 +244,334 @@ func _get_scene_tree() -> Dictionary:
     
     return {
         "success": true,
-        "tree": _serialize_node(scene)
+        "tree": await _serialize_tree(scene)
     }
 
+func _query_scene_tree(cmd: Dictionary) -> Dictionary:
+    """Flat, filtered, paged listing of part of the edited scene.
+    
+    Params (all optional):
+        root: NodePath relative to the scene root ("" = scene root)
+        max_depth: Levels below root to visit (-1 = unlimited)
+        types: Class names; a node matches if it is_class() any of them
+            or its script's class_name is listed
+        properties: Property names to include (default WATCHED_PROPERTIES)
+        limit: Max records per page
+        cursor: Value of next_cursor from the previous page
+    
+    Rows are [path, type, property values...] in the order given by
+    "fields"; paths are relative to the scene root. The cursor counts
+    visited nodes in depth-first order, so pages shift if the tree changes
+    between calls.
+    """
+    var scene := get_editor_interface().get_edited_scene_root()
+    if not scene:
+        return {"success": false, "error": "No scene open"}
+    
+    var root_path: String = cmd.get("root", "")
+    var root: Node = scene if root_path.is_empty() or root_path == "." else scene.get_node_or_null(root_path)
+    if not root:
+        return {"success": false, "error": "Node not found: " + root_path}
+    
+    var max_depth := int(cmd.get("max_depth", -1))
+    var types: Array = cmd.get("types", [])
+    var properties: Array = cmd.get("properties", WATCHED_PROPERTIES)
+    var limit := clampi(int(cmd.get("limit", QUERY_DEFAULT_LIMIT)), 1, QUERY_MAX_LIMIT)
+    var cursor := int(cmd.get("cursor", 0))
+    
+    var rows := []
+    var visited := 0
+    # Stack of [node, depth]; children pushed in reverse to keep tree order
+    var stack := [[root, 0]]
+    while not stack.is_empty():
+        var entry = stack.pop_back()
+        var node: Node = entry[0]
+        var depth: int = entry[1]
+        
+        if visited >= cursor:
+            if rows.size() >= limit:
+                return _query_page(properties, rows, visited)
+            if _matches_types(node, types):
+                var row := [str(scene.get_path_to(node)), node.get_class()]
+                for prop in properties:
+                    row.append(node.get(prop) if prop in node else null)
+                rows.append(row)
+        visited += 1
+        
+        if max_depth < 0 or depth < max_depth:
+            var children := node.get_children()
+            for i in range(children.size() - 1, -1, -1):
+                stack.append([children[i], depth + 1])
+    
+    return _query_page(properties, rows, -1)
+
+func _query_page(properties: Array, rows: Array, next_cursor: int) -> Dictionary:
+    var fields := ["path", "type"]
+    fields.append_array(properties)
+    return {
+        "success": true,
+        "fields": fields,
+        "rows": rows,
+        "next_cursor": next_cursor if next_cursor >= 0 else null
+    }
+
+func _matches_types(node: Node, types: Array) -> bool:
+    if types.is_empty():
+        return true
+    var script = node.get_script()
+    var script_class: String = script.get_global_name() if script else ""
+    for type_name in types:
+        if node.is_class(type_name) or type_name == script_class:
+            return true
+    return false
+
+func _serialize_tree(root: Node, yield_frames := true) -> Dictionary:
+    """Serialize node and children without blocking the editor.
+    
+    Walks the tree iteratively and, when yield_frames is set, yields a frame
+    whenever SLICE_BUDGET_USEC is spent so large scenes are spread over
+    several frames.
+    """
+    var root_data := _serialize_node(root)
+    var stack := [[root, root_data]]
+    var slice_start := Time.get_ticks_usec()
+    
+    while not stack.is_empty():
+        var entry = stack.pop_back()
+        var node: Node = entry[0]
+        if not is_instance_valid(node):
+            continue  # Freed while we were yielding
+        
+        var children := []
+        for child in node.get_children():
+            var child_data := _serialize_node(child)
+            children.append(child_data)
+            stack.append([child, child_data])
+        if not children.is_empty():
+            entry[1]["children"] = children
+        
+        if yield_frames and Time.get_ticks_usec() - slice_start > SLICE_BUDGET_USEC:
+            await get_tree().process_frame
+            slice_start = Time.get_ticks_usec()
+    
+    return root_data
+
 func _serialize_node(node: Node) -> Dictionary:
-    """Recursively serialize node and children."""
-    var data := {
+    """Serialize a single node (children are added by _serialize_tree)."""
+    return {
+        "id": node.get_instance_id(),
         "name": node.name,
         "type": node.get_class(),
         "path": node.get_path().get_concatenated_names(),
-        "properties": {}
+        "properties": _read_properties(node)
     }
-    
-    # Export common properties
-    for prop in ["position", "rotation", "scale", "visible"]:
+
+func _read_properties(node: Node) -> Dictionary:
+    """Current values of WATCHED_PROPERTIES that the node has."""
+    var props := {}
+    for prop in WATCHED_PROPERTIES:
         if prop in node:
-            data["properties"][prop] = node.get(prop)
+            props[prop] = node.get(prop)
+    return props
+
+
+# -----------------------------------------------------------------------------
+# Scene tree subscriptions: one snapshot, then add/remove/rename/set deltas
+# -----------------------------------------------------------------------------
+func _subscribe_tree(client: ClientConnection) -> Dictionary:
+    """Register client for deltas and return a versioned snapshot."""
+    if client == null:
+        return {"success": false, "error": "No client"}
+    var scene := get_editor_interface().get_edited_scene_root()
     
-    # Recurse children
-    var children := []
-    for child in node.get_children():
-        children.append(_serialize_node(child))
+    # Deltas queued so far predate the snapshot
+    _flush_tree_changes()
+    if _tree_subscribers.is_empty():
+        _track_scene(scene)
+    if not client in _tree_subscribers:
+        _tree_subscribers.append(client)
     
-    if not children.is_empty():
-        data["children"] = children
+    # Serialized in one go so no change can slip in between snapshot and deltas
+    var tree = null
+    if scene:
+        tree = await _serialize_tree(scene, false)
+    return {"success": true, "version": _tree_version, "tree": tree}
+
+func _unsubscribe_tree(client: ClientConnection):
+    _tree_subscribers.erase(client)
+    if _tree_subscribers.is_empty():
+        _tracked.clear()
+        _scan_ids.clear()
+        _tree_changes.clear()
+
+func _track_scene(scene: Node):
+    """Record watched property values for every node in the scene."""
+    _tracked.clear()
+    _scan_ids.clear()
+    _scan_index = 0
+    if not scene:
+        return
+    var stack: Array[Node] = [scene]
+    while not stack.is_empty():
+        var node: Node = stack.pop_back()
+        _track_node(node)
+        stack.append_array(node.get_children())
+
+func _track_node(node: Node):
+    var id := node.get_instance_id()
+    _tracked[id] = _read_properties(node)
+    _scan_ids.append(id)
+
+func _in_edited_scene(node: Node) -> bool:
+    var scene := get_editor_interface().get_edited_scene_root()
+    return scene != null and (node == scene or scene.is_ancestor_of(node))
+
+func _on_node_added(node: Node):
+    if _tree_subscribers.is_empty() or not _in_edited_scene(node):
+        return
+    _track_node(node)
+    var data := _serialize_node(node)
+    data["op"] = "add"
+    data["index"] = node.get_index()
+    # 0 = this is the scene root
+    data["parent"] = 0
+    if node != get_editor_interface().get_edited_scene_root():
+        data["parent"] = node.get_parent().get_instance_id()
+    _tree_changes.append(data)
+
+func _on_node_removed(node: Node):
+    var id := node.get_instance_id()
+    if not _tracked.has(id):
+        return
+    _tracked.erase(id)
+    _tree_changes.append({"op": "remove", "id": id})
+
+func _on_node_renamed(node: Node):
+    var id := node.get_instance_id()
+    if not _tracked.has(id):
+        return
+    _tree_changes.append({"op": "rename", "id": id, "name": node.name})
+
+func _on_scene_changed(scene: Node):
+    """Edited scene switched: every subscriber gets a fresh snapshot."""
+    if _tree_subscribers.is_empty():
+        return
+    _tree_changes.clear()
+    _track_scene(scene)
+    _tree_version += 1
+    var tree = null
+    if scene:
+        tree = await _serialize_tree(scene, false)
+    var event := {"event": "scene_tree_snapshot", "version": _tree_version, "tree": tree}
+    for client in _tree_subscribers:
+        client.send(event)
+
+func _scan_properties():
+    """Check a slice of tracked nodes for watched property changes.
     
-    return data
+    Nodes have no generic property-changed signal, so this polls
+    PROPERTY_SCAN_PER_FRAME nodes per frame, round-robin.
+    """
+    var scanned := 0
+    while scanned < PROPERTY_SCAN_PER_FRAME and not _scan_ids.is_empty():
+        if _scan_index >= _scan_ids.size():
+            _scan_index = 0
+        var id = _scan_ids[_scan_index]
+        scanned += 1
+        var node = instance_from_id(id) if _tracked.has(id) else null
+        if node == null or not is_instance_valid(node):
+            # Untracked or freed: drop from the scan order
+            _scan_ids.remove_at(_scan_index)
+            continue
+        _scan_index += 1
+        
+        var previous: Dictionary = _tracked[id]
+        var changed := {}
+        for prop in previous:
+            var value = node.get(prop)
+            if value != previous[prop]:
+                changed[prop] = value
+                previous[prop] = value
+        if not changed.is_empty():
+            _tree_changes.append({"op": "set", "id": id, "properties": changed})
+
+func _flush_tree_changes():
+    """Send this frame's deltas to every subscriber as one versioned batch."""
+    if _tree_changes.is_empty():
+        return
+    _tree_version += 1
+    var event := {
+        "event": "scene_tree_delta",
+        "version": _tree_version,
+        "changes": _tree_changes
+    }
+    for client in _tree_subscribers:
+        client.send(event)
+    _tree_changes = []
+
+# -----------------------------------------------------------------------------
+# Log subscriptions: entries pushed as one filtered batch per frame
+# -----------------------------------------------------------------------------
+func _subscribe_logs(client: ClientConnection, cmd: Dictionary) -> Dictionary:
+    """Register a filtered log stream for client.
+    
+    Params:
+        levels: Levels to send (empty = all)
+        pattern: RegEx searched in each message (empty = all)
+        cursor: First seq to send (-1 = only entries logged from now on)
+    """
+    if client == null:
+        return {"success": false, "error": "No client"}
+    var subscription := LogSubscription.new(_next_log_subscription, client)
+    for level in cmd.get("levels", []):
+        subscription.levels[str(level)] = true
+    var pattern := str(cmd.get("pattern", ""))
+    if not pattern.is_empty():
+        subscription.regex = RegEx.new()
+        if subscription.regex.compile(pattern) != OK:
+            return {"success": false, "error": "Invalid pattern: " + pattern}
+    var cursor := int(cmd.get("cursor", -1))
+    subscription.cursor = cursor if cursor >= 0 else _logger.next_cursor()
+    _next_log_subscription += 1
+    _log_subscriptions.append(subscription)
+    return {
+        "success": true,
+        "subscription": subscription.id,
+        "cursor": subscription.cursor,
+        "capturing": _logger.is_capturing()
+    }
+
+func _unsubscribe_logs(client: ClientConnection, id := 0):
+    """Drop one of client's subscriptions, or all of them when id is 0."""
+    for subscription in _log_subscriptions.duplicate():
+        if subscription.client == client and (id == 0 or subscription.id == id):
+            _log_subscriptions.erase(subscription)
+
+func _flush_log_subscriptions():
+    """Send each subscription the entries logged since its cursor.
+    
+    At most LOG_PUSH_PER_FRAME entries are read per subscription per frame;
+    a backlog drains over the following frames.
+    """
+    var latest := _logger.next_cursor()
+    for subscription in _log_subscriptions:
+        if subscription.cursor >= latest:
+            continue
+        var page := _logger.get_logs(0, subscription.cursor, LOG_PUSH_PER_FRAME)
+        subscription.cursor = page["next_cursor"]
+        var entries := []
+        for entry in page["logs"]:
+            if subscription.accepts(entry):
+                entries.append(entry)
+        if entries.is_empty() and page["dropped"] == 0:
+            continue
+        subscription.client.send({
+            "event": "log_entries",
+            "subscription": subscription.id,
+            "entries": entries,
+            "next_cursor": subscription.cursor,
+            "dropped": page["dropped"]
+        })
 
 func _reload_script(path: String) -> Dictionary:
     """Force reload a script resource."""
@@ -144,30 +587,184 @@ func _reload_script(path: String) -> Dictionary:
 
 
 # =============================================================================
-# Debug Logger - Captures print(), push_error(), push_warning()
+# ClientConnection - Per-client socket, frame reader and command queue
+# =============================================================================
+class ClientConnection:
+    extends RefCounted
+    
+    var id: int
+    var peer: StreamPeerTCP
+    var reader: Protocol.FrameReader
+    var queue: Array[Dictionary] = []
+    
+    func _init(p_peer: StreamPeerTCP, p_id: int):
+        peer = p_peer
+        id = p_id
+        reader = Protocol.FrameReader.new()
+    
+    func send(message: Dictionary):
+        if peer.get_status() == StreamPeerTCP.STATUS_CONNECTED:
+            peer.put_data(Protocol.encode(message))
+    
+    func send_binary(header: Dictionary, payload: PackedByteArray):
+        """JSON header frame followed by a raw payload frame, in one write."""
+        if peer.get_status() == StreamPeerTCP.STATUS_CONNECTED:
+            var frames := Protocol.encode(header)
+            frames.append_array(Protocol.encode_bytes(payload))
+            peer.put_data(frames)
+
+
+# =============================================================================
+# LogSubscription - One client's filtered log stream
+# =============================================================================
+class LogSubscription:
+    extends RefCounted
+    
+    var id: int
+    var client: ClientConnection
+    var cursor := 0  # Next seq to send
+    var levels := {}  # Empty = every level
+    var regex: RegEx = null
+    
+    func _init(p_id: int, p_client: ClientConnection):
+        id = p_id
+        client = p_client
+    
+    func accepts(entry: Dictionary) -> bool:
+        if not levels.is_empty() and not levels.has(entry["level"]):
+            return false
+        return regex == null or regex.search(entry["message"]) != null
+
+
+# =============================================================================
+# Debug Logger - Captures print(), push_error(), push_warning() into a ring buffer
 # =============================================================================
 class DebugLogger:
     extends Node
     
-    var _logs: Array[Dictionary] = []
+    # Installed through OS.add_logger() on Godot 4.5+. Built from source at
+    # runtime so this file still parses on engines without the Logger class.
+    const ENGINE_LOGGER_SOURCE := """extends Logger
+
+var sink: Object
+
+func _log_message(message: String, error: bool) -> void:
+    sink.record("error" if error else "info", message.strip_edges(false, true))
+
+func _log_error(function: String, file: String, line: int, code: String, rationale: String, editor_notify: bool, error_type: int, script_backtraces: Array[ScriptBacktrace]) -> void:
+    var level: String = ["error", "warning", "script_error", "shader_error"][clampi(error_type, 0, 3)]
+    var stack := []
+    for backtrace in script_backtraces:
+        for i in backtrace.get_frame_count():
+            stack.append({
+                "file": backtrace.get_frame_file(i),
+                "line": backtrace.get_frame_line(i),
+                "function": backtrace.get_frame_function(i)
+            })
+    sink.record(level, rationale if not rationale.is_empty() else code, file, line, function, stack)
+"""
+    
+    # Ring buffer: the entry with sequence number s lives at s % MAX_LOG_ENTRIES.
+    # Sequence numbers only grow, so [_first_seq, _next_seq) is always sorted
+    # by seq and by time.
+    var _entries := []
+    var _first_seq := 0  # Oldest entry still held
+    var _next_seq := 0
+    var _mutex := Mutex.new()  # Engine loggers are called from any thread
+    var _engine_logger: Object = null
     var _start_time := Time.get_ticks_msec()
     
     func _init():
-        # Connect to engine's error/warning signals if available
-        # Note: Godot 4.x doesn't expose these directly, we intercept via print_line
-        pass
+        _entries.resize(MAX_LOG_ENTRIES)
+    
+    func _enter_tree():
+        if ClassDB.class_exists("Logger") and OS.has_method("add_logger"):
+            var script := GDScript.new()
+            script.source_code = ENGINE_LOGGER_SOURCE
+            if script.reload() == OK:
+                _engine_logger = script.new()
+                _engine_logger.sink = self
+                OS.call("add_logger", _engine_logger)
+        if _engine_logger == null:
+            push_warning("OpenClaw Bridge: Engine Logger API unavailable (needs Godot 4.5+), only bridge messages are logged")
+    
+    func _exit_tree():
+        if _engine_logger != null:
+            OS.call("remove_logger", _engine_logger)
+            _engine_logger = null
+    
+    func is_capturing() -> bool:
+        return _engine_logger != null
+    
+    func next_cursor() -> int:
+        """Seq the next entry will get."""
+        _mutex.lock()
+        var seq := _next_seq
+        _mutex.unlock()
+        return seq
     
-    func get_logs(since_ms: int) -> Dictionary:
-        """Get logs since timestamp."""
+    func record(level: String, message: String, file := "", line := 0, function := "", stack := []):
+        """Append an entry. Thread-safe; must not print (it would recurse)."""
+        _mutex.lock()
+        var entry := {
+            "seq": _next_seq,
+            "time": Time.get_ticks_msec() - _start_time,
+            "level": level,
+            "message": message
+        }
+        if not file.is_empty():
+            entry["file"] = file
+            entry["line"] = line
+            entry["function"] = function
+        if not stack.is_empty():
+            entry["stack"] = stack
+        _entries[_next_seq % MAX_LOG_ENTRIES] = entry
+        _next_seq += 1
+        if _next_seq - _first_seq > MAX_LOG_ENTRIES:
+            _first_seq = _next_seq - MAX_LOG_ENTRIES
+        _mutex.unlock()
+    
+    func _seq_at_time(since_ms: int) -> int:
+        """First held seq with time >= since_ms (binary search; caller holds the lock)."""
+        var lo := _first_seq
+        var hi := _next_seq
+        while lo < hi:
+            var mid := (lo + hi) >> 1
+            if _entries[mid % MAX_LOG_ENTRIES]["time"] < since_ms:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    
+    func get_logs(since_ms: int, cursor := -1, limit := LOG_DEFAULT_LIMIT) -> Dictionary:
+        """Get logs since a time (ms since the plugin loaded) or from a cursor.
+        
+        A cursor is the "next_cursor" of the previous call and takes
+        precedence over since_ms. "dropped" counts entries that were
+        overwritten before they could be read.
+        """
+        _mutex.lock()
+        var start: int
+        if cursor >= 0:
+            start = clampi(cursor, _first_seq, _next_seq)
+        else:
+            start = _seq_at_time(since_ms)
+        var dropped := maxi(_first_seq - cursor, 0) if cursor >= 0 else 0
+        var end := mini(_next_seq, start + clampi(limit, 1, MAX_LOG_ENTRIES))
         var result := []
-        for log in _logs:
-            if log["time"] >= since_ms:
-                result.append(log)
+        for seq in range(start, end):
+            result.append(_entries[seq % MAX_LOG_ENTRIES])
+        var has_more := end < _next_seq
+        _mutex.unlock()
         
         return {
             "success": true,
             "logs": result,
-            "count": result.size()
+            "count": result.size(),
+            "next_cursor": end,
+            "has_more": has_more,
+            "dropped": dropped,
+            "capturing": is_capturing()
         }
 
 
@@ -177,8 +774,16 @@ class DebugLogger:
 class Screenshotter:
     extends Node
     
-    func capture() -> Dictionary:
-        """Capture editor viewport and encode as base64 PNG."""
+    func capture(format := "png", binary := false, quality := 0.8) -> Dictionary:
+        """Capture editor viewport.
+        
+        By default returns a base64 PNG inside the JSON. With binary set,
+        the pixels are returned under "_binary" for the dispatcher to send
+        as a raw frame, in one of:
+            rgba: Raw RGBA8 rows, no encoding cost
+            png: PNG
+            webp: WebP (lossy when quality < 1.0)
+        """
         var viewport := EditorInterface.get_editor_viewport_3d() if Engine.is_editor_hint() else get_viewport()
         
         if not viewport:
@@ -191,6 +796,27 @@ class Screenshotter:
         if not img:
             return {"success": false, "error": "Could not get image"}
         
+        if binary:
+            var data: PackedByteArray
+            match format:
+                "rgba":
+                    if img.get_format() != Image.FORMAT_RGBA8:
+                        img.convert(Image.FORMAT_RGBA8)
+                    data = img.get_data()
+                "png":
+                    data = img.save_png_to_buffer()
+                "webp":
+                    data = img.save_webp_to_buffer(quality < 1.0, quality)
+                _:
+                    return {"success": false, "error": "Unsupported format: " + str(format)}
+            return {
+                "success": true,
+                "format": format,
+                "width": img.get_width(),
+                "height": img.get_height(),
+                "_binary": data
+            }
+        
         # Save to buffer
         var buffer := img.save_png_to_buffer()
         var base64 := Marshalls.raw_to_base64(buffer)
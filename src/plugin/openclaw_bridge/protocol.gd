@@ -0,0 +1,60 @@
+"""
+OpenClaw Bridge wire protocol
+
+Every message is a frame: a 4-byte big-endian payload length followed by
+the payload. Payloads are UTF-8 JSON objects.
+
+A response with "binary": true is immediately followed by one more frame
+whose payload is raw bytes ("size" long), e.g. screenshot pixels.
+
+Requests carry an "id" that is echoed back in the response, so clients can
+pipeline requests and match responses that arrive out of order. Messages
+without an "id" are server-pushed events.
+"""
+extends RefCounted
+
+const HEADER_SIZE := 4
+const MAX_FRAME_SIZE := 64 * 1024 * 1024
+
+static func encode(message: Dictionary) -> PackedByteArray:
+    """Frame a JSON message."""
+    return encode_bytes(JSON.stringify(message).to_utf8_buffer())
+
+static func encode_bytes(payload: PackedByteArray) -> PackedByteArray:
+    """Frame a raw payload."""
+    var size := payload.size()
+    var frame := PackedByteArray([
+        (size >> 24) & 0xFF, (size >> 16) & 0xFF, (size >> 8) & 0xFF, size & 0xFF
+    ])
+    frame.append_array(payload)
+    return frame
+
+
+# =============================================================================
+# FrameReader - Reassembles frames from partial / coalesced TCP reads
+# =============================================================================
+class FrameReader:
+    extends RefCounted
+
+    var _buffer := PackedByteArray()
+    var error := ""
+
+    func feed(data: PackedByteArray):
+        _buffer.append_array(data)
+
+    func next_frame():
+        """Pop the next complete payload, or null if none is buffered yet."""
+        if _buffer.size() < HEADER_SIZE:
+            return null
+
+        var size := (_buffer[0] << 24) | (_buffer[1] << 16) | (_buffer[2] << 8) | _buffer[3]
+        if size > MAX_FRAME_SIZE:
+            error = "Frame too large: %d bytes" % size
+            _buffer.clear()
+            return null
+        if _buffer.size() < HEADER_SIZE + size:
+            return null
+
+        var payload := _buffer.slice(HEADER_SIZE, HEADER_SIZE + size)
+        _buffer = _buffer.slice(HEADER_SIZE + size)
+        return payload
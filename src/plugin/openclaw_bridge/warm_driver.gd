@@ -0,0 +1,315 @@
+"""
+OpenClaw Warm Driver - Persistent scene runner
+
+Run as the main loop of a headless Godot process:
+
+    godot --headless --path <project> --script warm_driver.gd -- --openclaw-port=9743
+
+Keeps the engine (and the imported project) alive and runs scenes on
+request over a local TCP socket, so repeated test runs skip engine boot.
+
+Input events can be injected into the running scene: each event carries a
+frame offset and is fed through Input.parse_input_event at the start of
+that frame, so scripted input is deterministic and needs no display.
+
+Speaks the same framed request/response protocol as the editor bridge
+(see protocol.gd).
+"""
+extends SceneTree
+
+const Protocol = preload("protocol.gd")
+const READY_MARKER := "OPENCLAW_WARM: READY"
+const END_MARKER := "OPENCLAW_WARM: END"
+
+var _server: TCPServer
+var _connection: StreamPeerTCP
+var _reader: Protocol.FrameReader
+var _run := {}  # Active run: id, scene, frames_left, frames, started_ms
+var _default_clear_color: Color
+var _input_queue := []  # [{"frame": int, "order": int, "event": InputEvent}], sorted
+var _input_order := 0  # Insertion counter; keeps same-frame events in the order sent
+var _input_waiters := []  # [{"id", "frame", "count"}]: replies sent once "frame" is reached
+
+func _initialize():
+    var port := 0
+    for arg in OS.get_cmdline_user_args():
+        if arg.begins_with("--openclaw-port="):
+            port = int(arg.get_slice("=", 1))
+
+    _default_clear_color = ProjectSettings.get_setting(
+        "rendering/environment/defaults/default_clear_color", Color(0.3, 0.3, 0.3))
+
+    _server = TCPServer.new()
+    var err = _server.listen(port, "127.0.0.1")
+    if err != OK:
+        push_error("OpenClaw Warm: Failed to listen on port %d (error %d)" % [port, err])
+        quit(1)
+        return
+
+    # The Python side parses the port from this line
+    print("%s port=%d" % [READY_MARKER, _server.get_local_port()])
+
+func _finalize():
+    if _server:
+        _server.stop()
+
+func _process(_delta: float) -> bool:
+    # Single client: a new connection replaces the old one
+    if _server and _server.is_connection_available():
+        if _connection:
+            _connection.disconnect_from_host()
+        _connection = _server.take_connection()
+        _reader = Protocol.FrameReader.new()
+
+    if _connection:
+        _connection.poll()
+        if _connection.get_status() == StreamPeerTCP.STATUS_CONNECTED:
+            _read_commands()
+
+    _dispatch_input()
+
+    if not _run.is_empty():
+        _run["frames"] += 1
+        if _run["frames_left"] > 0:
+            _run["frames_left"] -= 1
+            if _run["frames_left"] == 0:
+                _finish_run()
+
+    return false
+
+func _read_commands():
+    """Reassemble request frames and execute them."""
+    var available := _connection.get_available_bytes()
+    if available > 0:
+        var chunk = _connection.get_data(available)
+        if chunk[0] == OK:
+            _reader.feed(chunk[1])
+
+    var payload = _reader.next_frame()
+    while payload != null:
+        var response = _process_command(payload.get_string_from_utf8())
+        if response != null:
+            _send(response)
+        payload = _reader.next_frame()
+
+    if not _reader.error.is_empty():
+        push_error("OpenClaw Warm: " + _reader.error)
+        _connection.disconnect_from_host()
+        _connection = null
+
+func _send(response: Dictionary):
+    if _connection and _connection.get_status() == StreamPeerTCP.STATUS_CONNECTED:
+        _connection.put_data(Protocol.encode(response))
+
+func _process_command(cmd_json: String):
+    """Parse and execute command. Returns null when the reply is deferred."""
+    var cmd = JSON.parse_string(cmd_json)
+    if cmd == null or not cmd is Dictionary:
+        return {"success": false, "error": "Invalid JSON"}
+    if not cmd.has("action"):
+        return {"success": false, "error": "Missing action"}
+
+    var response: Dictionary
+    match cmd["action"]:
+        "ping":
+            response = {"success": true, "pong": true}
+
+        "run_scene":
+            response = _start_run(cmd)
+            if response.is_empty():
+                return null  # Replied from _finish_run()
+
+        "inject_input":
+            response = _queue_input(
+                cmd.get("events", []), Engine.get_process_frames(), int(cmd.get("frames", 0)))
+            if response["success"] and cmd.get("wait", true):
+                _input_waiters.append({
+                    "id": cmd.get("id"), "frame": response["last_frame"], "count": response["queued"]
+                })
+                return null  # Replied from _dispatch_input()
+
+        "stop_scene":
+            if not _run.is_empty():
+                _finish_run()
+            response = {"success": true}
+
+        "reset":
+            _reset()
+            response = {"success": true}
+
+        "quit":
+            _send({"id": cmd.get("id"), "success": true})
+            quit()
+            return null
+
+        _:
+            response = {"success": false, "error": "Unknown action: " + str(cmd["action"])}
+
+    response["id"] = cmd.get("id")
+    return response
+
+func _start_run(cmd: Dictionary) -> Dictionary:
+    """Switch to the requested scene. Empty return = reply comes later."""
+    if not _run.is_empty():
+        return {"success": false, "error": "A scene is already running"}
+
+    var scene: String = cmd.get("scene", "")
+    if scene.is_empty():
+        scene = ProjectSettings.get_setting("application/run/main_scene", "")
+    if not scene.begins_with("res://"):
+        scene = "res://" + scene
+
+    _reset()
+    var err = change_scene_to_file(scene)
+    if err != OK:
+        return {"success": false, "error": "Could not load scene %s (error %d)" % [scene, err]}
+
+    # The new scene enters the tree on the next frame; input offsets count from there
+    var queued := _queue_input(cmd.get("input", []), Engine.get_process_frames() + 1)
+    if not queued["success"]:
+        return queued
+
+    _run = {
+        "id": cmd.get("id"),
+        "scene": scene,
+        "frames_left": int(cmd.get("frames", 0)),  # 0 = until stop_scene
+        "frames": 0,
+        "started_ms": Time.get_ticks_msec(),
+    }
+    return {}
+
+func _finish_run():
+    """Tear the scene down and report back."""
+    var run := _run
+    _run = {}
+    _reset()
+
+    # Lets the Python side know all output of this run has been written
+    # (JSON numbers arrive as floats; print the id as an integer)
+    print("%s id=%d" % [END_MARKER, int(run["id"])])
+    _send({
+        "id": run["id"],
+        "success": true,
+        "scene": run["scene"],
+        "frames": run["frames"],
+        "elapsed_ms": Time.get_ticks_msec() - run["started_ms"],
+    })
+
+func _reset():
+    """Return the tree to a clean state between runs."""
+    _input_queue.clear()
+    for waiter in _input_waiters:
+        _send({"id": waiter["id"], "success": false, "error": "Input cancelled by reset"})
+    _input_waiters.clear()
+    if current_scene:
+        unload_current_scene()
+    paused = false
+    Engine.time_scale = 1.0
+    RenderingServer.set_default_clear_color(_default_clear_color)
+
+
+# =============================================================================
+# Input injection
+# =============================================================================
+
+func _queue_input(events: Array, base_frame: int, span := 0) -> Dictionary:
+    """Parse event descriptions and schedule them at base_frame + "frame".
+
+    "last_frame" covers at least base_frame + span, so a batch that ends
+    with a wait is only reported done once that wait has elapsed.
+    """
+    var parsed := []
+    var last_frame := base_frame + span
+    for data in events:
+        if not data is Dictionary:
+            return {"success": false, "error": "Input event must be an object"}
+        var event := _make_event(data)
+        if event == null:
+            return {"success": false, "error": "Bad input event: " + JSON.stringify(data)}
+        var frame := base_frame + int(data.get("frame", 0))
+        last_frame = maxi(last_frame, frame)
+        parsed.append({"frame": frame, "order": _input_order, "event": event})
+        _input_order += 1
+
+    _input_queue.append_array(parsed)
+    # sort_custom is not stable: break frame ties by insertion order so a
+    # release never overtakes its press
+    _input_queue.sort_custom(func(a, b):
+        return a["frame"] < b["frame"] or (a["frame"] == b["frame"] and a["order"] < b["order"]))
+    return {"success": true, "queued": parsed.size(), "last_frame": last_frame}
+
+func _dispatch_input():
+    """Feed every event due this frame, then answer waiting requests."""
+    var now := Engine.get_process_frames()
+    var due := 0
+    while due < _input_queue.size() and _input_queue[due]["frame"] <= now:
+        Input.parse_input_event(_input_queue[due]["event"])
+        due += 1
+    if due > 0:
+        _input_queue = _input_queue.slice(due)
+        # Deliver now rather than with the next accumulated batch
+        Input.flush_buffered_events()
+
+    var waiting := []
+    for waiter in _input_waiters:
+        if waiter["frame"] <= now:
+            _send({"id": waiter["id"], "success": true, "dispatched": waiter["count"], "frame": now})
+        else:
+            waiting.append(waiter)
+    _input_waiters = waiting
+
+func _make_event(data: Dictionary) -> InputEvent:
+    """Build an InputEvent from its JSON description (see events.py)."""
+    match data.get("type", ""):
+        "mouse_button":
+            var event := InputEventMouseButton.new()
+            event.position = _vector(data.get("position", [0, 0]))
+            event.global_position = event.position
+            event.button_index = int(data.get("button", MOUSE_BUTTON_LEFT))
+            event.pressed = bool(data.get("pressed", true))
+            event.double_click = bool(data.get("double_click", false))
+            event.factor = float(data.get("factor", 1.0))
+            event.button_mask = int(data.get("button_mask", 0))
+            _apply_modifiers(event, data)
+            return event
+
+        "mouse_motion":
+            var event := InputEventMouseMotion.new()
+            event.position = _vector(data.get("position", [0, 0]))
+            event.global_position = event.position
+            event.relative = _vector(data.get("relative", [0, 0]))
+            event.button_mask = int(data.get("button_mask", 0))
+            _apply_modifiers(event, data)
+            return event
+
+        "key":
+            var keycode := OS.find_keycode_from_string(str(data.get("key", "")))
+            if keycode == KEY_NONE:
+                return null
+            var event := InputEventKey.new()
+            event.keycode = keycode
+            event.physical_keycode = keycode
+            event.unicode = int(data.get("unicode", 0))
+            event.pressed = bool(data.get("pressed", true))
+            event.echo = bool(data.get("echo", false))
+            _apply_modifiers(event, data)
+            return event
+
+        "action":
+            var event := InputEventAction.new()
+            event.action = str(data.get("action", ""))
+            event.pressed = bool(data.get("pressed", true))
+            event.strength = float(data.get("strength", 1.0))
+            return event
+
+    return null
+
+func _apply_modifiers(event: InputEventWithModifiers, data: Dictionary):
+    var modifiers: Array = data.get("modifiers", [])
+    event.ctrl_pressed = "ctrl" in modifiers
+    event.shift_pressed = "shift" in modifiers
+    event.alt_pressed = "alt" in modifiers
+    event.meta_pressed = "meta" in modifiers
+
+func _vector(value) -> Vector2:
+    return Vector2(float(value[0]), float(value[1]))
@@ -0,0 +1,65 @@
+"""BridgeClient against an in-process fake bridge server."""
+
+import asyncio
+import json
+import socket
+import threading
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from godot_bridge.bridge import BridgeClient, encode_frame, read_frame
+
+
+def _send(sock: socket.socket, message: Dict[str, Any]) -> None:
+    sock.sendall(encode_frame(json.dumps(message).encode("utf-8")))
+
+
+def _serve_one_entry_then_close(listener: socket.socket) -> None:
+    """Acknowledge a log subscription, push one entry and hang up."""
+    conn, _ = listener.accept()
+    with conn:
+        request = json.loads(bytes(read_frame(conn) or b"{}"))
+        _send(conn, {"id": request["id"], "success": True, "subscription": 1, "cursor": 0})
+        entry = {"seq": 0, "level": "error", "message": "boom"}
+        _send(
+            conn,
+            {"event": "log_entries", "subscription": 1, "next_cursor": 1, "entries": [entry]},
+        )
+
+
+@pytest.fixture
+def client() -> Iterator[BridgeClient]:
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    server = threading.Thread(target=_serve_one_entry_then_close, args=(listener,), daemon=True)
+    server.start()
+    client = BridgeClient(port=listener.getsockname()[1], timeout=5).connect()
+    yield client
+    client.close()
+    server.join(timeout=5)
+    listener.close()
+
+
+def test_iteration_ends_when_server_closes(client: BridgeClient) -> None:
+    subscription = client.subscribe_logs()
+    received: List[Dict[str, Any]] = []
+    reader = threading.Thread(target=lambda: received.extend(subscription), daemon=True)
+    reader.start()
+    reader.join(timeout=5)
+
+    assert not reader.is_alive(), "iteration did not stop after the server closed"
+    assert [entry["message"] for entry in received] == ["boom"]
+    assert not client.connected
+
+
+def test_async_iteration_ends_when_server_closes(client: BridgeClient) -> None:
+    subscription = client.subscribe_logs()
+
+    async def collect() -> List[Dict[str, Any]]:
+        return [entry async for entry in subscription]
+
+    received = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+    assert [entry["message"] for entry in received] == ["boom"]
+    assert not client.connected